@@ -1,48 +1,33 @@
 import threading
 import time
 import random
+from rwlock import RWLock
 
 # Recurso compartilhado (ex: banco de dados)
 dados = 0
 
-# Controle de concorrência
-mutex = threading.Semaphore(1)   # protege o contador de leitores
-wrt = threading.Semaphore(1)     # garante exclusividade de escrita
-leitores = 0                     # contador de leitores ativos
+# Controle de concorrência (primeiro leitor bloqueia / último leitor libera escritores)
+lock = RWLock()
 
 def leitor(id):
-    global leitores
     while True:
         time.sleep(random.uniform(1, 3))
 
-        mutex.acquire()
-        leitores += 1
-        if leitores == 1:
-            wrt.acquire()  # primeiro leitor bloqueia escritores
-        mutex.release()
-
-        # leitura
-        print(f"📘 Leitor {id} está lendo o valor: {dados}")
-        time.sleep(random.uniform(1, 2))
-
-        mutex.acquire()
-        leitores -= 1
-        if leitores == 0:
-            wrt.release()  # último leitor libera escritores
-        mutex.release()
+        with lock.read():
+            # leitura
+            print(f"📘 Leitor {id} está lendo o valor: {dados}")
+            time.sleep(random.uniform(1, 2))
 
 def escritor(id):
     global dados
     while True:
         time.sleep(random.uniform(2, 5))
-        wrt.acquire()
-
-        # escrita
-        dados += 1
-        print(f"✍️ Escritor {id} escreveu o valor: {dados}")
-        time.sleep(random.uniform(1, 2))
 
-        wrt.release()
+        with lock.write():
+            # escrita
+            dados += 1
+            print(f"✍️ Escritor {id} escreveu o valor: {dados}")
+            time.sleep(random.uniform(1, 2))
 
 # Criando threads
 threads = []
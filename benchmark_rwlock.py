@@ -0,0 +1,133 @@
+"""
+Benchmark de leitura das travas leitores-escritores
+Compara a vazão de seções de leitura vazias com 1, 4, 16 e 64 threads
+leitoras, sem escritores, para expor o custo do contador compartilhado,
+e a latência de aquisição da trava de arquivo (fcntl) contra a de semáforos
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from rwlock import criar_rwlock, POLITICAS
+
+THREADS_PADRAO = [1, 4, 16, 64]
+POLITICAS_PADRAO = ['leitores', 'slots', 'adaptativa']
+
+
+def medir_leituras(politica, num_threads, operacoes):
+    """Executa `operacoes` leituras divididas entre as threads; retorna leituras/s"""
+    lock = criar_rwlock(politica)
+    por_thread = max(1, operacoes // num_threads)
+    barreira = threading.Barrier(num_threads + 1)
+
+    def leitor():
+        barreira.wait()
+        for _ in range(por_thread):
+            with lock.read():
+                pass
+
+    threads = [threading.Thread(target=leitor) for _ in range(num_threads)]
+    for t in threads:
+        t.start()
+    barreira.wait()
+    inicio = time.perf_counter()
+    for t in threads:
+        t.join()
+    duracao = time.perf_counter() - inicio
+
+    return por_thread * num_threads / duracao
+
+
+def executar_benchmark(politicas=POLITICAS_PADRAO, threads=THREADS_PADRAO, operacoes=200000):
+    """Mede todas as combinações; retorna {politica: {num_threads: leituras/s}}"""
+    resultados = {}
+    for politica in politicas:
+        resultados[politica] = {}
+        for num_threads in threads:
+            resultados[politica][num_threads] = medir_leituras(politica, num_threads, operacoes)
+    return resultados
+
+
+def imprimir_resultados(resultados, threads=THREADS_PADRAO):
+    """Tabela de leituras/s por política e número de threads"""
+    referencia = next(iter(resultados))
+    print(f"{'Política':<12}" + "".join(f"{n:>12} thr" for n in threads))
+    for politica, por_threads in resultados.items():
+        linha = f"{politica:<12}"
+        for n in threads:
+            linha += f"{por_threads[n]:>16,.0f}"
+        print(linha)
+    for politica, por_threads in resultados.items():
+        if politica == referencia:
+            continue
+        relativos = "  ".join(f"{n} thr: {por_threads[n] / resultados[referencia][n]:.2f}x"
+                              for n in threads)
+        print(f"{politica} vs {referencia}: {relativos}")
+
+
+def medir_latencia(lock, operacoes):
+    """Latência média (µs) de acquire+release sem disputa; retorna {'leitura', 'escrita'}"""
+    latencias = {}
+    for modo, secao in (('leitura', lock.read), ('escrita', lock.write)):
+        inicio = time.perf_counter()
+        for _ in range(operacoes):
+            with secao():
+                pass
+        latencias[modo] = (time.perf_counter() - inicio) / operacoes * 1e6
+    return latencias
+
+
+def executar_latencias(operacoes=20000):
+    """Compara a RWLock de semáforos com a RWLockArquivo; retorna {trava: latências}"""
+    from rwlock_arquivo import RWLockArquivo  # fcntl só existe em sistemas POSIX
+
+    resultados = {'semaforos': medir_latencia(criar_rwlock('leitores'), operacoes)}
+    with tempfile.TemporaryDirectory() as diretorio:
+        lock = RWLockArquivo(os.path.join(diretorio, 'trava'))
+        try:
+            resultados['arquivo'] = medir_latencia(lock, operacoes)
+        finally:
+            lock.fechar()
+    return resultados
+
+
+def imprimir_latencias(resultados):
+    """Tabela de latência (µs) de leitura e escrita por trava"""
+    print(f"{'Trava':<12}{'leitura (µs)':>16}{'escrita (µs)':>16}")
+    for trava, latencias in resultados.items():
+        print(f"{trava:<12}{latencias['leitura']:>16.2f}{latencias['escrita']:>16.2f}")
+    referencia = resultados['semaforos']
+    for trava, latencias in resultados.items():
+        if trava != 'semaforos':
+            print(f"{trava} vs semaforos: leitura {latencias['leitura'] / referencia['leitura']:.1f}x"
+                  f"  escrita {latencias['escrita'] / referencia['escrita']:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de leitura das travas")
+    parser.add_argument('--politicas', nargs='+', default=POLITICAS_PADRAO,
+                        choices=list(POLITICAS.keys()))
+    parser.add_argument('--threads', nargs='+', type=int, default=THREADS_PADRAO)
+    parser.add_argument('--operacoes', type=int, default=200000,
+                        help="total de leituras por medição")
+    parser.add_argument('--latencia', action='store_true',
+                        help="mede a latência da trava de arquivo (fcntl) contra a de semáforos")
+    args = parser.parse_args()
+
+    if args.latencia:
+        print("=" * 60)
+        print("LATÊNCIA DE AQUISIÇÃO - SEMÁFOROS x ARQUIVO (FCNTL)")
+        print("=" * 60)
+        imprimir_latencias(executar_latencias(args.operacoes))
+        return
+
+    print("=" * 60)
+    print("BENCHMARK DE LEITURA - LEITORES-ESCRITORES")
+    print("=" * 60)
+    resultados = executar_benchmark(args.politicas, args.threads, args.operacoes)
+    imprimir_resultados(resultados, args.threads)
+
+
+if __name__ == "__main__":
+    main()
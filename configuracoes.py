@@ -3,6 +3,25 @@ Configurações para diferentes cenários de teste
 Permite personalizar comportamento dos leitores e escritores
 """
 
+# Políticas da trava (ver rwlock.POLITICAS):
+#   'leitores'   - preferência para leitores (protocolo clássico)
+#   'escritores' - preferência para escritores
+#   'justa'      - fila FIFO por tickets, espera limitada para ambos
+#   'condicao'   - uma única Condition, sem comboio de leitores (bom para 'stress')
+#   'otimista'   - leitura otimista por carimbo, leitores não escrevem estado compartilhado
+#   'slots'      - um contador por thread leitora, escritor varre os slots
+#   'prioridade' - entrada por classe de prioridade do ator, com envelhecimento
+#   'adaptativa' - 'condicao' com caminho rápido quando não há disputa
+#
+# Classes de prioridade dos atores (ver rwlock.PRIORIDADES):
+#   'escritores_prioritarios' - quantos escritores são de classe 'alta' (ex.: push de configuração)
+#   'leitores_em_lote'        - quantos leitores são de classe 'baixa' (leituras em massa)
+#   Os demais atores são 'normal'; só a política 'prioridade' distingue as classes
+#
+# Particionamento do recurso (ver particoes.py):
+#   'num_shards'          - número de partições, cada uma com sua própria trava
+#   'distribuicao_chaves' - 'uniforme' ou 'zipf' (poucas partições concentram os acessos)
+
 # Configurações padrão
 CONFIG_PADRAO = {
     'num_leitores': 3,
@@ -15,7 +34,12 @@ CONFIG_PADRAO = {
     'tempo_leitura_max': 1.0,
     'tempo_escrita_min': 0.3,
     'tempo_escrita_max': 1.0,
-    'duracao_teste': 10
+    'duracao_teste': 10,
+    'politica': 'leitores',
+    'num_shards': 1,
+    'distribuicao_chaves': 'uniforme',
+    'escritores_prioritarios': 0,
+    'leitores_em_lote': 0
 }
 
 # Cenário com muitos leitores (teste de starvation)
@@ -30,7 +54,52 @@ CONFIG_MUITOS_LEITORES = {
     'tempo_leitura_max': 0.2,
     'tempo_escrita_min': 0.5,
     'tempo_escrita_max': 1.0,
-    'duracao_teste': 15
+    'duracao_teste': 15,
+    'politica': 'leitores',
+    'num_shards': 1,
+    'distribuicao_chaves': 'uniforme',
+    'escritores_prioritarios': 0,
+    'leitores_em_lote': 0
+}
+
+# Mesmo cenário de muitos leitores com trava justa (espera limitada)
+CONFIG_MUITOS_LEITORES_JUSTA = {
+    'num_leitores': 8,
+    'num_escritores': 1,
+    'delay_leitor_min': 0.1,
+    'delay_leitor_max': 0.3,
+    'delay_escritor_min': 0.5,
+    'delay_escritor_max': 1.0,
+    'tempo_leitura_min': 0.1,
+    'tempo_leitura_max': 0.2,
+    'tempo_escrita_min': 0.5,
+    'tempo_escrita_max': 1.0,
+    'duracao_teste': 15,
+    'politica': 'justa',
+    'num_shards': 1,
+    'distribuicao_chaves': 'uniforme',
+    'escritores_prioritarios': 0,
+    'leitores_em_lote': 0
+}
+
+# Mesmo cenário de muitos leitores com leitura otimista (sem contador de leitores)
+CONFIG_MUITOS_LEITORES_OTIMISTA = {
+    'num_leitores': 8,
+    'num_escritores': 1,
+    'delay_leitor_min': 0.1,
+    'delay_leitor_max': 0.3,
+    'delay_escritor_min': 0.5,
+    'delay_escritor_max': 1.0,
+    'tempo_leitura_min': 0.1,
+    'tempo_leitura_max': 0.2,
+    'tempo_escrita_min': 0.5,
+    'tempo_escrita_max': 1.0,
+    'duracao_teste': 15,
+    'politica': 'otimista',
+    'num_shards': 1,
+    'distribuicao_chaves': 'uniforme',
+    'escritores_prioritarios': 0,
+    'leitores_em_lote': 0
 }
 
 # Cenário com muitos escritores
@@ -45,7 +114,12 @@ CONFIG_MUITOS_ESCRITORES = {
     'tempo_leitura_max': 0.4,
     'tempo_escrita_min': 0.1,
     'tempo_escrita_max': 0.3,
-    'duracao_teste': 12
+    'duracao_teste': 12,
+    'politica': 'leitores',
+    'num_shards': 1,
+    'distribuicao_chaves': 'uniforme',
+    'escritores_prioritarios': 0,
+    'leitores_em_lote': 0
 }
 
 # Cenário balanceado
@@ -60,7 +134,12 @@ CONFIG_BALANCEADO = {
     'tempo_leitura_max': 0.6,
     'tempo_escrita_min': 0.3,
     'tempo_escrita_max': 0.6,
-    'duracao_teste': 10
+    'duracao_teste': 10,
+    'politica': 'leitores',
+    'num_shards': 1,
+    'distribuicao_chaves': 'uniforme',
+    'escritores_prioritarios': 0,
+    'leitores_em_lote': 0
 }
 
 # Cenário de alta concorrência
@@ -75,7 +154,12 @@ CONFIG_ALTA_CONCORRENCIA = {
     'tempo_leitura_max': 0.1,
     'tempo_escrita_min': 0.05,
     'tempo_escrita_max': 0.15,
-    'duracao_teste': 8
+    'duracao_teste': 8,
+    'politica': 'leitores',
+    'num_shards': 1,
+    'distribuicao_chaves': 'uniforme',
+    'escritores_prioritarios': 0,
+    'leitores_em_lote': 0
 }
 
 # Cenário de teste de stress
@@ -90,17 +174,87 @@ CONFIG_STRESS = {
     'tempo_leitura_max': 0.05,
     'tempo_escrita_min': 0.02,
     'tempo_escrita_max': 0.08,
-    'duracao_teste': 5
+    'duracao_teste': 5,
+    'politica': 'leitores',
+    'num_shards': 1,
+    'distribuicao_chaves': 'uniforme',
+    'escritores_prioritarios': 0,
+    'leitores_em_lote': 0
+}
+
+# Mesmo stress com a trava adaptativa: compara entradas rápidas e lentas sob disputa
+CONFIG_STRESS_ADAPTATIVA = {
+    'num_leitores': 15,
+    'num_escritores': 8,
+    'delay_leitor_min': 0.01,
+    'delay_leitor_max': 0.05,
+    'delay_escritor_min': 0.01,
+    'delay_escritor_max': 0.1,
+    'tempo_leitura_min': 0.01,
+    'tempo_leitura_max': 0.05,
+    'tempo_escrita_min': 0.02,
+    'tempo_escrita_max': 0.08,
+    'duracao_teste': 5,
+    'politica': 'adaptativa',
+    'num_shards': 1,
+    'distribuicao_chaves': 'uniforme',
+    'escritores_prioritarios': 0,
+    'leitores_em_lote': 0
+}
+
+# Cenário particionado: escritores em partições diferentes não se bloqueiam
+CONFIG_PARTICIONADO = {
+    'num_leitores': 4,
+    'num_escritores': 8,
+    'delay_leitor_min': 0.1,
+    'delay_leitor_max': 0.3,
+    'delay_escritor_min': 0.1,
+    'delay_escritor_max': 0.3,
+    'tempo_leitura_min': 0.1,
+    'tempo_leitura_max': 0.2,
+    'tempo_escrita_min': 0.2,
+    'tempo_escrita_max': 0.4,
+    'duracao_teste': 10,
+    'politica': 'leitores',
+    'num_shards': 8,
+    'distribuicao_chaves': 'zipf',
+    'escritores_prioritarios': 0,
+    'leitores_em_lote': 0
+}
+
+# Push de configuração: um escritor prioritário contra leitores em massa
+CONFIG_PRIORIDADE = {
+    'num_leitores': 8,
+    'num_escritores': 2,
+    'delay_leitor_min': 0.1,
+    'delay_leitor_max': 0.3,
+    'delay_escritor_min': 0.5,
+    'delay_escritor_max': 1.0,
+    'tempo_leitura_min': 0.1,
+    'tempo_leitura_max': 0.2,
+    'tempo_escrita_min': 0.2,
+    'tempo_escrita_max': 0.4,
+    'duracao_teste': 15,
+    'politica': 'prioridade',
+    'num_shards': 1,
+    'distribuicao_chaves': 'uniforme',
+    'escritores_prioritarios': 1,
+    'leitores_em_lote': 8
 }
 
 # Configurações disponíveis
 CONFIGURACOES = {
     'padrao': CONFIG_PADRAO,
     'muitos_leitores': CONFIG_MUITOS_LEITORES,
+    'muitos_leitores_justa': CONFIG_MUITOS_LEITORES_JUSTA,
+    'muitos_leitores_otimista': CONFIG_MUITOS_LEITORES_OTIMISTA,
     'muitos_escritores': CONFIG_MUITOS_ESCRITORES,
     'balanceado': CONFIG_BALANCEADO,
     'alta_concorrencia': CONFIG_ALTA_CONCORRENCIA,
-    'stress': CONFIG_STRESS
+    'stress': CONFIG_STRESS,
+    'stress_adaptativa': CONFIG_STRESS_ADAPTATIVA,
+    'particionado': CONFIG_PARTICIONADO,
+    'prioridade': CONFIG_PRIORIDADE
 }
 
 def get_config(nome='padrao'):
@@ -115,6 +269,8 @@ def listar_configuracoes():
         print(f"  Leitores: {config['num_leitores']}")
         print(f"  Escritores: {config['num_escritores']}")
         print(f"  Duração: {config['duracao_teste']}s")
+        print(f"  Política: {config['politica']}")
+        print(f"  Partições: {config['num_shards']} ({config['distribuicao_chaves']})")
 
 if __name__ == "__main__":
     listar_configuracoes()
\ No newline at end of file
@@ -6,16 +6,26 @@ import threading
 import time
 import random
 from datetime import datetime
+from rwlock import criar_rwlock, SeqLock
+from metricas import resumo_esperas
 
 class LeitoresEscritoresDemostracao:
-    def __init__(self):
+    def __init__(self, politica='leitores', recurso='trava'):
         self.dados = 0
-        self.mutex = threading.Semaphore(1)
-        self.wrt = threading.Semaphore(1)
-        self.leitores_ativos = 0
+        self.politica = politica
+        self.recurso = recurso  # 'trava' (RWLock) ou 'seqlock' (leitores sem trava)
+        self.lock = criar_rwlock(politica)
+        self.seqlock = SeqLock() if recurso == 'seqlock' else None
+        self.esperas = {'leitor': [], 'escritor': []}  # tempos de espera pela trava
+        self.invalidadas = 0  # leituras otimistas refeitas com a trava
         self.log_eventos = []
         self.log_lock = threading.Lock()
         self.executando = True
+    
+    @property
+    def leitores_ativos(self):
+        """Número de leitores ativos na trava"""
+        return self.lock.leitores_ativos
         
     def log_evento(self, evento):
         """Registra evento com timestamp"""
@@ -34,10 +44,11 @@ class LeitoresEscritoresDemostracao:
     def reset(self):
         """Reset para novo teste"""
         self.dados = 0
-        self.leitores_ativos = 0
         self.log_eventos = []
-        self.mutex = threading.Semaphore(1)
-        self.wrt = threading.Semaphore(1)
+        self.lock = criar_rwlock(self.politica)
+        self.seqlock = SeqLock() if self.recurso == 'seqlock' else None
+        self.esperas = {'leitor': [], 'escritor': []}
+        self.invalidadas = 0
         self.executando = True
     
     def parar(self):
@@ -50,14 +61,25 @@ class LeitoresEscritoresDemostracao:
         while self.executando and (operacoes is None or contador < operacoes):
             time.sleep(random.uniform(delay_min, delay_max))
             
-            self.mutex.acquire()
-            self.leitores_ativos += 1
-            if self.leitores_ativos == 1:
-                self.wrt.acquire()  # Primeiro leitor bloqueia escritores
+            if self.seqlock is not None:
+                self.leitura_seqlock(id)
+                contador += 1
+                continue
+            
+            if self.lock.suporta_leitura_otimista and self.leitura_otimista(id):
+                contador += 1
+                continue
+            
+            inicio_espera = time.perf_counter()
+            leitores = self.lock.acquire_read()
+            if not self.lock.conta_leitores:
+                leitores = self.lock.leitores_ativos  # slots: varre só para o log
+            self.esperas['leitor'].append(time.perf_counter() - inicio_espera)
+            if leitores == 1:
+                # Primeiro leitor bloqueia escritores
                 self.log_evento(f"📘 Leitor {id} BLOQUEIA escritores (primeiro leitor)")
             else:
                 self.log_evento(f"📘 Leitor {id} se junta à leitura")
-            self.mutex.release()
             
             # Leitura
             valor = self.dados
@@ -65,17 +87,41 @@ class LeitoresEscritoresDemostracao:
             time.sleep(random.uniform(0.3, 1.0))  # Tempo de leitura
             self.log_evento(f"📗 Leitor {id} TERMINOU leitura")
             
-            self.mutex.acquire()
-            self.leitores_ativos -= 1
-            if self.leitores_ativos == 0:
-                self.wrt.release()  # Último leitor libera escritores
+            restantes = self.lock.release_read()
+            if not self.lock.conta_leitores:
+                restantes = self.lock.leitores_ativos
+            if restantes == 0:
+                # Último leitor libera escritores
                 self.log_evento(f"📘 Leitor {id} LIBERA escritores (último leitor)")
             else:
                 self.log_evento(f"📘 Leitor {id} sai da leitura")
-            self.mutex.release()
             
             contador += 1
     
+    def leitura_otimista(self, id):
+        """Leitura sem trava validada por carimbo; False se um escritor interveio"""
+        carimbo = self.lock.try_optimistic_read()
+        if carimbo is not None:
+            valor = self.dados
+            time.sleep(random.uniform(0.3, 1.0))  # Tempo de leitura
+            if self.lock.validate(carimbo):
+                self.log_evento(f"📖 Leitor {id} LENDO valor: {valor} (otimista)")
+                return True
+        self.invalidadas += 1
+        self.log_evento(f"↩️ Leitor {id} leitura otimista invalidada, relendo com a trava")
+        return False
+    
+    def leitura_seqlock(self, id):
+        """Leitura sem trava protegida por seqlock; repete se um escritor interveio"""
+        while True:
+            sequencia = self.seqlock.read_begin()
+            valor = self.dados
+            time.sleep(random.uniform(0.3, 1.0))  # Tempo de leitura
+            if not self.seqlock.read_retry(sequencia):
+                self.log_evento(f"📖 Leitor {id} LENDO valor: {valor} (seqlock)")
+                return
+            self.log_evento(f"🔄 Leitor {id} relê (seqlock): escritor interveio")
+    
     def escritor(self, id, operacoes=None, delay_min=1.0, delay_max=3.0):
         """Escritor configurável"""
         contador = 0
@@ -83,7 +129,10 @@ class LeitoresEscritoresDemostracao:
             time.sleep(random.uniform(delay_min, delay_max))
             
             self.log_evento(f"✍️ Escritor {id} AGUARDANDO acesso exclusivo...")
-            self.wrt.acquire()
+            trava = self.seqlock if self.seqlock is not None else self.lock
+            inicio_espera = time.perf_counter()
+            trava.acquire_write()
+            self.esperas['escritor'].append(time.perf_counter() - inicio_espera)
             self.log_evento(f"✅ Escritor {id} OBTEVE acesso exclusivo")
             
             # Escrita
@@ -92,7 +141,7 @@ class LeitoresEscritoresDemostracao:
             self.dados += 1
             self.log_evento(f"✍️ Escritor {id} ESCREVEU: {valor_antigo} → {self.dados}")
             
-            self.wrt.release()
+            trava.release_write()
             self.log_evento(f"✅ Escritor {id} LIBEROU acesso exclusivo")
             
             contador += 1
@@ -171,14 +220,15 @@ def cenario_3_leitores_vs_escritores():
     
     print(f"\nResultado final: dados = {demo.dados}")
 
-def cenario_4_starvation_test():
+def cenario_4_starvation_test(politica='leitores', recurso='trava'):
     """Cenário 4: Teste de starvation (inanição)"""
     print("\n" + "="*60)
     print("CENÁRIO 4: TESTE DE STARVATION")
     print("="*60)
     print("Demonstra possível inanição de escritores com muitos leitores")
+    print(f"Política da trava: {politica}, recurso: {recurso}")
     
-    demo = LeitoresEscritoresDemostracao()
+    demo = LeitoresEscritoresDemostracao(politica, recurso)
     threads = []
     
     # Muitos leitores (podem causar starvation do escritor)
@@ -205,6 +255,14 @@ def cenario_4_starvation_test():
     print(f"- Escritas realizadas: {escritas}")
     print(f"- Leituras realizadas: {leituras}")
     print(f"- Dados final: {demo.dados}")
+    for tipo in ('leitor', 'escritor'):
+        resumo = resumo_esperas(demo.esperas[tipo])
+        print(f"- Espera do {tipo}: p99 {resumo['p99']:.3f}s, máx {resumo['maximo']:.3f}s")
+    if demo.lock.suporta_leitura_otimista:
+        print(f"- Leituras otimistas invalidadas: {demo.invalidadas}")
+    if demo.seqlock is not None:
+        print(f"- Releituras do seqlock: {demo.seqlock.releituras} "
+              f"(de {demo.seqlock.leituras + demo.seqlock.releituras} tentativas)")
     
     if escritas < 2:
         print("⚠️  POSSÍVEL STARVATION DETECTADA: Escritor teve poucas oportunidades")
@@ -225,12 +283,12 @@ def analise_temporizada():
         # Escritor longo
         def escritor_longo():
             demo.log_evento("🔒 Escritor iniciando operação LONGA")
-            demo.wrt.acquire()
+            demo.lock.acquire_write()
             demo.log_evento("✍️ Escritor obteve lock - INÍCIO escrita longa")
             time.sleep(2)  # Escrita muito longa
             demo.dados += 100
             demo.log_evento("✍️ Escritor TERMINOU escrita longa")
-            demo.wrt.release()
+            demo.lock.release_write()
             demo.log_evento("🔓 Escritor liberou lock")
         
         # Leitores esperando
@@ -279,10 +337,14 @@ def menu_interativo():
         print("4. Teste de starvation")
         print("5. Análise temporizada")
         print("6. Executar todos os cenários")
+        print("7. Teste de starvation com preferência para escritores")
+        print("8. Teste de starvation com trava justa (FIFO)")
+        print("9. Teste de starvation com leitura otimista")
+        print("10. Teste de starvation com recurso seqlock")
         print("0. Sair")
         
         try:
-            escolha = input("\nDigite sua escolha (0-6): ").strip()
+            escolha = input("\nDigite sua escolha (0-10): ").strip()
             
             if escolha == '0':
                 print("Encerrando demonstração...")
@@ -303,6 +365,14 @@ def menu_interativo():
                 cenario_3_leitores_vs_escritores()
                 cenario_4_starvation_test()
                 analise_temporizada()
+            elif escolha == '7':
+                cenario_4_starvation_test('escritores')
+            elif escolha == '8':
+                cenario_4_starvation_test('justa')
+            elif escolha == '9':
+                cenario_4_starvation_test('otimista')
+            elif escolha == '10':
+                cenario_4_starvation_test(recurso='seqlock')
             else:
                 print("Escolha inválida! Tente novamente.")
                 continue
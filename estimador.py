@@ -0,0 +1,303 @@
+"""
+Estimador Monte Carlo vetorizado (NumPy)
+Sorteia de uma vez, em arrays, os tempos de espera e de leitura de todos os
+leitores e os intervalos entre escritas e as escritas de todos os escritores
+em muitas replicações independentes. Com eles calcula a ocupação da trava,
+as esperas de escritores e de leitores e a probabilidade de inanição sem
+laço Python por evento (só por ciclo de escrita, vetorizado nas replicações).
+Os leitores são sorteados em lotes de replicações e a grade de tempo tem um
+número máximo de pontos, então memória e tempo ficam limitados mesmo com
+atores muito rápidos. Usa as distribuições (uniformes) de configuracoes.py
+
+Aproximação: os leitores não são afetados pelos escritores, o que vale
+quando escritas são raras ou curtas (justamente o regime de inanição), e os
+escritores não disputam a trava entre si. A espera do escritor depende da
+regra de admissão (motor_eventos.MODELOS): com preferência para leitores ele
+só entra quando nenhum leitor está ativo; nas demais políticas espera apenas
+os leitores que já estavam lá. O leitor espera a escrita em andamento e, fora
+da preferência para leitores, também o escritor que aguarda a vez.
+NumPy é opcional: o restante do projeto não depende dele
+"""
+import argparse
+import time
+from motor_eventos import MODELOS
+from configuracoes import get_config, CONFIGURACOES
+
+try:
+    import numpy as np
+except ImportError:  # dependência opcional
+    np = None
+
+# Fração inicial do horizonte descartada (aquecimento) e fração final em que
+# não chegam escritores, para a espera não ser truncada no fim do horizonte
+AQUECIMENTO = 0.1
+CHEGADAS_ATE = 0.5
+
+# Limites de custo: pontos da grade somando todas as replicações (a resolução
+# padrão cresce para caber) e valores sorteados por vez (as replicações são
+# processadas em lotes), para limitar a memória e o tempo da estimativa
+PONTOS_POR_ESTIMATIVA = 2_000_000
+SORTEIOS_POR_LOTE = 500_000
+
+
+def _exigir_numpy():
+    if np is None:
+        raise ImportError("O estimador requer NumPy (pip install numpy)")
+
+
+def _pontos(instantes, resolucao, pontos):
+    """Primeiro ponto da grade em ou depois de cada instante (limitado a `pontos`)"""
+    return np.minimum(np.ceil(instantes / resolucao), pontos).astype(np.int64)
+
+
+def _contar_ativos(primeiro, ultimo, pontos):
+    """Intervalos ativos e intervalos que começam em cada ponto da grade (replicacoes x pontos)
+
+    O ponto g está ocupado se primeiro <= g < ultimo: +1 no primeiro ponto do
+    intervalo, -1 no primeiro depois dele, soma acumulada.
+    """
+    replicacoes = primeiro.shape[0]
+    linha = np.arange(replicacoes).reshape(-1, 1, 1) * (pontos + 1)
+    tamanho = replicacoes * (pontos + 1)
+    inicios = np.bincount((linha + primeiro).ravel(), minlength=tamanho).reshape(replicacoes, pontos + 1)
+    fins = np.bincount((linha + ultimo).ravel(), minlength=tamanho).reshape(replicacoes, pontos + 1)
+    return np.cumsum(inicios - fins, axis=1)[:, :pontos], inicios[:, :pontos]
+
+
+def _uniforme(rng, minimo, maximo, forma):
+    """Sorteio uniforme em precisão simples (metade da memória e do tempo de float64)"""
+    return rng.random(forma, dtype=np.float32) * np.float32(maximo - minimo) + np.float32(minimo)
+
+
+def _ciclos(config, ator, uso, horizonte):
+    """Ciclos (espera + uso) que cabem no horizonte para os atores do tipo `ator`"""
+    ciclo_min = config[f'delay_{ator}_min'] + config[f'{uso}_min']
+    if ciclo_min <= 0:
+        raise ValueError(f"delay_{ator}_min + {uso}_min deve ser positivo")
+    return int(np.ceil(horizonte / ciclo_min)) + 1
+
+
+def _leitores(config, forma, pontos, resolucao, preferencia_leitores, rng):
+    """Grades (replicacoes x pontos) de leitores ativos, espera do escritor e pedidos de leitura
+
+    A espera do escritor que chega em cada ponto segue a regra de admissão
+    da política; os pedidos contam as leituras que começam em cada ponto.
+    """
+    delays = _uniforme(rng, config['delay_leitor_min'], config['delay_leitor_max'], forma)
+    leituras = _uniforme(rng, config['tempo_leitura_min'], config['tempo_leitura_max'], forma)
+    fim = np.cumsum(delays + leituras, axis=2)
+    primeiro = _pontos(fim - leituras, resolucao, pontos)
+    ativos, pedidos = _contar_ativos(primeiro, _pontos(fim, resolucao, pontos), pontos)
+    if preferencia_leitores:
+        esperas = _espera_ate_vazia(ativos, resolucao)
+    else:
+        esperas = _espera_leitores_presentes(primeiro, fim, pontos, resolucao)
+    return ativos, esperas, pedidos
+
+
+def _escritas(config, esperas, horizonte, resolucao, limite, preferencia_leitores, rng):
+    """Escritores de todas as replicações: grade de bloqueio dos leitores e esperas na janela
+
+    `esperas` é a espera pela trava de um escritor que chega em cada ponto da
+    grade. Só a chegada de cada ciclo depende da saída do anterior, então o
+    laço é por ciclo, vetorizado em todas as replicações e escritores, e cada
+    ciclo soma seus intervalos à grade sem guardar os tempos. Retorna os
+    escritores que bloqueiam leitores em cada ponto, as esperas das chegadas
+    na janela e, por replicação, as chegadas e as esperas acima do limite.
+    """
+    replicacoes, pontos = esperas.shape
+    escritores = config['num_escritores']
+    ciclos = _ciclos(config, 'escritor', 'tempo_escrita', horizonte) if escritores else 0
+    forma = (replicacoes, escritores)
+    linhas = np.arange(replicacoes).reshape(-1, 1)
+    diferencas = np.zeros((replicacoes, pontos + 1), dtype=np.int64)
+    esperas_na_janela = [np.empty(0)]
+    chegadas = np.zeros(replicacoes, dtype=np.int64)
+    acima = np.zeros(replicacoes, dtype=np.int64)
+    saida = np.zeros(forma)
+    for _ in range(ciclos):
+        chegada = saida + rng.uniform(config['delay_escritor_min'], config['delay_escritor_max'], forma)
+        if chegada.min() >= horizonte:
+            break
+        # Último ponto da grade em ou antes da chegada: só conta leitores já presentes
+        ponto = np.minimum(np.floor(chegada / resolucao), pontos - 1).astype(np.int64)
+        entrada = np.maximum(ponto * resolucao + esperas[linhas, ponto], chegada)
+        saida = entrada + rng.uniform(config['tempo_escrita_min'], config['tempo_escrita_max'], forma)
+
+        # O leitor espera enquanto houver escritor escrevendo (ou, fora da
+        # preferência para leitores, aguardando a vez) no instante do pedido
+        bloqueio = entrada if preferencia_leitores else chegada
+        np.add.at(diferencas, (linhas, _pontos(bloqueio, resolucao, pontos)), 1)
+        np.subtract.at(diferencas, (linhas, _pontos(saida, resolucao, pontos)), 1)
+
+        chegou = (chegada >= AQUECIMENTO * horizonte) & (chegada < CHEGADAS_ATE * horizonte)
+        espera = entrada - chegada
+        esperas_na_janela.append(espera[chegou])
+        chegadas += chegou.sum(axis=1)
+        acima += (chegou & (espera > limite)).sum(axis=1)
+    bloqueados = np.cumsum(diferencas, axis=1)[:, :pontos]
+    return bloqueados, np.concatenate(esperas_na_janela), chegadas, acima
+
+
+def _espera_ate_vazia(ativos, resolucao):
+    """Espera até o próximo ponto sem leitores (preferência para leitores)"""
+    pontos = ativos.shape[1]
+    indices = np.arange(pontos)
+    vazios = np.where(ativos == 0, indices, pontos)
+    proximo = np.minimum.accumulate(vazios[:, ::-1], axis=1)[:, ::-1]
+    return (proximo - indices) * resolucao
+
+
+def _espera_leitores_presentes(primeiro, fim, pontos, resolucao):
+    """Espera até saírem os leitores ativos na chegada (escritor retém os próximos)"""
+    replicacoes = primeiro.shape[0]
+    maior_fim = np.zeros((replicacoes, pontos + 1))
+    linhas = np.broadcast_to(np.arange(replicacoes).reshape(-1, 1, 1), primeiro.shape)
+    np.maximum.at(maior_fim, (linhas, primeiro), fim)
+    maior_fim = np.maximum.accumulate(maior_fim, axis=1)[:, :pontos]
+    return np.maximum(maior_fim - np.arange(pontos) * resolucao, 0.0)
+
+
+def _resumo(esperas, pesos=None):
+    """Quantidade, média, p99 e máximo de um array de esperas (zeros se vazio)
+
+    `pesos` conta quantas vezes cada espera ocorreu (padrão: uma).
+    """
+    pesos = np.ones(esperas.size, dtype=np.int64) if pesos is None else pesos
+    esperas, pesos = esperas[pesos > 0], pesos[pesos > 0]
+    if esperas.size == 0:
+        return {'quantidade': 0, 'media': 0.0, 'p99': 0.0, 'maximo': 0.0}
+    ordem = np.argsort(esperas, kind='stable')
+    acumulado = np.cumsum(pesos[ordem])
+    return {
+        'quantidade': int(acumulado[-1]),
+        'media': float(np.average(esperas, weights=pesos)),
+        'p99': float(esperas[ordem][np.searchsorted(acumulado, 0.99 * acumulado[-1])]),
+        'maximo': float(esperas.max())
+    }
+
+
+def estimar(config, replicacoes=500, horizonte=60.0, resolucao=None, limite=None, semente=None):
+    """Estima ocupação, esperas de escritores e leitores e probabilidade de inanição
+
+    `horizonte` é o tempo simulado de cada replicação, `resolucao` o passo
+    da grade de tempo (padrão: um décimo da leitura mais curta) e `limite`
+    a espera a partir da qual o escritor é considerado em inanição (padrão:
+    dez escritas médias). A resolução padrão é um décimo da leitura mais
+    curta, aumentada se preciso para a grade de todas as replicações caber
+    em PONTOS_POR_ESTIMATIVA pontos. As esperas contam só chegadas na janela
+    após o aquecimento e antes de CHEGADAS_ATE do horizonte.
+    """
+    _exigir_numpy()
+    if config.get('politica', 'leitores') not in MODELOS:
+        raise ValueError(f"Política desconhecida: {config['politica']}")
+    if resolucao is None:
+        resolucao = max(max(config['tempo_leitura_min'], 1e-3) / 10,
+                        horizonte * replicacoes / PONTOS_POR_ESTIMATIVA)
+    if limite is None:
+        limite = 10 * (config['tempo_escrita_min'] + config['tempo_escrita_max']) / 2
+    inicio_real = time.perf_counter()
+    rng = np.random.default_rng(semente)
+
+    preferencia_leitores = MODELOS[config.get('politica', 'leitores')] == 'leitores'
+    pontos = int(horizonte / resolucao)
+    janela = slice(int(AQUECIMENTO * pontos), int(CHEGADAS_ATE * pontos))
+    ciclos = _ciclos(config, 'leitor', 'tempo_leitura', horizonte)
+    # Leitores em lotes de replicações: o maior array sorteado cabe em
+    # SORTEIOS_POR_LOTE e só as grades ficam em memória
+    lote = max(1, SORTEIOS_POR_LOTE // max(config['num_leitores'] * ciclos, pontos))
+    esperas, pedidos, ocupados, ativos_na_janela = [], [], 0, 0
+    for inicio in range(0, replicacoes, lote):
+        forma = (min(lote, replicacoes - inicio), config['num_leitores'], ciclos)
+        ativos, espera, pedido = _leitores(config, forma, pontos, resolucao, preferencia_leitores, rng)
+        ocupados += int((ativos[:, janela] > 0).sum())
+        ativos_na_janela += int(ativos[:, janela].sum())
+        esperas.append(espera)
+        pedidos.append(pedido[:, janela])
+    bloqueados, esperas_escritor, chegadas, acima = _escritas(
+        config, np.concatenate(esperas), horizonte, resolucao, limite, preferencia_leitores, rng)
+    esperas_leitor = _espera_ate_vazia(bloqueados, resolucao)[:, janela]
+    pedidos = np.concatenate(pedidos)
+
+    # Fração de esperas acima do limite em cada replicação com alguma chegada
+    inanicao = acima[chegadas > 0] / chegadas[chegadas > 0]
+    pontos_na_janela = replicacoes * (janela.stop - janela.start)
+
+    return {
+        'num_leitores': config['num_leitores'],
+        'num_escritores': config['num_escritores'],
+        'politica': config.get('politica', 'leitores'),
+        'replicacoes': replicacoes,
+        'horizonte': horizonte,
+        'limite': limite,
+        'ocupacao': ocupados / pontos_na_janela,
+        'leitores_medios': ativos_na_janela / pontos_na_janela,
+        'espera_escritor': _resumo(esperas_escritor),
+        'espera_leitor': _resumo(esperas_leitor.ravel(), pedidos.ravel()),
+        'prob_inanicao': float(inanicao.mean()) if inanicao.size else 0.0,
+        'erro_inanicao': float(inanicao.std(ddof=1) / np.sqrt(inanicao.size)) if inanicao.size > 1 else 0.0,
+        'tempo_real': time.perf_counter() - inicio_real
+    }
+
+
+def leitores_ate_inanicao(config, probabilidade=0.05, max_leitores=64, **opcoes):
+    """Menor número de leitores com probabilidade de inanição acima de `probabilidade`
+
+    Retorna (número ou None se não houver até `max_leitores`, estimativas
+    calculadas). `opcoes` são repassadas a estimar().
+    """
+    estimativas = []
+    for leitores in range(1, max_leitores + 1):
+        estimativa = estimar(dict(config, num_leitores=leitores), **opcoes)
+        estimativas.append(estimativa)
+        if estimativa['prob_inanicao'] > probabilidade:
+            return leitores, estimativas
+    return None, estimativas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimativa Monte Carlo vetorizada (NumPy)")
+    parser.add_argument('--config', default='muitos_leitores', choices=list(CONFIGURACOES.keys()))
+    parser.add_argument('--politica', choices=list(MODELOS.keys()), help="sobrescreve a política")
+    parser.add_argument('--replicacoes', type=int, default=500)
+    parser.add_argument('--horizonte', type=float, default=60.0, help="segundos por replicação")
+    parser.add_argument('--limite', type=float, help="espera do escritor considerada inanição (s)")
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--inanicao', type=float, metavar='PROB',
+                        help="procura o menor número de leitores com inanição acima de PROB")
+    args = parser.parse_args()
+
+    config = get_config(args.config)
+    if args.politica:
+        config['politica'] = args.politica
+    opcoes = dict(replicacoes=args.replicacoes, horizonte=args.horizonte,
+                  limite=args.limite, semente=args.semente)
+
+    print("=" * 60)
+    print(f"ESTIMATIVA MONTE CARLO - '{args.config}', política '{config['politica']}'")
+    print("=" * 60)
+    if args.inanicao is not None:
+        leitores, estimativas = leitores_ate_inanicao(config, args.inanicao, **opcoes)
+        print(f"{'Leitores':>8}{'Ocupação':>10}{'Espera média':>14}{'p99':>8}{'P(inanição)':>13}")
+        for e in estimativas:
+            print(f"{e['num_leitores']:>8}{e['ocupacao']:>10.1%}{e['espera_escritor']['media']:>12.2f} s"
+                  f"{e['espera_escritor']['p99']:>8.2f}{e['prob_inanicao']:>13.1%}")
+        if leitores is None:
+            print(f"\nSem inanição acima de {args.inanicao:.1%} até {len(estimativas)} leitores")
+        else:
+            print(f"\nCom {leitores} leitores a inanição passa de {args.inanicao:.1%}")
+        return
+
+    e = estimar(config, **opcoes)
+    print(f"Tempo real: {e['tempo_real'] * 1000:.0f} ms ({e['replicacoes']} replicações "
+          f"de {e['horizonte']:.0f}s)")
+    print(f"Ocupação por leitores: {e['ocupacao']:.1%} (média de {e['leitores_medios']:.2f} ativos)")
+    print(f"Espera do escritor: média {e['espera_escritor']['media']:.2f} s, "
+          f"p99 {e['espera_escritor']['p99']:.2f} s, máx {e['espera_escritor']['maximo']:.2f} s")
+    print(f"Espera do leitor: média {e['espera_leitor']['media']:.3f} s, "
+          f"p99 {e['espera_leitor']['p99']:.2f} s, máx {e['espera_leitor']['maximo']:.2f} s")
+    print(f"P(espera > {e['limite']:.2f} s): {e['prob_inanicao']:.2%} ± {e['erro_inanicao']:.2%}")
+
+
+if __name__ == "__main__":
+    main()
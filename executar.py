@@ -38,6 +38,17 @@ def executar_demo_rapida():
         ("test_leitores_escritores.py", "Casos de teste unitários"),
         ("demonstracao_cenarios.py", "Demonstrações interativas"),
         ("LeitoresEscritores.py", "Versão original (linha de comando)"),
+        ("benchmark_rwlock.py", "Benchmark de leitura das travas"),
+        ("particoes.py", "Escalabilidade do recurso particionado"),
+        ("motor_async.py", "Simulação com corrotinas (milhares de atores)"),
+        ("motor_processos.py", "Simulação com processos (leituras sem GIL)"),
+        ("programa_arquivo.py", "Leitores/escritores em programas separados (fcntl)"),
+        ("servidor_travas.py", "Servidor de travas e benchmark de idas e voltas"),
+        ("motor_eventos.py", "Simulação por eventos discretos (tempo virtual)"),
+        ("simular.py", "Execução sem interface (métricas em JSON)"),
+        ("varredura.py", "Varredura de parâmetros em paralelo"),
+        ("estimador.py", "Estimador Monte Carlo vetorizado (NumPy)"),
+        ("modelo_analitico.py", "Modelo analítico de filas x simulação"),
         ("README.md", "Documentação completa")
     ]
     
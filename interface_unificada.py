@@ -8,6 +8,18 @@ import queue
 import subprocess
 import sys
 import os
+from rwlock import criar_rwlock, POLITICAS, PRIORIDADES, SeqLock, RCU, RWLockArrendamento
+from metricas import resumo_esperas
+from modelo_analitico import prever
+
+# Intervalos (mínimo, máximo) dos tempos sorteados por leitor() e escritor();
+# as configurações aplicadas trocam os de espera (delay_min/delay_max)
+TEMPOS_ATORES = {
+    'delay_leitor': (0.3, 1.5),
+    'delay_escritor': (0.5, 2.0),
+    'tempo_leitura': (0.2, 0.8),
+    'tempo_escrita': (0.2, 0.8)
+}
 
 class LeitoresEscritoresUnificado:
     def __init__(self, root):
@@ -18,9 +30,10 @@ class LeitoresEscritoresUnificado:
         
         # Recursos compartilhados
         self.dados = 0
-        self.mutex = threading.Semaphore(1)
-        self.wrt = threading.Semaphore(1)
-        self.leitores_ativos = 0
+        self.politica = 'leitores'
+        self.lock = criar_rwlock(self.politica)
+        self.seqlock = None  # SeqLock quando o recurso é 'seqlock' (leitores sem trava)
+        self.rcu = None      # RCU quando o recurso é 'rcu' (leitores leem versões imutáveis)
         
         # Controle de threads
         self.threads = []
@@ -29,7 +42,11 @@ class LeitoresEscritoresUnificado:
         
         # Controle de operações em andamento
         self.operacoes_ativas = 0
-        self.operacoes_lock = threading.Lock()
+        self.operacoes_lock = threading.Condition()
+        
+        # Sinal de parada: acorda atores em delays e esperas pela trava
+        self.parada = threading.Event()
+        self.parada.set()
         
         # Queue para comunicação thread-safe
         self.message_queue = queue.Queue()
@@ -38,12 +55,35 @@ class LeitoresEscritoresUnificado:
         self.stats = {
             'total_leituras': 0,
             'total_escritas': 0,
+            'total_atualizacoes': 0,
+            'conflitos_atualizacao': 0,
+            'leituras_pos_escrita': 0,
+            'leituras_otimistas': 0,
+            'otimistas_invalidadas': 0,
+            'releituras_seqlock': 0,
+            'max_versoes_vivas': 0,
             'leitores_simultaneos_max': 0,
             'tempo_inicio': None,
             'tempo_pausado': 0,
             'tempo_ultima_pausa': None
         }
         
+        # Tempos de espera pela trava (segundos); esperas_modelo guarda só as
+        # dos leitores e escritores comuns, as que o modelo analítico prevê
+        # (sem RCU, releituras após a escrita e atualizadores)
+        self.esperas = {'leitor': [], 'escritor': []}
+        self.esperas_modelo = {'leitor': [], 'escritor': []}
+        self.esperas_classe = {classe: [] for classe in PRIORIDADES}
+        
+        # Classes de prioridade: os primeiros escritores são 'alta' e os
+        # primeiros leitores 'baixa'; os demais atores são 'normal'
+        self.escritores_prioritarios = 0
+        self.leitores_em_lote = 0
+        
+        # Previsão do modelo analítico para a simulação atual
+        self.previsao = None
+        self.tempos = dict(TEMPOS_ATORES)
+        
         # Configurações
         self.configuracoes = self.carregar_configuracoes()
         self.config_atual = 'padrao'
@@ -59,6 +99,7 @@ class LeitoresEscritoresUnificado:
                 'num_escritores': 2,
                 'delay_min': 0.5,
                 'delay_max': 2.0,
+                'politica': 'leitores',
                 'descricao': 'Configuração padrão balanceada'
             },
             'muitos_leitores': {
@@ -66,13 +107,31 @@ class LeitoresEscritoresUnificado:
                 'num_escritores': 1,
                 'delay_min': 0.1,
                 'delay_max': 0.5,
+                'politica': 'leitores',
                 'descricao': 'Teste de starvation - muitos leitores'
             },
+            'muitos_leitores_justa': {
+                'num_leitores': 8,
+                'num_escritores': 1,
+                'delay_min': 0.1,
+                'delay_max': 0.5,
+                'politica': 'justa',
+                'descricao': 'Muitos leitores com trava justa (sem starvation)'
+            },
+            'muitos_leitores_otimista': {
+                'num_leitores': 8,
+                'num_escritores': 1,
+                'delay_min': 0.1,
+                'delay_max': 0.5,
+                'politica': 'otimista',
+                'descricao': 'Muitos leitores com leitura otimista (sem mutex)'
+            },
             'muitos_escritores': {
                 'num_leitores': 1,
                 'num_escritores': 6,
                 'delay_min': 0.2,
                 'delay_max': 0.8,
+                'politica': 'leitores',
                 'descricao': 'Muitos escritores competindo'
             },
             'balanceado': {
@@ -80,6 +139,7 @@ class LeitoresEscritoresUnificado:
                 'num_escritores': 4,
                 'delay_min': 0.3,
                 'delay_max': 1.0,
+                'politica': 'leitores',
                 'descricao': 'Cenário balanceado'
             },
             'alta_concorrencia': {
@@ -87,6 +147,7 @@ class LeitoresEscritoresUnificado:
                 'num_escritores': 5,
                 'delay_min': 0.1,
                 'delay_max': 0.3,
+                'politica': 'leitores',
                 'descricao': 'Alta concorrência'
             },
             'stress': {
@@ -94,7 +155,26 @@ class LeitoresEscritoresUnificado:
                 'num_escritores': 8,
                 'delay_min': 0.05,
                 'delay_max': 0.2,
+                'politica': 'leitores',
                 'descricao': 'Teste de stress máximo'
+            },
+            'stress_adaptativa': {
+                'num_leitores': 15,
+                'num_escritores': 8,
+                'delay_min': 0.05,
+                'delay_max': 0.2,
+                'politica': 'adaptativa',
+                'descricao': 'Stress com caminho rápido sem disputa'
+            },
+            'prioridade': {
+                'num_leitores': 8,
+                'num_escritores': 2,
+                'delay_min': 0.1,
+                'delay_max': 0.5,
+                'politica': 'prioridade',
+                'escritores_prioritarios': 1,
+                'leitores_em_lote': 8,
+                'descricao': 'Push de configuração (alta) contra leitores em massa (baixa)'
             }
         }
     
@@ -144,9 +224,23 @@ class LeitoresEscritoresUnificado:
         ttk.Button(config_frame, text="Aplicar", 
                   command=self.aplicar_configuracao).grid(row=0, column=2)
         
+        # Seletor da política da trava
+        ttk.Label(config_frame, text="Política:").grid(row=1, column=0, sticky=tk.W, pady=(10, 0))
+        self.politica_var = tk.StringVar(value=self.politica)
+        ttk.Combobox(config_frame, textvariable=self.politica_var,
+                     values=list(POLITICAS.keys()),
+                     state="readonly", width=15).grid(row=1, column=1, padx=(5, 10), pady=(10, 0))
+        
+        # Seletor do recurso: dados sob a trava RW, seqlock ou RCU
+        ttk.Label(config_frame, text="Recurso:").grid(row=2, column=0, sticky=tk.W, pady=(5, 0))
+        self.recurso_var = tk.StringVar(value="trava")
+        ttk.Combobox(config_frame, textvariable=self.recurso_var,
+                     values=["trava", "seqlock", "rcu"],
+                     state="readonly", width=15).grid(row=2, column=1, padx=(5, 10), pady=(5, 0))
+        
         # Configuração manual
         manual_frame = ttk.Frame(config_frame)
-        manual_frame.grid(row=1, column=0, columnspan=3, sticky=tk.W, pady=(10, 0))
+        manual_frame.grid(row=3, column=0, columnspan=3, sticky=tk.W, pady=(10, 0))
         
         ttk.Label(manual_frame, text="Leitores:").grid(row=0, column=0, sticky=tk.W)
         self.leitores_var = tk.StringVar(value="3")
@@ -158,6 +252,46 @@ class LeitoresEscritoresUnificado:
         ttk.Spinbox(manual_frame, from_=1, to=20, textvariable=self.escritores_var, 
                    width=5).grid(row=0, column=3, padx=(5, 0))
         
+        # Atualizadores: read-modify-write (lê, decide e escreve)
+        ttk.Label(manual_frame, text="Atualizadores:").grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
+        self.atualizadores_var = tk.StringVar(value="0")
+        ttk.Spinbox(manual_frame, from_=0, to=20, textvariable=self.atualizadores_var, 
+                   width=5).grid(row=1, column=1, padx=(5, 15), pady=(5, 0))
+        
+        self.promocao_atomica = tk.BooleanVar(value=True)
+        ttk.Checkbutton(manual_frame, text="Promoção atômica", 
+                       variable=self.promocao_atomica).grid(row=1, column=2, columnspan=2,
+                                                            sticky=tk.W, pady=(5, 0))
+        
+        # Escritores releem o valor publicado (downgrade quando suportado)
+        self.leitura_pos_escrita = tk.BooleanVar(value=False)
+        ttk.Checkbutton(manual_frame, text="Leitura após escrita", 
+                       variable=self.leitura_pos_escrita).grid(row=2, column=0, columnspan=4,
+                                                               sticky=tk.W, pady=(5, 0))
+        
+        # Classes de prioridade (respeitadas pela política 'prioridade')
+        ttk.Label(manual_frame, text="Escritores alta:").grid(row=3, column=0, sticky=tk.W, pady=(5, 0))
+        self.escritores_prioritarios_var = tk.StringVar(value="0")
+        ttk.Spinbox(manual_frame, from_=0, to=20, textvariable=self.escritores_prioritarios_var, 
+                   width=5).grid(row=3, column=1, padx=(5, 15), pady=(5, 0))
+        
+        ttk.Label(manual_frame, text="Leitores baixa:").grid(row=3, column=2, sticky=tk.W, pady=(5, 0))
+        self.leitores_em_lote_var = tk.StringVar(value="0")
+        ttk.Spinbox(manual_frame, from_=0, to=20, textvariable=self.leitores_em_lote_var, 
+                   width=5).grid(row=3, column=3, padx=(5, 0), pady=(5, 0))
+        
+        # Arrendamento das escritas: posse máxima em segundos (0 = desligado)
+        ttk.Label(manual_frame, text="Arrendamento (s):").grid(row=4, column=0, sticky=tk.W, pady=(5, 0))
+        self.arrendamento_var = tk.StringVar(value="0")
+        ttk.Spinbox(manual_frame, from_=0, to=10, increment=0.5, textvariable=self.arrendamento_var, 
+                   width=5).grid(row=4, column=1, padx=(5, 15), pady=(5, 0))
+        
+        # Escritor 0 trava dentro da seção crítica (para ver a revogação)
+        self.escritor_travado = tk.BooleanVar(value=False)
+        ttk.Checkbutton(manual_frame, text="Escritor travado", 
+                       variable=self.escritor_travado).grid(row=4, column=2, columnspan=2,
+                                                           sticky=tk.W, pady=(5, 0))
+        
         # Controles
         control_frame = ttk.LabelFrame(left_frame, text="🎮 Controles", padding="10")
         control_frame.pack(fill=tk.X, pady=(0, 10))
@@ -233,6 +367,7 @@ class LeitoresEscritoresUnificado:
         # Configurar tags para cores
         self.log_text.tag_config("leitor", foreground="blue")
         self.log_text.tag_config("escritor", foreground="red")
+        self.log_text.tag_config("atualizador", foreground="darkgreen")
         self.log_text.tag_config("sistema", foreground="purple")
         self.log_text.tag_config("timestamp", foreground="gray")
     
@@ -613,6 +748,8 @@ Clique em uma demonstração à esquerda para começar!
         self.log_message("📊 ANÁLISE FINAL:", "sistema")
         self.log_message(f"• Escritas realizadas: {escritas}", "sistema")
         self.log_message(f"• Leituras realizadas: {leituras}", "sistema")
+        self.log_message(f"• Espera p99 do escritor: {resumo_esperas(self.esperas['escritor'])['p99']:.2f}s "
+                         f"(política: {self.politica})", "sistema")
         
         if escritas < 3:
             self.log_message("🚨 STARVATION DETECTADA! Escritor teve poucas oportunidades", "sistema")
@@ -797,7 +934,8 @@ Clique em uma demonstração à esquerda para começar!
             
             params_text = f"Leitores: {config['num_leitores']} | " \
                          f"Escritores: {config['num_escritores']} | " \
-                         f"Delay: {config['delay_min']}-{config['delay_max']}s"
+                         f"Delay: {config['delay_min']}-{config['delay_max']}s | " \
+                         f"Política: {config['politica']}"
             ttk.Label(params_frame, text=params_text, font=("Courier", 9)).pack(side=tk.LEFT)
             
             ttk.Button(params_frame, text="Aplicar", 
@@ -1087,10 +1225,39 @@ CARACTERÍSTICAS:
 ✅ Exclusão: Escritores têm acesso exclusivo
 ⚠️ Starvation: Leitores podem impedir escritores indefinidamente
 
-VARIANTES:
-• Readers-preference (implementada aqui)
-• Writers-preference
-• Fair readers-writers
+VARIANTES (campo "Política" na aba Simulação):
+• leitores: Readers-preference (algoritmo acima, padrão)
+• escritores: Writers-preference (leitores esperam escritor pendente)
+• justa: Fair readers-writers (fila FIFO por tickets)
+• condicao: Uma única Condition; leitores retidos entram juntos
+• otimista: Leitura por carimbo de versão, sem trava; só relê com
+  a trava se um escritor interveio (estilo StampedLock)
+• slots: Um contador por thread leitora ("big reader"); o escritor
+  varre os slots, leitores não disputam um contador comum
+
+ATUALIZADORES (read-modify-write):
+• Promoção atômica: leitura atualizável promovida a escrita com
+  upgrade(), sem soltar a trava (apenas política condicao)
+• Sem promoção: libera a leitura e readquire a escrita; outro
+  escritor pode alterar o valor no intervalo (conflito)
+
+RECURSO SEQLOCK (campo "Recurso"):
+• Escritores incrementam uma sequência ao entrar e ao sair
+• Leitores não adquirem trava: guardam a sequência, leem e
+  repetem a leitura se ela mudou (releituras nas estatísticas)
+• Vale a pena quando escritas são raras e curtas
+
+RECURSO RCU (copy-on-write):
+• Escritores publicam uma nova versão imutável trocando uma
+  única referência; leitores pegam a versão atual sem trava
+• Leitura em tempo constante, mesmo com escritores ativos
+• Versões antigas vivem enquanto algum leitor as retém
+  ("versões vivas" nas estatísticas = custo de memória)
+
+LEITURA APÓS ESCRITA:
+• downgrade(): o escritor rebaixa a escrita a leitura sem soltar
+  a trava e acorda os leitores retidos (políticas justa e condicao)
+• Nas demais políticas libera a escrita e readquire a leitura
 """
         
         help_text.insert(tk.END, algorithm_content)
@@ -1132,8 +1299,9 @@ A: Semáforos garantem sincronização entre threads, evitando
    condições de corrida e garantindo exclusão mútua.
 
 Q: O algoritmo é justo?
-A: Esta implementação favorece leitores (readers-preference).
-   Pode causar starvation de escritores com muitos leitores.
+A: A política padrão favorece leitores (readers-preference) e
+   pode causar starvation de escritores com muitos leitores.
+   Selecione a política "escritores" ou "justa" para evitar isso.
 
 Q: Como detectar problemas?
 A: - Escritores simultâneos no log (BUG!)
@@ -1190,6 +1358,8 @@ A: Sim! Se algum teste falhar, há bug na implementação.
                         tag = "leitor"
                     elif "Escritor" in message:
                         tag = "escritor"
+                    elif "Atualizador" in message:
+                        tag = "atualizador"
                     else:
                         tag = "sistema"
                 else:
@@ -1260,6 +1430,10 @@ A: Sim! Se algum teste falhar, há bug na implementação.
             # Salvar o tempo atual para quando parar
             self._ultimo_tempo_execucao = tempo_execucao
         
+        espera_leitores = resumo_esperas(self.esperas['leitor'])
+        espera_escritores = resumo_esperas(self.esperas['escritor'])
+        modo_atualizacao = 'promoção' if self.usar_promocao() else 'liberar/readquirir'
+        
         stats_text = f"""📊 ESTATÍSTICAS DE EXECUÇÃO
 
 ⏱️ Tempo de Execução: {tempo_execucao:.1f}s
@@ -1277,11 +1451,85 @@ A: Sim! Se algum teste falhar, há bug na implementação.
 
 ⚖️ Proporção L/E: {self.stats['total_leituras']/(max(self.stats['total_escritas'], 1)):.1f}
 
+🔁 Atualizações ({modo_atualizacao}):
+   • Total: {self.stats['total_atualizacoes']:,} ({self.stats['total_atualizacoes']/max(tempo_execucao, 1):.1f}/s)
+   • Conflitos: {self.stats['conflitos_atualizacao']}
+
+🔮 Leituras otimistas: {self.stats['leituras_otimistas']:,} (invalidadas: {self.stats['otimistas_invalidadas']})
+
+🔢 Recurso: {self.descricao_recurso()}
+
+🔽 Leituras após escrita: {self.stats['leituras_pos_escrita']:,} ({'downgrade' if self.lock.suporta_rebaixamento else 'liberar/readquirir'})
+
+⏲️ Arrendamentos: {self.descricao_arrendamento()}
+
+🔐 Política: {self.politica}
+⚡ Caminho rápido: {self.descricao_caminho_rapido()}
+⏳ Espera p99 / máx:
+   • Leitores: {espera_leitores['p99']*1000:.0f} / {espera_leitores['maximo']*1000:.0f} ms
+   • Escritores: {espera_escritores['p99']*1000:.0f} / {espera_escritores['maximo']*1000:.0f} ms
+
+🧮 Modelo analítico (previsto / medido):
+{self.descricao_previsao(tempo_execucao)}
+
+🏷️ Espera por classe (p99 / máx){'' if self.lock.suporta_prioridade else ' - política sem prioridade'}:
+{self.descricao_esperas_classe()}
+
 🎯 Estado: {'🟢 Executando' if self.running and not self.paused else '🔴 Parado' if not self.running else '⏸️ Pausado'}"""
         
         self.stats_text.delete(1.0, tk.END)
         self.stats_text.insert(tk.END, stats_text)
     
+    def descricao_esperas_classe(self):
+        """Linhas do painel com a espera de cada classe de prioridade que teve esperas"""
+        linhas = []
+        for classe in sorted(PRIORIDADES, key=PRIORIDADES.get, reverse=True):
+            esperas = self.esperas_classe[classe]
+            if esperas:
+                resumo = resumo_esperas(esperas)
+                linhas.append(f"   • {classe}: {resumo['p99']*1000:.0f} / {resumo['maximo']*1000:.0f} ms "
+                              f"({len(esperas)} esperas)")
+        return "\n".join(linhas) or "   • (sem esperas)"
+    
+    def sortear_tempo(self, chave):
+        """Tempo uniforme no intervalo de `chave` em self.tempos"""
+        return random.uniform(*self.tempos[chave])
+    
+    def config_do_modelo(self, num_leitores, num_escritores):
+        """Configuração (formato de configuracoes.py) com os tempos em uso por leitor() e escritor()"""
+        config = {
+            'num_leitores': num_leitores,
+            'num_escritores': num_escritores,
+            'politica': self.politica,
+            'escritores_prioritarios': self.escritores_prioritarios,
+            'leitores_em_lote': self.leitores_em_lote
+        }
+        for chave, (minimo, maximo) in self.tempos.items():
+            config[f'{chave}_min'], config[f'{chave}_max'] = minimo, maximo
+        return config
+    
+    def descricao_previsao(self, tempo_execucao):
+        """Linhas do painel com a previsão analítica ao lado dos valores medidos
+
+        As esperas medidas são só as de leitores e escritores comuns
+        (esperas_modelo), as mesmas que o modelo prevê.
+        """
+        if self.previsao is None:
+            return "   • (inicie a simulação)"
+        if self.seqlock is not None or self.rcu is not None:
+            return "   • não se aplica (leitores não usam a trava)"
+        p = self.previsao
+        espera_leitores = resumo_esperas(self.esperas_modelo['leitor'])
+        espera_escritores = resumo_esperas(self.esperas_modelo['escritor'])
+        tempo = max(tempo_execucao, 1)
+        return (f"   • Leituras/s: {p['leituras_por_s']:.2f} / {self.stats['total_leituras']/tempo:.2f}\n"
+                f"   • Escritas/s: {p['escritas_por_s']:.2f} / {self.stats['total_escritas']/tempo:.2f}\n"
+                f"   • Espera média leitor: {p['espera_leitor']*1000:.0f} / {espera_leitores['media']*1000:.0f} ms\n"
+                f"   • Espera média escritor: {p['espera_escritor']*1000:.0f} / "
+                f"{espera_escritores['media']*1000:.0f} ms\n"
+                f"   • Gargalo previsto: {p['gargalo']} (ocupação L {p['ocupacao_leitores']:.0%}, "
+                f"E {p['ocupacao_escritores']:.0%})" + ("" if p['convergiu'] else " — não convergiu"))
+    
     def calcular_tempo_execucao(self):
         """Calcula o tempo de execução considerando pausas"""
         if not self.stats['tempo_inicio']:
@@ -1309,154 +1557,369 @@ A: Sim! Se algum teste falhar, há bug na implementação.
         with self.operacoes_lock:
             if self.operacoes_ativas > 0:
                 self.operacoes_ativas -= 1
+            if self.operacoes_ativas == 0:
+                self.operacoes_lock.notify_all()
     
     def aguardar_operacoes_pendentes(self, timeout=3.0):
         """Aguarda todas as operações pendentes terminarem"""
-        import time
-        start_time = time.time()
-        while self.operacoes_ativas > 0 and (time.time() - start_time) < timeout:
-            time.sleep(0.1)
-        return self.operacoes_ativas == 0
+        with self.operacoes_lock:
+            return self.operacoes_lock.wait_for(lambda: self.operacoes_ativas == 0, timeout)
+    
+    @property
+    def leitores_ativos(self):
+        """Número de leitores ativos na trava atual"""
+        return self.lock.leitores_ativos
+    
+    def classe_do_ator(self, tipo, id):
+        """Classe de prioridade do leitor ou escritor `id`"""
+        if tipo == 'escritor' and id < self.escritores_prioritarios:
+            return 'alta'
+        if tipo == 'leitor' and id < self.leitores_em_lote:
+            return 'baixa'
+        return 'normal'
     
     # Métodos dos algoritmos (leitor e escritor)
     def leitor(self, id):
         """Algoritmo do leitor"""
-        while self.running:
+        parada = self.parada
+        classe = self.classe_do_ator('leitor', id)
+        self.lock.definir_prioridade(classe)
+        while not parada.is_set():
             if not self.paused:
-                # Delay antes de tentar ler (com verificação de parada)
-                for _ in range(int(random.uniform(0.3, 1.5) * 10)):
-                    if not self.running:
-                        return
-                    time.sleep(0.1)
-                
-                if not self.running:
+                # Delay antes de tentar ler (interrompido pela parada)
+                if parada.wait(self.sortear_tempo('delay_leitor')):
                     return
                 
                 # Registrar início de operação crítica
                 self.iniciar_operacao()
                 
-                # Entrada na seção crítica
-                self.mutex.acquire()
-                if not self.running:
-                    self.mutex.release()
+                # Seqlock: leitura sem trava, repetida se um escritor interveio
+                seqlock = self.seqlock
+                if seqlock is not None:
+                    self.ler_seqlock(id, seqlock, parada)
+                    self.finalizar_operacao()
+                    continue
+                
+                # RCU: pega a versão atual, sem trava e sem esperar escritores
+                rcu = self.rcu
+                if rcu is not None:
+                    self.ler_rcu(id, rcu, parada)
+                    self.finalizar_operacao()
+                    continue
+                
+                # Leitura otimista: sem trava, validada pelo carimbo no final
+                lock = self.lock
+                if lock.suporta_leitura_otimista and self.ler_otimista(id, lock, parada):
+                    self.finalizar_operacao()
+                    continue
+                
+                # Entrada na seção crítica (desiste se a simulação parar)
+                inicio_espera = time.perf_counter()
+                leitores = lock.try_acquire_read(cancelar=parada.is_set)
+                if not leitores:
                     self.finalizar_operacao()
                     return
+                if not lock.conta_leitores:
+                    leitores = lock.leitores_ativos  # slots: varre só para as estatísticas
+                espera = time.perf_counter() - inicio_espera
+                self.esperas['leitor'].append(espera)
+                self.esperas_modelo['leitor'].append(espera)
+                self.esperas_classe[classe].append(espera)
                     
-                self.leitores_ativos += 1
-                if self.leitores_ativos == 1:
-                    self.wrt.acquire()  # Primeiro leitor bloqueia escritores
-                    if self.running:
-                        self.log_message(f"🔒 Leitor {id} BLOQUEIA escritores (primeiro leitor)")
+                if leitores == 1:
+                    # Primeiro leitor bloqueia escritores
+                    self.log_message(f"🔒 Leitor {id} BLOQUEIA escritores (primeiro leitor)")
                 else:
-                    if self.running:
-                        self.log_message(f"👥 Leitor {id} se JUNTA à leitura")
+                    self.log_message(f"👥 Leitor {id} se JUNTA à leitura")
                 
                 # Atualizar máximo
-                if self.leitores_ativos > self.stats['leitores_simultaneos_max']:
-                    self.stats['leitores_simultaneos_max'] = self.leitores_ativos
-                
-                self.mutex.release()
-                
-                if not self.running:
-                    return
+                if leitores > self.stats['leitores_simultaneos_max']:
+                    self.stats['leitores_simultaneos_max'] = leitores
                 
                 # Leitura (seção crítica)
                 valor = self.dados
-                if self.running:
-                    self.log_message(f"📖 Leitor {id} está LENDO valor: {valor}", "leitor")
-                    self.stats['total_leituras'] += 1
+                self.log_message(f"📖 Leitor {id} está LENDO valor: {valor}", "leitor")
+                self.stats['total_leituras'] += 1
                 
-                # Simular tempo de leitura (com verificação de parada)
-                for _ in range(int(random.uniform(0.2, 0.8) * 10)):
-                    if not self.running:
-                        return
-                    time.sleep(0.1)
+                # Simular tempo de leitura (interrompido pela parada)
+                parada.wait(self.sortear_tempo('tempo_leitura'))
                 
                 # Saída da seção crítica
-                self.mutex.acquire()
-                if not self.running:
-                    self.mutex.release()
-                    return
-                    
-                self.leitores_ativos -= 1
-                if self.leitores_ativos == 0:
-                    self.wrt.release()  # Último leitor libera escritores
-                    if self.running:
+                restantes = lock.release_read()
+                if not lock.conta_leitores:
+                    restantes = lock.leitores_ativos
+                if restantes == 0:
+                    # Último leitor libera escritores
+                    if not parada.is_set():
                         self.log_message(f"🔓 Leitor {id} LIBERA escritores (último leitor)")
                 else:
-                    if self.running:
+                    if not parada.is_set():
                         self.log_message(f"👤 Leitor {id} SAI da leitura")
-                self.mutex.release()
                 
                 # Finalizar operação crítica
                 self.finalizar_operacao()
                 
             else:
-                if not self.running:
-                    return
-                time.sleep(0.1)  # Pausa quando pausado
+                parada.wait(0.1)  # Pausa quando pausado
+    
+    def ler_otimista(self, id, lock, parada):
+        """Leitura otimista por carimbo; retorna False se precisar reler com a trava"""
+        carimbo = lock.try_optimistic_read()
+        if carimbo is not None:
+            valor = self.dados
+            parada.wait(self.sortear_tempo('tempo_leitura'))
+            if lock.validate(carimbo):
+                self.log_message(f"🔮 Leitor {id} LEU (otimista) valor: {valor}", "leitor")
+                self.stats['total_leituras'] += 1
+                self.stats['leituras_otimistas'] += 1
+                return True
+        self.stats['otimistas_invalidadas'] += 1
+        self.log_message(f"↩️ Leitor {id} leitura otimista INVALIDADA, relendo com a trava")
+        return False
+    
+    def ler_seqlock(self, id, seqlock, parada):
+        """Leitura protegida por seqlock: repete enquanto um escritor interferir"""
+        while not parada.is_set():
+            sequencia = seqlock.read_begin(cancelar=parada.is_set)
+            if sequencia is None:
+                return
+            valor = self.dados
+            parada.wait(self.sortear_tempo('tempo_leitura'))
+            if not seqlock.read_retry(sequencia):
+                self.log_message(f"📖 Leitor {id} LEU (seqlock) valor: {valor}", "leitor")
+                self.stats['total_leituras'] += 1
+                return
+            self.stats['releituras_seqlock'] += 1
+            self.log_message(f"🔄 Leitor {id} RELÊ (seqlock): escritor interveio")
+    
+    def ler_rcu(self, id, rcu, parada):
+        """Leitura de uma versão imutável do RCU; a versão fica viva até o fim da leitura"""
+        inicio_espera = time.perf_counter()
+        versao = rcu.ler()
+        self.esperas['leitor'].append(time.perf_counter() - inicio_espera)
+        self.log_message(f"📖 Leitor {id} LEU (RCU v{versao.numero}) valor: {versao.valor}", "leitor")
+        self.stats['total_leituras'] += 1
+        parada.wait(self.sortear_tempo('tempo_leitura'))  # Retendo a versão
+    
+    def trava_de_escrita(self):
+        """Trava adquirida pelos escritores: a do recurso (seqlock/RCU) ou a RW"""
+        for recurso in (self.seqlock, self.rcu):
+            if recurso is not None:
+                return recurso
+        return self.lock
+    
+    def publicar(self, lock):
+        """No modo RCU, publica self.dados como nova versão (escrita adquirida)"""
+        if isinstance(lock, RCU):
+            lock.publicar(self.dados)
+            self.stats['max_versoes_vivas'] = lock.max_versoes_vivas
+    
+    def escrever(self, lock):
+        """Incrementa e publica self.dados (escrita adquirida); retorna False se recusada
+
+        Com arrendamento a escrita só acontece se a posse ainda vale: um
+        escritor revogado pelo monitor não sobrescreve o sucessor.
+        """
+        def incrementar():
+            self.dados += 1
+            self.publicar(lock)
+        if isinstance(lock, RWLockArrendamento):
+            return lock.executar_cercado(incrementar)
+        incrementar()
+        return True
+    
+    def descricao_caminho_rapido(self):
+        """Entradas pelo caminho rápido x protocolo completo (semáforos e trava adaptativa)"""
+        trava = getattr(self.lock, 'trava', self.lock)  # por baixo do arrendamento
+        if not hasattr(trava, 'taxa_rapida'):
+            return 'não se aplica'
+        return f"{trava.rapidas:,} rápidas / {trava.lentas:,} lentas ({trava.taxa_rapida():.0%})"
+    
+    def descricao_arrendamento(self):
+        """Resumo dos arrendamentos para o painel"""
+        if not isinstance(self.lock, RWLockArrendamento):
+            return 'desligado'
+        m = self.lock.metricas()
+        return (f"{m['concedidos']} concedidos ({self.lock.duracao_maxima:g}s), {m['revogacoes']} revogados, "
+                f"{m['quase_expiracoes']} quase expirados, {m['escritas_recusadas']} escritas recusadas, "
+                f"maior posse {m['maior_posse']:.1f}s")
     
     def escritor(self, id):
         """Algoritmo do escritor"""
-        while self.running:
+        parada = self.parada
+        classe = self.classe_do_ator('escritor', id)
+        self.lock.definir_prioridade(classe)
+        while not parada.is_set():
             if not self.paused:
-                # Delay antes de tentar escrever (com verificação de parada)
-                for _ in range(int(random.uniform(0.5, 2.0) * 10)):
-                    if not self.running:
-                        return
-                    time.sleep(0.1)
-                
-                if not self.running:
+                # Delay antes de tentar escrever (interrompido pela parada)
+                if parada.wait(self.sortear_tempo('delay_escritor')):
                     return
                 
                 # Registrar início de operação crítica
                 self.iniciar_operacao()
                     
-                if self.running:
-                    self.log_message(f"⏳ Escritor {id} AGUARDANDO acesso exclusivo...")
+                self.log_message(f"⏳ Escritor {id} AGUARDANDO acesso exclusivo...")
                 
-                # Entrada na seção crítica
-                self.wrt.acquire()
-                if not self.running:
-                    self.wrt.release()
+                # Entrada na seção crítica (desiste se a simulação parar)
+                lock = self.trava_de_escrita()
+                inicio_espera = time.perf_counter()
+                if not lock.try_acquire_write(cancelar=parada.is_set):
                     self.finalizar_operacao()
                     return
+                espera = time.perf_counter() - inicio_espera
+                self.esperas['escritor'].append(espera)
+                self.esperas_modelo['escritor'].append(espera)
+                self.esperas_classe[classe].append(espera)
                     
-                if self.running:
-                    self.log_message(f"🔒 Escritor {id} OBTEVE acesso exclusivo", "escritor")
+                self.log_message(f"🔒 Escritor {id} OBTEVE acesso exclusivo", "escritor")
                 
                 # Escrita (seção crítica)
                 valor_antigo = self.dados
                 
-                # Simular tempo de escrita (com verificação de parada)
-                for _ in range(int(random.uniform(0.2, 0.8) * 10)):
-                    if not self.running:
-                        self.wrt.release()
-                        return
-                    time.sleep(0.1)
-                
-                if not self.running:
-                    self.wrt.release()
+                # Simular tempo de escrita (interrompido pela parada); o escritor
+                # travado excede qualquer arrendamento
+                travado = id == 0 and self.escritor_travado.get()
+                if travado:
+                    self.log_message(f"🥶 Escritor {id} TRAVOU segurando a escrita", "escritor")
+                if parada.wait(5.0 if travado else self.sortear_tempo('tempo_escrita')):
+                    lock.release_write()
+                    self.finalizar_operacao()
                     return
                     
-                self.dados += 1
+                if not self.escrever(lock):
+                    self.log_message(f"⛔ Escritor {id} arrendamento REVOGADO: escrita recusada", "escritor")
+                    lock.release_write()
+                    self.finalizar_operacao()
+                    continue
                 
-                if self.running:
-                    self.log_message(f"✍️ Escritor {id} ESCREVEU: {valor_antigo} → {self.dados}", "escritor")
-                    self.stats['total_escritas'] += 1
+                self.log_message(f"✍️ Escritor {id} ESCREVEU: {valor_antigo} → {self.dados}", "escritor")
+                self.stats['total_escritas'] += 1
                 
                 # Saída da seção crítica
-                self.wrt.release()
-                if self.running:
+                if self.leitura_pos_escrita.get() and lock is self.lock:
+                    if not self.ler_apos_escrita(id, lock, parada):
+                        self.finalizar_operacao()
+                        return
+                else:
+                    lock.release_write()
+                if not parada.is_set():
                     self.log_message(f"🔓 Escritor {id} LIBEROU acesso exclusivo")
                 
                 # Finalizar operação crítica
                 self.finalizar_operacao()
                 
             else:
-                if not self.running:
+                parada.wait(0.1)  # Pausa quando pausado
+    
+    def ler_apos_escrita(self, id, lock, parada):
+        """Relê o valor publicado pelo escritor e libera a trava
+        
+        Com downgrade a escrita vira leitura sem soltar a trava; sem ele o
+        escritor libera e readquire a leitura. Retorna False se a simulação
+        parou antes da releitura.
+        """
+        inicio_espera = time.perf_counter()
+        if lock.suporta_rebaixamento:
+            lock.downgrade()
+            self.log_message(f"🔽 Escritor {id} REBAIXOU para leitura", "escritor")
+        else:
+            lock.release_write()
+            if not lock.try_acquire_read(cancelar=parada.is_set):
+                return False
+        self.esperas['leitor'].append(time.perf_counter() - inicio_espera)
+        
+        self.log_message(f"👁️ Escritor {id} CONFERIU valor: {self.dados}", "escritor")
+        self.stats['leituras_pos_escrita'] += 1
+        parada.wait(random.uniform(0.1, 0.3))
+        lock.release_read()
+        return True
+    
+    def descricao_recurso(self):
+        """Resumo do recurso para o painel: trava RW, seqlock com releituras ou RCU com versões"""
+        if self.rcu is not None:
+            return (f"RCU, versão {self.rcu.ler().numero}, "
+                    f"{self.rcu.versoes_vivas()} versões vivas (máx {self.stats['max_versoes_vivas']})")
+        if self.seqlock is None:
+            return 'trava RW'
+        leituras = self.stats['total_leituras']
+        releituras = self.stats['releituras_seqlock']
+        return (f"seqlock, {releituras} releituras "
+                f"({releituras / max(leituras + releituras, 1):.0%} das tentativas)")
+    
+    def usar_promocao(self):
+        """Atualizadores usam promoção atômica se marcada e suportada pela trava"""
+        return (self.trava_de_escrita() is self.lock and self.promocao_atomica.get()
+                and self.lock.suporta_atualizacao)
+    
+    def atualizador(self, id):
+        """Algoritmo do atualizador (read-modify-write)
+        
+        Com promoção atômica, lê sob leitura atualizável e promove para
+        escrita sem soltar a trava. Sem ela, libera a leitura e readquire
+        a escrita, contando como conflito quando outro escritor alterou o
+        valor no intervalo.
+        """
+        parada = self.parada
+        while not parada.is_set():
+            if not self.paused:
+                if parada.wait(random.uniform(0.5, 2.0)):
                     return
-                time.sleep(0.1)  # Pausa quando pausado
+                
+                self.iniciar_operacao()
+                seqlock, rcu = self.seqlock, self.rcu
+                lock = self.trava_de_escrita()
+                promocao = self.usar_promocao()
+                
+                # Leitura
+                inicio_espera = time.perf_counter()
+                if seqlock is not None:
+                    obteve = seqlock.read_begin(cancelar=parada.is_set) is not None
+                elif rcu is not None:
+                    obteve = True  # leitura do RCU nunca espera
+                elif promocao:
+                    obteve = lock.try_acquire_upgradable(cancelar=parada.is_set)
+                else:
+                    obteve = lock.try_acquire_read(cancelar=parada.is_set)
+                if not obteve:
+                    self.finalizar_operacao()
+                    return
+                self.esperas['leitor'].append(time.perf_counter() - inicio_espera)
+                
+                valor = rcu.ler().valor if rcu is not None else self.dados
+                self.log_message(f"🔁 Atualizador {id} LEU valor: {valor}", "atualizador")
+                parada.wait(random.uniform(0.2, 0.8))  # Decidir
+                
+                # Escrita
+                inicio_espera = time.perf_counter()
+                if promocao:
+                    lock.upgrade()
+                else:
+                    if lock is self.lock:
+                        lock.release_read()
+                    if not lock.try_acquire_write(cancelar=parada.is_set):
+                        self.finalizar_operacao()
+                        return
+                self.esperas['escritor'].append(time.perf_counter() - inicio_espera)
+                
+                if self.dados != valor:
+                    self.stats['conflitos_atualizacao'] += 1
+                    self.log_message(f"⚠️ Atualizador {id} CONFLITO: valor mudou de {valor} para {self.dados}",
+                                     "atualizador")
+                valor_antigo = self.dados
+                if not self.escrever(lock):
+                    self.log_message(f"⛔ Atualizador {id} arrendamento REVOGADO: escrita recusada",
+                                     "atualizador")
+                    lock.release_write()
+                    self.finalizar_operacao()
+                    continue
+                self.stats['total_atualizacoes'] += 1
+                self.log_message(f"🔁 Atualizador {id} ATUALIZOU: {valor_antigo} → {self.dados}", "atualizador")
+                
+                parada.wait(random.uniform(0.2, 0.8))
+                lock.release_write()
+                self.finalizar_operacao()
+            else:
+                parada.wait(0.1)  # Pausa quando pausado
     
     # Métodos de controle da simulação
     def start_simulation(self):
@@ -1466,6 +1929,7 @@ A: Sim! Se algum teste falhar, há bug na implementação.
         
         self.running = True
         self.paused = False
+        self.parada = threading.Event()
         self.stats['tempo_inicio'] = datetime.now()
         # Reset variáveis de timing
         self.stats['tempo_pausado'] = 0
@@ -1478,18 +1942,42 @@ A: Sim! Se algum teste falhar, há bug na implementação.
         
         # Reset
         self.dados = 0
-        self.leitores_ativos = 0
+        self.politica = self.politica_var.get()
+        try:
+            arrendamento = float(self.arrendamento_var.get())
+        except ValueError:
+            messagebox.showerror("Erro", "O arrendamento deve ser um número de segundos (0 = desligado)")
+            return
+        self.fechar_trava()
+        self.lock = criar_rwlock(self.politica, arrendamento=arrendamento or None)
+        self.seqlock = SeqLock() if self.recurso_var.get() == 'seqlock' else None
+        self.rcu = RCU(self.dados) if self.recurso_var.get() == 'rcu' else None
+        self.esperas = {'leitor': [], 'escritor': []}
+        self.esperas_modelo = {'leitor': [], 'escritor': []}
+        self.esperas_classe = {classe: [] for classe in PRIORIDADES}
         self.stats['total_leituras'] = 0
         self.stats['total_escritas'] = 0
+        self.stats['total_atualizacoes'] = 0
+        self.stats['conflitos_atualizacao'] = 0
+        self.stats['leituras_pos_escrita'] = 0
+        self.stats['leituras_otimistas'] = 0
+        self.stats['otimistas_invalidadas'] = 0
+        self.stats['releituras_seqlock'] = 0
+        self.stats['max_versoes_vivas'] = 0
         self.stats['leitores_simultaneos_max'] = 0
         
         # Obter configuração
         try:
             num_leitores = int(self.leitores_var.get())
             num_escritores = int(self.escritores_var.get())
+            num_atualizadores = int(self.atualizadores_var.get())
+            self.escritores_prioritarios = int(self.escritores_prioritarios_var.get())
+            self.leitores_em_lote = int(self.leitores_em_lote_var.get())
         except ValueError:
-            messagebox.showerror("Erro", "Números de leitores e escritores devem ser inteiros válidos")
+            messagebox.showerror("Erro", "Números de leitores, escritores, atualizadores e classes "
+                                 "devem ser inteiros válidos")
             return
+        self.previsao = prever(self.config_do_modelo(num_leitores, num_escritores))
         
         # Criar threads
         self.threads = []
@@ -1504,7 +1992,20 @@ A: Sim! Se algum teste falhar, há bug na implementação.
             self.threads.append(t)
             t.start()
         
-        self.log_message(f"🚀 SIMULAÇÃO INICIADA: {num_leitores} leitores, {num_escritores} escritores")
+        for i in range(num_atualizadores):
+            t = threading.Thread(target=self.atualizador, args=(i,), daemon=True, name=f"Atualizador-{i}")
+            self.threads.append(t)
+            t.start()
+        
+        self.log_message(f"🚀 SIMULAÇÃO INICIADA: {num_leitores} leitores, {num_escritores} escritores "
+                         f"(política: {self.politica})")
+        if num_atualizadores:
+            modo = 'promoção atômica' if self.usar_promocao() else 'liberar/readquirir'
+            self.log_message(f"🔁 {num_atualizadores} atualizadores ({modo})")
+        if self.escritores_prioritarios or self.leitores_em_lote:
+            self.log_message(f"🏷️ Classes: {min(self.escritores_prioritarios, num_escritores)} escritores 'alta', "
+                             f"{min(self.leitores_em_lote, num_leitores)} leitores 'baixa'"
+                             f"{'' if self.lock.suporta_prioridade else ' (ignoradas por esta política)'}")
         
         # Atualizar botões
         self.start_btn.config(state=tk.DISABLED)
@@ -1540,8 +2041,9 @@ A: Sim! Se algum teste falhar, há bug na implementação.
             tempo_pausado = datetime.now() - self.stats['tempo_ultima_pausa']
             self.stats['tempo_pausado'] += tempo_pausado.total_seconds()
         
-        # Sinalizar parada imediata
+        # Sinalizar parada imediata (acorda atores em espera)
         self.running = False
+        self.parada.set()
         
         # Aguardar operações pendentes terminarem
         self.root.after(10, lambda: self._finalizar_parada())
@@ -1563,66 +2065,38 @@ A: Sim! Se algum teste falhar, há bug na implementação.
             self.log_message("⏸️ Simulação PAUSADA (algumas operações ainda em andamento)")
     
     def _finalizar_parada(self):
-        """Finaliza o processo de parada aguardando operações pendentes"""
-        if self.aguardar_operacoes_pendentes(timeout=3.0):
-            self.paused = False
-            self.stats['tempo_ultima_pausa'] = None
-            
-            # Liberar todos os semáforos para evitar deadlocks
-            try:
-                self.wrt.release()
-            except:
-                pass
-                
-            # Aguardar um momento para as threads terminarem
-            time.sleep(0.2)
-            
-            tempo_total = self.calcular_tempo_execucao()
-            
-            self.log_message(f"🛑 SIMULAÇÃO PARADA - Duração: {tempo_total:.1f}s")
-            self.log_message(f"📊 RESULTADO FINAL: {self.stats['total_leituras']} leituras, "
-                            f"{self.stats['total_escritas']} escritas, dados = {self.dados}")
-            
-            # Reset semáforos
-            self.mutex = threading.Semaphore(1)
-            self.wrt = threading.Semaphore(1)
-            self.leitores_ativos = 0
-            
-            # Atualizar botões
-            self.start_btn.config(state=tk.NORMAL)
-            self.pause_btn.config(state=tk.DISABLED, text="⏸️ Pausar")
-            self.stop_btn.config(state=tk.DISABLED)
-        else:
-            # Timeout - forçar parada mesmo com operações pendentes
-            self._finalizar_parada_forcada()
-    
-    def _finalizar_parada_forcada(self):
-        """Força a parada mesmo com operações em andamento"""
+        """Finaliza o processo de parada aguardando operações pendentes
+        
+        Os atores percebem a parada em no máximo rwlock.INTERVALO_CANCELAMENTO, mesmo
+        bloqueados na trava, e liberam o que adquiriram antes de sair.
+        """
+        concluida = self.aguardar_operacoes_pendentes(timeout=3.0)
         self.paused = False
         self.stats['tempo_ultima_pausa'] = None
         
-        # Liberar todos os semáforos
-        try:
-            self.wrt.release()
-        except:
-            pass
-            
         tempo_total = self.calcular_tempo_execucao()
         
-        self.log_message(f"🛑 SIMULAÇÃO PARADA (forçada) - Duração: {tempo_total:.1f}s")
+        if concluida:
+            self.log_message(f"🛑 SIMULAÇÃO PARADA - Duração: {tempo_total:.1f}s")
+        else:
+            self.log_message(f"🛑 SIMULAÇÃO PARADA (operações ainda em andamento) - Duração: {tempo_total:.1f}s")
         self.log_message(f"📊 RESULTADO FINAL: {self.stats['total_leituras']} leituras, "
                         f"{self.stats['total_escritas']} escritas, dados = {self.dados}")
         
-        # Reset semáforos
-        self.mutex = threading.Semaphore(1)
-        self.wrt = threading.Semaphore(1)
-        self.leitores_ativos = 0
+        # Reset da trava
+        self.fechar_trava()
+        self.lock = criar_rwlock(self.politica)
         
         # Atualizar botões
         self.start_btn.config(state=tk.NORMAL)
         self.pause_btn.config(state=tk.DISABLED, text="⏸️ Pausar")
         self.stop_btn.config(state=tk.DISABLED)
     
+    def fechar_trava(self):
+        """Encerra o monitor de arrendamento da trava atual, se houver"""
+        if isinstance(self.lock, RWLockArrendamento):
+            self.lock.fechar()
+    
     def reset_simulation(self):
         """Reset completo"""
         self.stop_simulation()
@@ -1630,7 +2104,9 @@ A: Sim! Se algum teste falhar, há bug na implementação.
         
         # Reset dados
         self.dados = 0
-        self.leitores_ativos = 0
+        self.esperas = {'leitor': [], 'escritor': []}
+        self.esperas_modelo = {'leitor': [], 'escritor': []}
+        self.esperas_classe = {classe: [] for classe in PRIORIDADES}
         
         # Reset estatísticas
         for key in self.stats:
@@ -1653,6 +2129,11 @@ A: Sim! Se algum teste falhar, há bug na implementação.
             config = self.configuracoes[config_nome]
             self.leitores_var.set(str(config['num_leitores']))
             self.escritores_var.set(str(config['num_escritores']))
+            self.politica_var.set(config.get('politica', 'leitores'))
+            self.escritores_prioritarios_var.set(str(config.get('escritores_prioritarios', 0)))
+            self.leitores_em_lote_var.set(str(config.get('leitores_em_lote', 0)))
+            intervalo = (config['delay_min'], config['delay_max'])
+            self.tempos.update(delay_leitor=intervalo, delay_escritor=intervalo)
     
     def aplicar_configuracao(self):
         """Aplica configuração selecionada"""
@@ -1825,6 +2306,10 @@ A: Sim! Se algum teste falhar, há bug na implementação.
         try:
             self.leitores_var.set(self.custom_leitores.get())
             self.escritores_var.set(self.custom_escritores.get())
+            intervalo = (float(self.custom_delay_min.get()), float(self.custom_delay_max.get()))
+            leitura, escrita = float(self.custom_tempo_leitura.get()), float(self.custom_tempo_escrita.get())
+            self.tempos.update(delay_leitor=intervalo, delay_escritor=intervalo,
+                               tempo_leitura=(leitura, leitura), tempo_escrita=(escrita, escrita))
             
             self.log_message("🎨 Configuração personalizada aplicada")
             
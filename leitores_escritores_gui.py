@@ -5,6 +5,7 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext
 from datetime import datetime
 import queue
+from rwlock import RWLock, SeqLock
 
 class LeitoresEscritoresGUI:
     def __init__(self, root):
@@ -16,15 +17,18 @@ class LeitoresEscritoresGUI:
         self.dados = 0
         
         # Controle de concorrência
-        self.mutex = threading.Semaphore(1)
-        self.wrt = threading.Semaphore(1)
-        self.leitores_ativos = 0
+        self.lock = RWLock()
+        self.seqlock = None  # SeqLock quando marcado "Seqlock" (leitores sem trava)
         
         # Controle de threads
         self.threads = []
         self.running = False
         self.paused = False
         
+        # Sinal de parada: acorda atores em delays e esperas pela trava
+        self.parada = threading.Event()
+        self.parada.set()
+        
         # Queue para comunicação thread-safe com a GUI
         self.message_queue = queue.Queue()
         
@@ -33,6 +37,7 @@ class LeitoresEscritoresGUI:
             'total_leituras': 0,
             'total_escritas': 0,
             'leitores_simultaneos_max': 0,
+            'releituras': 0,
             'tempo_inicio': None
         }
         
@@ -56,6 +61,9 @@ class LeitoresEscritoresGUI:
         self.escritores_var = tk.StringVar(value="2")
         ttk.Spinbox(config_frame, from_=1, to=10, textvariable=self.escritores_var, width=5).grid(row=0, column=3)
         
+        self.usar_seqlock = tk.BooleanVar(value=False)
+        ttk.Checkbutton(config_frame, text="Seqlock", variable=self.usar_seqlock).grid(row=0, column=4, padx=(20, 0))
+        
         # Controles
         control_frame = ttk.Frame(main_frame)
         control_frame.grid(row=1, column=0, columnspan=2, pady=10)
@@ -122,7 +130,7 @@ class LeitoresEscritoresGUI:
         
         # Atualizar labels
         self.dados_label.config(text=str(self.dados))
-        self.leitores_label.config(text=str(self.leitores_ativos))
+        self.leitores_label.config(text=str(self.lock.leitores_ativos))
         
         # Atualizar estatísticas
         self.update_stats_display()
@@ -141,7 +149,8 @@ class LeitoresEscritoresGUI:
 Total Leituras: {self.stats['total_leituras']}
 Total Escritas: {self.stats['total_escritas']}
 Leitores Máx: {self.stats['leitores_simultaneos_max']}
-Leitores Atual: {self.leitores_ativos}
+Leitores Atual: {self.lock.leitores_ativos}
+Releituras (seqlock): {self.stats['releituras']}
 Status: {'Executando' if self.running else 'Parado'}"""
         
         self.stats_text.delete(1.0, tk.END)
@@ -149,51 +158,72 @@ Status: {'Executando' if self.running else 'Parado'}"""
     
     def leitor(self, id):
         """Função do leitor com interface"""
-        while self.running:
+        parada = self.parada
+        while not parada.is_set():
             if not self.paused:
-                time.sleep(random.uniform(0.5, 2))
+                if parada.wait(random.uniform(0.5, 2)):
+                    return
                 
-                self.mutex.acquire()
-                self.leitores_ativos += 1
-                if self.leitores_ativos == 1:
-                    self.wrt.acquire()  # primeiro leitor bloqueia escritores
+                seqlock = self.seqlock
+                if seqlock is not None:
+                    self.ler_seqlock(id, seqlock, parada)
+                    continue
                 
-                # Atualizar estatística de máximo
-                if self.leitores_ativos > self.stats['leitores_simultaneos_max']:
-                    self.stats['leitores_simultaneos_max'] = self.leitores_ativos
+                lock = self.lock
+                leitores = lock.try_acquire_read(cancelar=parada.is_set)
+                if not leitores:
+                    return  # simulação parada durante a espera
                 
-                self.mutex.release()
+                # Atualizar estatística de máximo
+                if leitores > self.stats['leitores_simultaneos_max']:
+                    self.stats['leitores_simultaneos_max'] = leitores
                 
                 # Leitura
                 valor_lido = self.dados
                 self.log_message(f"📘 Leitor {id} está lendo o valor: {valor_lido}")
                 self.stats['total_leituras'] += 1
-                time.sleep(random.uniform(0.5, 1.5))
+                parada.wait(random.uniform(0.5, 1.5))
                 
-                self.mutex.acquire()
-                self.leitores_ativos -= 1
-                if self.leitores_ativos == 0:
-                    self.wrt.release()  # último leitor libera escritores
-                self.mutex.release()
+                lock.release_read()
             else:
-                time.sleep(0.1)  # Pequena pausa quando pausado
+                parada.wait(0.1)  # Pequena pausa quando pausado
+    
+    def ler_seqlock(self, id, seqlock, parada):
+        """Leitura sem trava: repete enquanto um escritor interferir"""
+        while not parada.is_set():
+            sequencia = seqlock.read_begin(cancelar=parada.is_set)
+            if sequencia is None:
+                return
+            valor_lido = self.dados
+            parada.wait(random.uniform(0.5, 1.5))
+            if not seqlock.read_retry(sequencia):
+                self.log_message(f"📘 Leitor {id} leu (seqlock) o valor: {valor_lido}")
+                self.stats['total_leituras'] += 1
+                return
+            self.stats['releituras'] += 1
+            self.log_message(f"🔄 Leitor {id} relê: escritor interveio")
     
     def escritor(self, id):
         """Função do escritor com interface"""
-        while self.running:
+        parada = self.parada
+        while not parada.is_set():
             if not self.paused:
-                time.sleep(random.uniform(1, 3))
-                self.wrt.acquire()
+                if parada.wait(random.uniform(1, 3)):
+                    return
+                
+                lock = self.seqlock if self.seqlock is not None else self.lock
+                if not lock.try_acquire_write(cancelar=parada.is_set):
+                    return  # simulação parada durante a espera
                 
                 # Escrita
                 self.dados += 1
                 self.log_message(f"✍️ Escritor {id} escreveu o valor: {self.dados}")
                 self.stats['total_escritas'] += 1
-                time.sleep(random.uniform(0.5, 1.5))
+                parada.wait(random.uniform(0.5, 1.5))
                 
-                self.wrt.release()
+                lock.release_write()
             else:
-                time.sleep(0.1)  # Pequena pausa quando pausado
+                parada.wait(0.1)  # Pequena pausa quando pausado
     
     def start_simulation(self):
         """Inicia a simulação"""
@@ -202,14 +232,16 @@ Status: {'Executando' if self.running else 'Parado'}"""
             
         self.running = True
         self.paused = False
+        self.parada = threading.Event()
         self.stats['tempo_inicio'] = datetime.now()
         
         # Resetar dados
         self.dados = 0
-        self.leitores_ativos = 0
         self.stats['total_leituras'] = 0
         self.stats['total_escritas'] = 0
         self.stats['leitores_simultaneos_max'] = 0
+        self.stats['releituras'] = 0
+        self.seqlock = SeqLock() if self.usar_seqlock.get() else None
         
         num_leitores = int(self.leitores_var.get())
         num_escritores = int(self.escritores_var.get())
@@ -247,16 +279,15 @@ Status: {'Executando' if self.running else 'Parado'}"""
         """Para a simulação"""
         self.running = False
         self.paused = False
+        self.parada.set()
         
         self.log_message("🛑 Simulação parada")
         
         # Limpar threads
         self.threads.clear()
         
-        # Resetar semáforos
-        self.mutex = threading.Semaphore(1)
-        self.wrt = threading.Semaphore(1)
-        self.leitores_ativos = 0
+        # Resetar trava
+        self.lock = RWLock()
         
         # Atualizar botões
         self.start_btn.config(state=tk.NORMAL)
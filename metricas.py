@@ -0,0 +1,26 @@
+"""
+Métricas de desempenho das simulações
+Funções auxiliares para resumir tempos de espera pela trava
+"""
+import math
+
+
+def percentil(valores, p):
+    """Retorna o percentil p (0-100) dos valores (método nearest-rank)"""
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    indice = max(0, math.ceil(p / 100 * len(ordenados)) - 1)
+    return ordenados[indice]
+
+
+def resumo_esperas(esperas):
+    """Resume tempos de espera: quantidade, média, p99 e máximo (em segundos)"""
+    if not esperas:
+        return {'quantidade': 0, 'media': 0.0, 'p99': 0.0, 'maximo': 0.0}
+    return {
+        'quantidade': len(esperas),
+        'media': sum(esperas) / len(esperas),
+        'p99': percentil(esperas, 99),
+        'maximo': max(esperas)
+    }
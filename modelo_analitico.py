@@ -0,0 +1,323 @@
+"""
+Modelo analítico de filas
+Prevê, a partir dos tempos de configuracoes.py, a vazão, a ocupação da trava
+e as esperas médias de leitores e escritores, sem simular. Cada ator é uma
+fonte finita (pensa, espera a trava, usa a trava); as esperas saem de um
+ponto fixo iterativo:
+
+- escritor atrás de outros escritores: resíduo da escrita em andamento e
+  os escritores que já aguardam (população finita);
+- escritor atrás de leitores: com preferência para leitores, o período
+  ocupado dos leitores sozinhos (M/G/inf), e cada escritor à frente custa
+  sua escrita mais o lote de leitores que chegou durante ela (que só
+  emenda em novo período ocupado se algum leitor do lote voltar antes de
+  o lote terminar); nas demais políticas, o maior resíduo dos leitores
+  presentes;
+- leitor: resíduo da escrita em andamento; com preferência para escritores,
+  o período ocupado dos escritores; na fila justa, a escrita que já aguarda.
+
+A política 'prioridade' usa a regra equivalente às classes dos atores.
+Com partições, cada uma recebe a fração dos acessos da distribuição de
+chaves e a espera é a média ponderada pelas partições. Comparar a
+previsão com o medido mostra se a lentidão vem da trava (espera alta) ou
+da própria carga (tempos de espera e de uso)
+"""
+import argparse
+import math
+from motor_eventos import MODELOS
+from rwlock import PRIORIDADES
+from particoes import EXPOENTE_ZIPF
+from configuracoes import get_config, CONFIGURACOES
+
+# Fração do ciclo gasta esperando a trava acima da qual ela é o gargalo
+LIMIAR_GARGALO = 0.2
+
+# Espera prevista, em ciclos do próprio ator (pensar + usar), acima da qual
+# ele praticamente não entra: a previsão vira inanição (espera infinita)
+LIMITE_INANICAO = 1e5
+
+# Métricas comparadas com o medido: (previsão, chave do resultado de simular())
+COMPARACOES = [
+    ('leituras_por_s', 'leituras_por_s'),
+    ('escritas_por_s', 'escritas_por_s'),
+    ('espera_leitor', 'espera_leitor'),
+    ('espera_escritor', 'espera_escritor')
+]
+
+
+def _media(config, chave, escala_tempo):
+    """Média do tempo uniforme entre <chave>_min e <chave>_max"""
+    return (config[f'{chave}_min'] + config[f'{chave}_max']) / 2 * escala_tempo
+
+
+def _residuo(config, chave, escala_tempo):
+    """Tempo restante médio visto por quem chega durante o uso: E[S²] / 2E[S]"""
+    a = config[f'{chave}_min'] * escala_tempo
+    b = config[f'{chave}_max'] * escala_tempo
+    if a + b == 0:
+        return 0.0
+    return (a * a + a * b + b * b) / 3 / (a + b)
+
+
+def _maior_residuo(config, chave, escala_tempo, n, pontos=48):
+    """Maior tempo restante médio entre `n` usos em andamento: E[max R] por integração
+
+    O resíduo R de um uso uniforme em [a, b] tem densidade (1 - F(x)) / E[S].
+    """
+    a = config[f'{chave}_min'] * escala_tempo
+    b = config[f'{chave}_max'] * escala_tempo
+    if b == 0:
+        return 0.0
+    media = (a + b) / 2
+
+    def acumulada(x):
+        if x <= a:
+            return x / media
+        return (a + ((b - a) ** 2 - (b - x) ** 2) / (2 * (b - a))) / media
+
+    passo = b / pontos
+    n = max(1.0, n)
+    return sum(1 - acumulada((i + 0.5) * passo) ** n for i in range(pontos)) * passo
+
+
+def _uniforme(config, chave, escala_tempo, pontos=24):
+    """Pontos médios de uma grade sobre o tempo uniforme <chave>"""
+    a = config[f'{chave}_min'] * escala_tempo
+    b = config[f'{chave}_max'] * escala_tempo
+    return [a + (b - a) * (i + 0.5) / pontos for i in range(pontos)]
+
+
+def _chance_de_retorno(config, escala_tempo, presentes):
+    """Chance de algum leitor de um lote voltar antes de o lote terminar"""
+    pensa = _uniforme(config, 'delay_leitor', escala_tempo)
+    leitura = _uniforme(config, 'tempo_leitura', escala_tempo)
+    a, b = leitura[0], leitura[-1]
+
+    def acumulada(x):
+        return min(1.0, max(0.0, (x - a) / (b - a))) if b > a else float(x >= a)
+
+    n = max(1.0, presentes)
+    volta = sum(1 - acumulada(t + s) ** n for t in pensa for s in leitura)
+    volta /= len(pensa) * len(leitura)
+    return 1 - (1 - volta) ** n
+
+
+def fracoes_de_acesso(config):
+    """Fração dos acessos de cada partição (pesos de particoes.criar_sorteador)"""
+    shards = config.get('num_shards', 1)
+    distribuicao = config.get('distribuicao_chaves', 'uniforme')
+    if distribuicao == 'uniforme':
+        return [1 / shards] * shards
+    if distribuicao == 'zipf':
+        pesos = [1 / (k + 1) ** EXPOENTE_ZIPF for k in range(shards)]
+        return [peso / sum(pesos) for peso in pesos]
+    raise ValueError(f"Distribuição desconhecida: {distribuicao}")
+
+
+def _regra(config, modelo):
+    """Regra de admissão equivalente; na 'prioridade', pelas classes dos atores
+
+    Se toda classe de escritor supera toda classe de leitor, a prioridade
+    age como preferência para escritores (e vice-versa); classes misturadas
+    ficam com a ordem de chegada.
+    """
+    if modelo != 'prioridade':
+        return modelo
+    leitores, escritores = config['num_leitores'], config['num_escritores']
+    em_lote = min(config.get('leitores_em_lote', 0), leitores)
+    prioritarios = min(config.get('escritores_prioritarios', 0), escritores)
+    classes_l = ([PRIORIDADES['baixa']] * (em_lote > 0) +
+                 [PRIORIDADES['normal']] * (leitores > em_lote))
+    classes_e = ([PRIORIDADES['alta']] * (prioritarios > 0) +
+                 [PRIORIDADES['normal']] * (escritores > prioritarios))
+    if not (classes_l and classes_e):
+        return 'justa'
+    if min(classes_e) > max(classes_l):
+        return 'escritores'
+    if min(classes_l) > max(classes_e):
+        return 'leitores'
+    return 'justa'
+
+
+def _busy(presenca, atores, pensa, fracao, residuo_unitario):
+    """Espera média até a partição ficar livre de uma classe que entra sem ser retida
+
+    `presenca` é a chance de um ator estar na partição; o período ocupado
+    (M/G/inf) vem da taxa de chegada com todos pensando. Quem chega espera o
+    resto do período: o de uma única presença (`residuo_unitario`) se ninguém
+    mais entra durante ela, o período inteiro se as presenças se emendam.
+    """
+    ocupacao = 1 - (1 - presenca) ** atores
+    if ocupacao >= 1 or pensa == 0:
+        return math.inf
+    chegadas = atores * fracao / pensa
+    if not chegadas:
+        return 0.0
+    periodo = ocupacao / (chegadas * (1 - ocupacao))
+    emenda = 1 - (1 - presenca) ** (atores - 1)
+    return ocupacao * ((1 - emenda) * min(residuo_unitario, periodo) + emenda * periodo)
+
+
+def prever(config, escala_tempo=1.0, iteracoes=500, tolerancia=1e-9):
+    """Previsão analítica para a configuração
+
+    Retorna vazões (por segundo), ocupação da partição mais disputada por
+    leitores e por escritores, esperas médias (segundos), a fração do
+    ciclo de cada ator gasta esperando e o gargalo provável ('trava' ou
+    'carga'). Esperas infinitas indicam inanição, inclusive as que passam de
+    LIMITE_INANICAO ciclos do ator. `convergiu` falso marca uma previsão em
+    que o ponto fixo não se estabilizou em `iteracoes` passos.
+    """
+    politica = config.get('politica', 'leitores')
+    if politica not in MODELOS:
+        raise ValueError(f"Política desconhecida: {politica}")
+    modelo = _regra(config, MODELOS[politica])
+    leitores, escritores = config['num_leitores'], config['num_escritores']
+    fracoes = fracoes_de_acesso(config)
+    pensa_l = _media(config, 'delay_leitor', escala_tempo)
+    pensa_e = _media(config, 'delay_escritor', escala_tempo)
+    leitura = _media(config, 'tempo_leitura', escala_tempo)
+    escrita = _media(config, 'tempo_escrita', escala_tempo)
+    residuo_l = _residuo(config, 'tempo_leitura', escala_tempo)
+    residuo_e = _residuo(config, 'tempo_escrita', escala_tempo)
+    outros = (escritores - 1) / escritores if escritores else 0.0
+
+    # Esperas por partição; a espera de um ator é a média ponderada pelos acessos
+    esperas_l = [0.0] * len(fracoes)
+    esperas_e = [0.0] * len(fracoes)
+    ocupacoes = [(0.0, 0.0)] * len(fracoes)
+    retornos = [_chance_de_retorno(config, escala_tempo, leitores * f) for f in fracoes]
+    convergiu = False
+    for iteracao in range(1, iteracoes + 1):
+        espera_l = sum(f * w for f, w in zip(fracoes, esperas_l))
+        espera_e = sum(f * w for f, w in zip(fracoes, esperas_e))
+        ciclo_l, ciclo_e = pensa_l + espera_l + leitura, pensa_e + espera_e + escrita
+        vazao_e = escritores / ciclo_e if ciclo_e else 0.0
+
+        novas_l, novas_e = [], []
+        for k, f in enumerate(fracoes):
+            # Chance de cada leitor estar lendo nesta partição
+            lendo = leitura / ciclo_l * f if ciclo_l else 0.0
+            ocupacao_l = 1 - (1 - lendo) ** leitores
+            ocupacao_e = min(vazao_e * escrita * f, 0.999)
+            ocupacoes[k] = (ocupacao_l, ocupacao_e)
+
+            # Escritor atrás de leitores: com preferência para leitores, eles
+            # não são retidos e o escritor espera o período ocupado deles
+            if modelo == 'leitores':
+                presenca = leitura / (pensa_l + leitura) * f
+                espera_leitores = _busy(presenca, leitores, pensa_l, f, residuo_l)
+            else:
+                presentes = leitores * lendo / ocupacao_l if ocupacao_l else 0.0
+                # Leitores só estão presentes quando nenhum outro escritor escreve
+                com_leitores = min(ocupacao_l, 1 - ocupacao_e * outros)
+                espera_leitores = com_leitores * _maior_residuo(config, 'tempo_leitura',
+                                                                escala_tempo, presentes)
+            # Escritor atrás de outros escritores: o que escreve (resíduo) e
+            # os que aguardam, cada um com sua escrita e, sem preferência, sua
+            # espera por leitores (com preferência para leitores, o lote que
+            # chegou durante a escrita anterior)
+            aguardando_e = vazao_e * f * esperas_e[k] * outros
+            if modelo == 'leitores':
+                chega_um = min(1.0, escrita / pensa_l) if pensa_l else 1.0
+                chegam = 1 - (1 - chega_um) ** (leitores * f)
+                por_escritor = escrita + chegam * (leitura + retornos[k] * espera_leitores)
+            else:
+                retido = 0.0 if modelo == 'escritores' else espera_leitores
+                por_escritor = escrita + retido
+            novas_e.append(ocupacao_e * outros * residuo_e + aguardando_e * por_escritor +
+                           espera_leitores)
+
+            # Leitor: escrita em andamento; com preferência para escritores, o
+            # período ocupado dos escritores; na fila justa, a escrita que já aguarda
+            if modelo == 'escritores':
+                presenca = (esperas_e[k] + escrita) / ciclo_e * f if ciclo_e else 0.0
+                novas_l.append(_busy(presenca, escritores, pensa_e, f,
+                                     esperas_e[k] / 2 + residuo_e))
+            else:
+                nova_l = ocupacao_e * residuo_e
+                if modelo != 'leitores':
+                    aguardando = min(1.0, vazao_e * f * esperas_e[k])
+                    nova_l += aguardando * (esperas_e[k] / 2 + escrita)
+                novas_l.append(nova_l)
+
+        if any(math.isinf(w) for w in novas_l + novas_e):
+            esperas_l = [math.inf if math.isinf(w) else w for w in novas_l]
+            esperas_e = [math.inf if math.isinf(w) else w for w in novas_e]
+            convergiu = True  # inanição é a resposta, não falta de convergência
+            break
+        variacao = sum(abs(a - b) for a, b in zip(novas_l + novas_e, esperas_l + esperas_e))
+        # Amortecimento para o ponto fixo não oscilar
+        esperas_l = [(a + b) / 2 for a, b in zip(esperas_l, novas_l)]
+        esperas_e = [(a + b) / 2 for a, b in zip(esperas_e, novas_e)]
+        if variacao < tolerancia:
+            convergiu = True
+            break
+
+    espera_l = sum(f * w for f, w in zip(fracoes, esperas_l))
+    espera_e = sum(f * w for f, w in zip(fracoes, esperas_e))
+    if espera_l > LIMITE_INANICAO * (pensa_l + leitura):
+        espera_l = math.inf
+    if espera_e > LIMITE_INANICAO * (pensa_e + escrita):
+        espera_e = math.inf
+    ciclo_l, ciclo_e = pensa_l + espera_l + leitura, pensa_e + espera_e + escrita
+    fracao_l = (espera_l / ciclo_l if ciclo_l and not math.isinf(espera_l)
+                else float(espera_l > 0))
+    fracao_e = (espera_e / ciclo_e if ciclo_e and not math.isinf(espera_e)
+                else float(espera_e > 0))
+    return {
+        'leituras_por_s': leitores / ciclo_l if ciclo_l else 0.0,
+        'escritas_por_s': escritores / ciclo_e if ciclo_e else 0.0,
+        'ocupacao_leitores': max(o[0] for o in ocupacoes),
+        'ocupacao_escritores': max(o[1] for o in ocupacoes),
+        'espera_leitor': espera_l,
+        'espera_escritor': espera_e,
+        'fracao_espera_leitor': fracao_l,
+        'fracao_espera_escritor': fracao_e,
+        'gargalo': 'trava' if max(fracao_l, fracao_e) > LIMIAR_GARGALO else 'carga',
+        'iteracoes': iteracao,
+        'convergiu': convergiu
+    }
+
+
+def comparar(previsao, resultado):
+    """Pares {métrica: (previsto, medido)} com as esperas médias medidas"""
+    pares = {}
+    for chave, medida in COMPARACOES:
+        medido = resultado[medida]
+        if isinstance(medido, dict):
+            medido = medido['media']
+        pares[chave] = (previsao[chave], medido)
+    return pares
+
+
+def main():
+    from motor_eventos import simular
+
+    parser = argparse.ArgumentParser(
+        description="Previsão analítica x simulação por eventos")
+    parser.add_argument('--configs', nargs='+', default=list(CONFIGURACOES.keys()),
+                        choices=list(CONFIGURACOES.keys()))
+    parser.add_argument('--politica', choices=list(MODELOS.keys()),
+                        help="sobrescreve a política")
+    parser.add_argument('--duracao', type=float, default=3600.0, help="segundos simulados")
+    args = parser.parse_args()
+
+    print("=" * 98)
+    print("MODELO ANALÍTICO x SIMULAÇÃO POR EVENTOS (previsto / medido)")
+    print("=" * 98)
+    print(f"{'Configuração':<26}{'Leituras/s':>16}{'Escritas/s':>16}{'Espera L (s)':>16}"
+          f"{'Espera E (s)':>16}  Gargalo")
+    for nome in args.configs:
+        config = get_config(nome)
+        if args.politica:
+            config['politica'] = args.politica
+        previsao = prever(config)
+        pares = comparar(previsao, simular(config, args.duracao, semente=0))
+        colunas = ''.join(f"{f'{p:.2f} / {m:.2f}':>16}" for p, m in pares.values())
+        aviso = '' if previsao['convergiu'] else ' (não convergiu)'
+        print(f"{nome:<26}{colunas}  {previsao['gargalo']}{aviso}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Motor de simulação com corrotinas (asyncio)
+Cada leitor e escritor é uma corrotina em um único event loop, em vez de uma
+thread do sistema; assim a simulação comporta dezenas de milhares de atores
+"""
+import argparse
+import asyncio
+import random
+import time
+from rwlock_async import RWLockAsync, POLITICAS_ASYNC
+from particoes import criar_sorteador
+from metricas import resumo_esperas
+from configuracoes import get_config, CONFIGURACOES
+
+
+async def _simular(config, duracao, escala_tempo, semente):
+    """Corpo assíncrono de simular()"""
+    num_shards = config.get('num_shards', 1)
+    distribuicao = config.get('distribuicao_chaves', 'uniforme')
+    dados = [0] * num_shards
+    locks = [RWLockAsync(config.get('politica', 'leitores')) for _ in range(num_shards)]
+    esperas = {'leitor': [], 'escritor': []}
+    contagem = {'leituras': 0, 'escritas': 0, 'leitores_simultaneos_max': 0}
+
+    def tempo(chave, rng):
+        return rng.uniform(config[f'{chave}_min'], config[f'{chave}_max']) * escala_tempo
+
+    async def leitor(id):
+        rng = random.Random(semente + id)
+        sortear = criar_sorteador(distribuicao, num_shards, rng)
+        while True:
+            await asyncio.sleep(tempo('delay_leitor', rng))
+            lock = locks[sortear()]
+            inicio_espera = time.perf_counter()
+            async with lock.read():
+                esperas['leitor'].append(time.perf_counter() - inicio_espera)
+                contagem['leitores_simultaneos_max'] = max(contagem['leitores_simultaneos_max'],
+                                                           lock.leitores_ativos)
+                await asyncio.sleep(tempo('tempo_leitura', rng))
+            contagem['leituras'] += 1
+
+    async def escritor(id):
+        rng = random.Random(semente + 1000000 + id)
+        sortear = criar_sorteador(distribuicao, num_shards, rng)
+        while True:
+            await asyncio.sleep(tempo('delay_escritor', rng))
+            shard = sortear()
+            inicio_espera = time.perf_counter()
+            async with locks[shard].write():
+                esperas['escritor'].append(time.perf_counter() - inicio_espera)
+                await asyncio.sleep(tempo('tempo_escrita', rng))
+                dados[shard] += 1
+            contagem['escritas'] += 1
+
+    tarefas = [asyncio.create_task(leitor(i)) for i in range(config['num_leitores'])]
+    tarefas += [asyncio.create_task(escritor(i)) for i in range(config['num_escritores'])]
+    inicio = time.perf_counter()
+    await asyncio.sleep(duracao)
+    # Cancelar os atores: as seções em andamento saem pelos context managers
+    for tarefa in tarefas:
+        tarefa.cancel()
+    await asyncio.gather(*tarefas, return_exceptions=True)
+    decorrido = time.perf_counter() - inicio
+
+    return {
+        'atores': len(tarefas),
+        'num_shards': num_shards,
+        'duracao': decorrido,
+        'leituras': contagem['leituras'],
+        'escritas': contagem['escritas'],
+        'leituras_por_s': contagem['leituras'] / decorrido,
+        'escritas_por_s': contagem['escritas'] / decorrido,
+        'leitores_simultaneos_max': contagem['leitores_simultaneos_max'],
+        'espera_leitor': resumo_esperas(esperas['leitor']),
+        'espera_escritor': resumo_esperas(esperas['escritor']),
+        'total': sum(dados),
+        'travas_livres': all(not lock.escritor_ativo and lock.leitores_ativos == 0 for lock in locks)
+    }
+
+
+def simular(config, duracao=None, escala_tempo=1.0, semente=None):
+    """Executa leitores e escritores como corrotinas em um event loop próprio
+
+    Mesmos campos de configuração e métricas de particoes.simular(); os
+    atores são cancelados ao fim de `duracao` segundos. Políticas sem
+    versão assíncrona (ver rwlock_async.POLITICAS_ASYNC) geram ValueError.
+    """
+    duracao = config['duracao_teste'] if duracao is None else duracao
+    semente = random.randrange(2 ** 32) if semente is None else semente
+    politica = config.get('politica', 'leitores')
+    if politica not in POLITICAS_ASYNC:
+        raise ValueError(f"Política sem versão assíncrona: {politica}")
+    return asyncio.run(_simular(config, duracao, escala_tempo, semente))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulação leitores-escritores com asyncio")
+    parser.add_argument('--config', default='padrao', choices=list(CONFIGURACOES.keys()))
+    parser.add_argument('--leitores', type=int, help="sobrescreve num_leitores")
+    parser.add_argument('--escritores', type=int, help="sobrescreve num_escritores")
+    parser.add_argument('--politica', choices=list(POLITICAS_ASYNC), help="sobrescreve a política")
+    parser.add_argument('--duracao', type=float, help="segundos (padrão: duracao_teste)")
+    parser.add_argument('--escala-tempo', type=float, default=1.0,
+                        help="fator aplicado aos tempos da configuração")
+    args = parser.parse_args()
+
+    config = get_config(args.config)
+    if args.leitores is not None:
+        config['num_leitores'] = args.leitores
+    if args.escritores is not None:
+        config['num_escritores'] = args.escritores
+    if args.politica:
+        config['politica'] = args.politica
+
+    print("=" * 60)
+    print(f"SIMULAÇÃO ASYNCIO - {config['num_leitores']} leitores, "
+          f"{config['num_escritores']} escritores (configuração '{args.config}')")
+    print("=" * 60)
+    r = simular(config, args.duracao, args.escala_tempo)
+    print(f"Duração: {r['duracao']:.1f}s")
+    print(f"Leituras: {r['leituras']:,} ({r['leituras_por_s']:.1f}/s)")
+    print(f"Escritas: {r['escritas']:,} ({r['escritas_por_s']:.1f}/s)")
+    print(f"Leitores simultâneos (máx): {r['leitores_simultaneos_max']}")
+    print(f"Espera p99 leitor/escritor: {r['espera_leitor']['p99'] * 1000:.1f} / "
+          f"{r['espera_escritor']['p99'] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
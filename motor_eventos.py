@@ -0,0 +1,253 @@
+"""
+Motor de simulação por eventos discretos (tempo virtual)
+Leitores e escritores são geradores que cedem pedidos ao motor: esperar um
+tempo ou obter a trava. Uma fila de prioridade de eventos avança um relógio
+virtual direto para o próximo evento, então horas de carga simulada levam
+milissegundos. Usa o mesmo modelo de configuracoes.py (tempos, política,
+partições e classes de prioridade)
+"""
+import argparse
+import heapq
+import itertools
+import random
+import time
+from rwlock import PRIORIDADES
+from particoes import criar_sorteador
+from metricas import resumo_esperas
+from configuracoes import get_config, CONFIGURACOES
+
+# Regra de admissão usada para cada política de rwlock.POLITICAS. As travas
+# sobre uma Condition retêm leitores quando há escritor aguardando, como a
+# preferência para escritores; leitura otimista e slots não mudam quem espera
+MODELOS = {
+    'leitores': 'leitores',
+    'escritores': 'escritores',
+    'justa': 'justa',
+    'condicao': 'escritores',
+    'otimista': 'escritores',
+    'slots': 'escritores',
+    'adaptativa': 'escritores',
+    'prioridade': 'prioridade'
+}
+
+# Pedidos de trava que os atores cedem ao motor (um número é uma espera)
+LEITURA = 'leitura'
+ESCRITA = 'escrita'
+
+
+class TravaVirtual:
+    """Trava leitores-escritores em tempo virtual
+
+    Guarda os pedidos pendentes e, a cada chegada ou saída, concede o que a
+    regra da política permite, percorrendo os pendentes na ordem de
+    atendimento: leitores antes ('leitores'), escritores antes
+    ('escritores'), chegada ('justa') ou prioridade efetiva com
+    envelhecimento ('prioridade'). Quem é atendido é retomado pelo motor no
+    instante atual.
+    """
+
+    def __init__(self, motor, politica='leitores', envelhecimento=1.0):
+        if politica not in MODELOS:
+            raise ValueError(f"Política desconhecida: {politica}")
+        self.motor = motor
+        self.modelo = MODELOS[politica]
+        self.envelhecimento = envelhecimento
+        self.leitores_ativos = 0
+        self.escritor_ativo = False
+        self.pendentes = []  # (ordem, tipo, ator, prioridade, chegada)
+        self.ordem = itertools.count()
+
+    def pedir(self, tipo, ator, prioridade=PRIORIDADES['normal']):
+        """Registra o pedido do ator e concede o que for possível"""
+        self.pendentes.append((next(self.ordem), tipo, ator, prioridade, self.motor.agora))
+        self._conceder()
+
+    def liberar(self, tipo):
+        """Saída do leitor ou escritor"""
+        if tipo == LEITURA:
+            self.leitores_ativos -= 1
+        else:
+            self.escritor_ativo = False
+        self._conceder()
+
+    def _ordenados(self):
+        """Pendentes na ordem de atendimento da política"""
+        if self.modelo == 'leitores':
+            return sorted(self.pendentes, key=lambda p: (p[1] != LEITURA, p[0]))
+        if self.modelo == 'escritores':
+            return sorted(self.pendentes, key=lambda p: (p[1] != ESCRITA, p[0]))
+        if self.modelo == 'prioridade':
+            agora = self.motor.agora
+            return sorted(self.pendentes, reverse=True,
+                          key=lambda p: (p[3] + (agora - p[4]) / self.envelhecimento, -p[0]))
+        return self.pendentes
+
+    def _conceder(self):
+        concedidos = []
+        retidos = False  # escritor aguardando retém os leitores atrás dele
+        for pedido in self._ordenados():
+            tipo = pedido[1]
+            if tipo == LEITURA:
+                if self.escritor_ativo or retidos:
+                    if self.modelo == 'justa':
+                        break
+                    continue
+                self.leitores_ativos += 1
+                concedidos.append(pedido)
+            else:
+                if not (self.escritor_ativo or self.leitores_ativos):
+                    self.escritor_ativo = True
+                    concedidos.append(pedido)
+                if self.modelo in ('justa', 'prioridade'):
+                    break  # ninguém passa à frente de um escritor na fila
+                retidos = self.modelo == 'escritores'
+        for pedido in concedidos:
+            self.pendentes.remove(pedido)
+            self.motor.retomar(pedido[2])
+
+
+class MotorEventos:
+    """Fila de eventos com relógio virtual
+
+    Cada ator é um gerador; o que ele cede decide quando é retomado: um
+    número agenda a retomada após esse tempo virtual, e um pedido
+    (trava, tipo, prioridade) o suspende até a trava concedê-lo.
+    """
+
+    def __init__(self):
+        self.agora = 0.0
+        self.eventos = []            # heap de (instante, sequência, ator)
+        self.sequencia = itertools.count()
+        self.processados = 0
+
+    def iniciar(self, ator):
+        """Registra um ator (gerador) para começar no instante atual"""
+        self.retomar(ator)
+
+    def retomar(self, ator, atraso=0.0):
+        """Agenda a retomada do ator"""
+        heapq.heappush(self.eventos, (self.agora + atraso, next(self.sequencia), ator))
+
+    def executar(self, ate):
+        """Processa eventos até o instante virtual `ate`"""
+        while self.eventos and self.eventos[0][0] <= ate:
+            self.agora, _, ator = heapq.heappop(self.eventos)
+            self.processados += 1
+            pedido = next(ator, None)
+            if pedido is None:
+                continue  # ator terminou
+            if isinstance(pedido, tuple):
+                trava, tipo, prioridade = pedido
+                trava.pedir(tipo, ator, prioridade)
+            else:
+                self.retomar(ator, pedido)
+        self.agora = ate
+
+
+def simular(config, duracao=None, escala_tempo=1.0, semente=None):
+    """Executa o modelo em tempo virtual; `duracao` é em segundos simulados
+
+    Mesmos campos de configuração e métricas de particoes.simular()
+    (`escala_tempo` multiplica os tempos, como nos outros motores), mais
+    o número de eventos, o tempo real gasto e a espera por classe.
+    """
+    duracao = config['duracao_teste'] if duracao is None else duracao
+    semente = random.randrange(2 ** 32) if semente is None else semente
+    num_shards = config.get('num_shards', 1)
+    distribuicao = config.get('distribuicao_chaves', 'uniforme')
+    motor = MotorEventos()
+    travas = [TravaVirtual(motor, config.get('politica', 'leitores')) for _ in range(num_shards)]
+    dados = [0] * num_shards
+    esperas = {'leitor': [], 'escritor': []}
+    esperas_classe = {classe: [] for classe in PRIORIDADES}
+    contagem = {'leituras': 0, 'escritas': 0, 'leitores_simultaneos_max': 0}
+
+    def tempo(chave, rng):
+        return rng.uniform(config[f'{chave}_min'], config[f'{chave}_max']) * escala_tempo
+
+    def leitor(id):
+        rng = random.Random(semente + id)
+        sortear = criar_sorteador(distribuicao, num_shards, rng)
+        classe = 'baixa' if id < config.get('leitores_em_lote', 0) else 'normal'
+        while True:
+            yield tempo('delay_leitor', rng)
+            trava = travas[sortear()]
+            inicio = motor.agora
+            yield (trava, LEITURA, PRIORIDADES[classe])
+            esperas['leitor'].append(motor.agora - inicio)
+            esperas_classe[classe].append(motor.agora - inicio)
+            contagem['leitores_simultaneos_max'] = max(contagem['leitores_simultaneos_max'],
+                                                       trava.leitores_ativos)
+            yield tempo('tempo_leitura', rng)
+            trava.liberar(LEITURA)
+            contagem['leituras'] += 1
+
+    def escritor(id):
+        rng = random.Random(semente + 1000000 + id)
+        sortear = criar_sorteador(distribuicao, num_shards, rng)
+        classe = 'alta' if id < config.get('escritores_prioritarios', 0) else 'normal'
+        while True:
+            yield tempo('delay_escritor', rng)
+            shard = sortear()
+            inicio = motor.agora
+            yield (travas[shard], ESCRITA, PRIORIDADES[classe])
+            esperas['escritor'].append(motor.agora - inicio)
+            esperas_classe[classe].append(motor.agora - inicio)
+            yield tempo('tempo_escrita', rng)
+            dados[shard] += 1
+            travas[shard].liberar(ESCRITA)
+            contagem['escritas'] += 1
+
+    for i in range(config['num_leitores']):
+        motor.iniciar(leitor(i))
+    for i in range(config['num_escritores']):
+        motor.iniciar(escritor(i))
+    inicio_real = time.perf_counter()
+    motor.executar(duracao)
+
+    return {
+        'num_shards': num_shards,
+        'duracao': duracao,
+        'tempo_real': time.perf_counter() - inicio_real,
+        'eventos': motor.processados,
+        'leituras': contagem['leituras'],
+        'escritas': contagem['escritas'],
+        'leituras_por_s': contagem['leituras'] / duracao,
+        'escritas_por_s': contagem['escritas'] / duracao,
+        'leitores_simultaneos_max': contagem['leitores_simultaneos_max'],
+        'espera_leitor': resumo_esperas(esperas['leitor']),
+        'espera_escritor': resumo_esperas(esperas['escritor']),
+        'espera_por_classe': {classe: resumo_esperas(valores)
+                              for classe, valores in esperas_classe.items() if valores},
+        'total': sum(dados)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulação leitores-escritores em tempo virtual")
+    parser.add_argument('--config', default='muitos_leitores', choices=list(CONFIGURACOES.keys()))
+    parser.add_argument('--politica', choices=list(MODELOS.keys()), help="sobrescreve a política")
+    parser.add_argument('--duracao', type=float, default=3600.0, help="segundos simulados")
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args()
+
+    config = get_config(args.config)
+    if args.politica:
+        config['politica'] = args.politica
+
+    print("=" * 60)
+    print(f"SIMULAÇÃO POR EVENTOS - '{args.config}', política '{config['politica']}', "
+          f"{args.duracao:,.0f}s simulados")
+    print("=" * 60)
+    r = simular(config, args.duracao, semente=args.semente)
+    print(f"Tempo real: {r['tempo_real'] * 1000:.0f} ms ({r['eventos']:,} eventos)")
+    print(f"Leituras: {r['leituras']:,} ({r['leituras_por_s']:.2f}/s)")
+    print(f"Escritas: {r['escritas']:,} ({r['escritas_por_s']:.2f}/s)")
+    print(f"Leitores simultâneos (máx): {r['leitores_simultaneos_max']}")
+    print(f"Espera p99 / máx leitor: {r['espera_leitor']['p99']:.2f} / {r['espera_leitor']['maximo']:.2f} s")
+    print(f"Espera p99 / máx escritor: {r['espera_escritor']['p99']:.2f} / "
+          f"{r['espera_escritor']['maximo']:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Motor de simulação com processos
+Leitores e escritores rodam em processos separados sobre um `dados` em
+memória compartilhada (um inteiro por partição), protegido pela RWLockProcessos. Com seções de
+leitura que consomem CPU, as leituras escalam com o número de núcleos,
+o que não acontece com threads por causa do GIL. No motor 'remoto' a
+trava é a do servidor de travas (servidor_travas.py), como se cada
+processo fosse um nó
+"""
+import argparse
+import multiprocessing
+import queue
+import random
+import threading
+import time
+from rwlock import POLITICAS, criar_rwlock
+from particoes import criar_sorteador
+from rwlock_processos import RWLockProcessos, InteirosCompartilhados
+from servidor_travas import ServidorTravas, TravaRemota
+from metricas import resumo_esperas
+from configuracoes import get_config, CONFIGURACOES
+
+MOTORES = ['processos', 'threads', 'remoto']
+
+
+def trabalho_cpu(iteracoes, inicial=0):
+    """Seção de leitura que consome CPU em vez de dormir (a partir do valor lido)"""
+    total = inicial
+    for i in range(iteracoes):
+        total += i * i
+    return total
+
+
+def _tempo(config, chave, rng, escala_tempo):
+    return rng.uniform(config[f'{chave}_min'], config[f'{chave}_max']) * escala_tempo
+
+
+def ator_leitor(id, locks, dados, parada, resultados, config, escala_tempo, semente, trabalho):
+    """Corpo do leitor (roda em processo ou thread); envia contagem e esperas ao final
+
+    O valor lido é conferido na saída: uma mudança durante a leitura
+    indica escritor dentro da seção (conta em `inconsistentes`).
+    """
+    rng = random.Random(semente + id)
+    sortear = criar_sorteador(config.get('distribuicao_chaves', 'uniforme'), len(locks), rng)
+    leituras, esperas, inconsistentes = 0, [], 0
+    while not parada.wait(_tempo(config, 'delay_leitor', rng, escala_tempo)):
+        shard = sortear()
+        lock = locks[shard]
+        inicio_espera = time.perf_counter()
+        if not lock.try_acquire_read(cancelar=parada.is_set):
+            break
+        esperas.append(time.perf_counter() - inicio_espera)
+        valor = dados[shard]  # Leitura
+        if trabalho:
+            trabalho_cpu(trabalho, valor)
+        else:
+            time.sleep(_tempo(config, 'tempo_leitura', rng, escala_tempo))
+        if dados[shard] != valor:
+            inconsistentes += 1
+        lock.release_read()
+        leituras += 1
+    resultados.put(('leitor', leituras, esperas, inconsistentes))
+
+
+def ator_escritor(id, locks, dados, parada, resultados, config, escala_tempo, semente):
+    """Corpo do escritor (roda em processo ou thread); envia contagem e esperas ao final"""
+    rng = random.Random(semente + 1000000 + id)
+    sortear = criar_sorteador(config.get('distribuicao_chaves', 'uniforme'), len(locks), rng)
+    escritas, esperas = 0, []
+    while not parada.wait(_tempo(config, 'delay_escritor', rng, escala_tempo)):
+        shard = sortear()
+        lock = locks[shard]
+        inicio_espera = time.perf_counter()
+        if not lock.try_acquire_write(cancelar=parada.is_set):
+            break
+        esperas.append(time.perf_counter() - inicio_espera)
+        time.sleep(_tempo(config, 'tempo_escrita', rng, escala_tempo))
+        dados[shard] += 1
+        lock.release_write()
+        escritas += 1
+    resultados.put(('escritor', escritas, esperas, 0))
+
+
+def simular(config, duracao=None, escala_tempo=1.0, semente=None, motor='processos', trabalho=0):
+    """Executa os atores em processos (ou threads, para comparação)
+
+    No motor 'remoto' os atores são processos que usam as travas de um
+    ServidorTravas local, cada um com sua conexão. Cada partição
+    (`num_shards`) tem sua trava. A política vem da configuração; o motor
+    'processos' só tem o protocolo 'leitores' (RWLockProcessos) e recusa as
+    demais com ValueError.
+
+    `trabalho` > 0 substitui o tempo de leitura por esse número de
+    iterações de CPU. Retorna métricas no formato de particoes.simular().
+    """
+    if motor not in MOTORES:
+        raise ValueError(f"Motor desconhecido: {motor}")
+    politica = config.get('politica', 'leitores')
+    if politica not in POLITICAS:
+        raise ValueError(f"Política desconhecida: {politica}")
+    if motor == 'processos' and politica != 'leitores':
+        raise ValueError(f"O motor 'processos' só tem a política 'leitores' (pedida: {politica})")
+    duracao = config['duracao_teste'] if duracao is None else duracao
+    semente = random.randrange(2 ** 32) if semente is None else semente
+    num_shards = config.get('num_shards', 1)
+    dados = InteirosCompartilhados(num_shards)
+    servidor = None
+    if motor in ('processos', 'remoto'):
+        contexto = multiprocessing.get_context()
+        if motor == 'processos':
+            locks = [RWLockProcessos(contexto) for _ in range(num_shards)]
+        else:
+            servidor = ServidorTravas(politica=politica).iniciar()
+            locks = [TravaRemota(servidor.endereco, f'dados{k}') for k in range(num_shards)]
+        parada, resultados, Ator = contexto.Event(), contexto.Queue(), contexto.Process
+    else:
+        locks = [criar_rwlock(politica) for _ in range(num_shards)]
+        parada, resultados, Ator = threading.Event(), queue.Queue(), threading.Thread
+
+    comum = (locks, dados, parada, resultados, config, escala_tempo, semente)
+    atores = [Ator(target=ator_leitor, args=(i,) + comum + (trabalho,))
+              for i in range(config['num_leitores'])]
+    atores += [Ator(target=ator_escritor, args=(i,) + comum)
+               for i in range(config['num_escritores'])]
+    try:
+        inicio = time.perf_counter()
+        for ator in atores:
+            ator.start()
+        time.sleep(duracao)
+        parada.set()
+        # Esvaziar a fila antes do join (processos só terminam após enviar)
+        coletados = [resultados.get() for _ in atores]
+        for ator in atores:
+            ator.join()
+        decorrido = time.perf_counter() - inicio
+
+        contagem = {'leitor': 0, 'escritor': 0}
+        esperas = {'leitor': [], 'escritor': []}
+        inconsistentes = 0
+        for tipo, operacoes, esperas_ator, inconsistentes_ator in coletados:
+            contagem[tipo] += operacoes
+            esperas[tipo].extend(esperas_ator)
+            inconsistentes += inconsistentes_ator
+        return {
+            'motor': motor,
+            'num_shards': num_shards,
+            'duracao': decorrido,
+            'leituras': contagem['leitor'],
+            'escritas': contagem['escritor'],
+            'leituras_por_s': contagem['leitor'] / decorrido,
+            'escritas_por_s': contagem['escritor'] / decorrido,
+            'espera_leitor': resumo_esperas(esperas['leitor']),
+            'espera_escritor': resumo_esperas(esperas['escritor']),
+            'leituras_inconsistentes': inconsistentes,
+            'total': sum(dados[k] for k in range(num_shards)),
+            'leitores_ativos_final': sum(lock.leitores_ativos for lock in locks)
+        }
+    finally:
+        if motor != 'threads':
+            for lock in locks:
+                lock.fechar()
+        if servidor is not None:
+            servidor.parar()
+        dados.fechar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulação leitores-escritores com processos")
+    parser.add_argument('--config', default='muitos_leitores', choices=list(CONFIGURACOES.keys()))
+    parser.add_argument('--leitores', type=int, help="sobrescreve num_leitores")
+    parser.add_argument('--escritores', type=int, help="sobrescreve num_escritores")
+    parser.add_argument('--duracao', type=float, default=3.0, help="segundos por medição")
+    parser.add_argument('--escala-tempo', type=float, default=0.1,
+                        help="fator aplicado aos tempos da configuração")
+    parser.add_argument('--trabalho', type=int, default=200000,
+                        help="iterações de CPU por leitura (0 = dormir o tempo de leitura)")
+    args = parser.parse_args()
+
+    config = get_config(args.config)
+    config['num_leitores'] = args.leitores or min(config['num_leitores'], multiprocessing.cpu_count())
+    if args.escritores is not None:
+        config['num_escritores'] = args.escritores
+
+    print("=" * 60)
+    print(f"PROCESSOS x THREADS - {config['num_leitores']} leitores, "
+          f"{config['num_escritores']} escritores, {args.trabalho} iterações por leitura")
+    print("=" * 60)
+    for motor in MOTORES:
+        try:
+            r = simular(config, args.duracao, args.escala_tempo, motor=motor, trabalho=args.trabalho)
+        except ValueError as e:
+            print(f"{motor:<10} {e}")
+            continue
+        print(f"{motor:<10} leituras/s: {r['leituras_por_s']:>8.1f}   escritas/s: {r['escritas_por_s']:>6.1f}"
+              f"   p99 escritor: {r['espera_escritor']['p99'] * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Recurso particionado (sharding) para o problema Leitores-Escritores
+O recurso deixa de ser um único inteiro atrás de uma única trava: são
+`num_shards` partições, cada uma com sua própria RWLock, e cada ator sorteia
+a partição de acordo com uma distribuição de chaves (uniforme ou Zipf)
+"""
+import argparse
+import itertools
+import random
+import threading
+import time
+from rwlock import criar_rwlock, PRIORIDADES
+from metricas import resumo_esperas
+from configuracoes import get_config, CONFIGURACOES
+
+DISTRIBUICOES = ['uniforme', 'zipf']
+EXPOENTE_ZIPF = 1.0
+
+
+def criar_sorteador(distribuicao, num_shards, rng=None, expoente=EXPOENTE_ZIPF):
+    """Retorna uma função sem argumentos que sorteia o índice de uma partição
+
+    'uniforme' escolhe qualquer partição com a mesma chance; 'zipf' dá à
+    partição k peso 1/(k+1)^expoente, concentrando acessos nas primeiras.
+    """
+    rng = rng or random.Random()
+    if distribuicao == 'uniforme':
+        return lambda: rng.randrange(num_shards)
+    if distribuicao == 'zipf':
+        acumulados = list(itertools.accumulate(1 / (k + 1) ** expoente for k in range(num_shards)))
+        indices = range(num_shards)
+        return lambda: rng.choices(indices, cum_weights=acumulados)[0]
+    raise ValueError(f"Distribuição desconhecida: {distribuicao}")
+
+
+class RecursoParticionado:
+    """Inteiros compartilhados em partições, cada uma protegida por sua RWLock"""
+
+    def __init__(self, num_shards=1, politica='leitores'):
+        if num_shards < 1:
+            raise ValueError("num_shards deve ser pelo menos 1")
+        self.num_shards = num_shards
+        self.dados = [0] * num_shards
+        self.locks = [criar_rwlock(politica) for _ in range(num_shards)]
+
+    def ler(self, shard):
+        """Lê o valor da partição sob a trava de leitura dela"""
+        with self.locks[shard].read():
+            return self.dados[shard]
+
+    def incrementar(self, shard):
+        """Incrementa o valor da partição sob a trava de escrita dela"""
+        with self.locks[shard].write():
+            self.dados[shard] += 1
+            return self.dados[shard]
+
+    def total(self):
+        """Soma de todas as partições (sem trava; apenas para relatórios)"""
+        return sum(self.dados)
+
+
+def simular(config, duracao=None, escala_tempo=1.0, semente=None):
+    """Executa leitores e escritores sobre um RecursoParticionado
+
+    Usa os campos de `config` (ver configuracoes.py), incluindo num_shards e
+    distribuicao_chaves. `escala_tempo` multiplica todos os delays e tempos
+    de seção crítica, permitindo medições rápidas. Retorna um dicionário de
+    métricas com vazão, esperas (também por classe de prioridade) e escritas
+    por partição. Cada ator conta suas leituras, escritas e esperas na
+    própria entrada das listas abaixo; as somas saem depois do join.
+    """
+    duracao = config['duracao_teste'] if duracao is None else duracao
+    num_shards = config.get('num_shards', 1)
+    distribuicao = config.get('distribuicao_chaves', 'uniforme')
+    recurso = RecursoParticionado(num_shards, config.get('politica', 'leitores'))
+    escritas_por_shard = [0] * num_shards
+    num_leitores, num_escritores = config['num_leitores'], config['num_escritores']
+    leituras, escritas = [0] * num_leitores, [0] * num_escritores
+    esperas_l = [[] for _ in range(num_leitores)]
+    esperas_e = [[] for _ in range(num_escritores)]
+    classes_l = ['baixa' if id < config.get('leitores_em_lote', 0) else 'normal'
+                 for id in range(num_leitores)]
+    classes_e = ['alta' if id < config.get('escritores_prioritarios', 0) else 'normal'
+                 for id in range(num_escritores)]
+    parada = threading.Event()
+    semente = random.randrange(2 ** 32) if semente is None else semente
+
+    def tempo(chave, rng):
+        return rng.uniform(config[f'{chave}_min'], config[f'{chave}_max']) * escala_tempo
+
+    def definir_classe(classe):
+        # A classe é da thread; cada partição tem sua trava
+        for lock in recurso.locks:
+            lock.definir_prioridade(classe)
+
+    def leitor(id):
+        rng = random.Random(semente + id)
+        sortear = criar_sorteador(distribuicao, num_shards, rng)
+        definir_classe(classes_l[id])
+        while not parada.wait(tempo('delay_leitor', rng)):
+            lock = recurso.locks[sortear()]
+            inicio_espera = time.perf_counter()
+            if not lock.try_acquire_read(cancelar=parada.is_set):
+                return
+            esperas_l[id].append(time.perf_counter() - inicio_espera)
+            time.sleep(tempo('tempo_leitura', rng))
+            lock.release_read()
+            leituras[id] += 1
+
+    def escritor(id):
+        rng = random.Random(semente + 1000 + id)
+        sortear = criar_sorteador(distribuicao, num_shards, rng)
+        definir_classe(classes_e[id])
+        while not parada.wait(tempo('delay_escritor', rng)):
+            shard = sortear()
+            lock = recurso.locks[shard]
+            inicio_espera = time.perf_counter()
+            if not lock.try_acquire_write(cancelar=parada.is_set):
+                return
+            esperas_e[id].append(time.perf_counter() - inicio_espera)
+            time.sleep(tempo('tempo_escrita', rng))
+            recurso.dados[shard] += 1
+            escritas_por_shard[shard] += 1
+            lock.release_write()
+            escritas[id] += 1
+
+    threads = [threading.Thread(target=leitor, args=(i,), name=f"Leitor-{i}")
+               for i in range(num_leitores)]
+    threads += [threading.Thread(target=escritor, args=(i,), name=f"Escritor-{i}")
+                for i in range(num_escritores)]
+    inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    time.sleep(duracao)
+    parada.set()
+    for t in threads:
+        t.join()
+    decorrido = time.perf_counter() - inicio
+
+    esperas_classe = {classe: [] for classe in PRIORIDADES}
+    for classes, esperas in ((classes_l, esperas_l), (classes_e, esperas_e)):
+        for classe, valores in zip(classes, esperas):
+            esperas_classe[classe].extend(valores)
+    return {
+        'num_shards': num_shards,
+        'distribuicao_chaves': distribuicao,
+        'duracao': decorrido,
+        'leituras': sum(leituras),
+        'escritas': sum(escritas),
+        'leituras_por_s': sum(leituras) / decorrido,
+        'escritas_por_s': sum(escritas) / decorrido,
+        'espera_leitor': resumo_esperas([w for valores in esperas_l for w in valores]),
+        'espera_escritor': resumo_esperas([w for valores in esperas_e for w in valores]),
+        'espera_por_classe': {classe: resumo_esperas(valores)
+                              for classe, valores in esperas_classe.items() if valores},
+        'escritas_por_shard': escritas_por_shard,
+        # Trava adaptativa: entradas pelo caminho rápido x protocolo completo
+        'entradas_rapidas': sum(getattr(lock, 'rapidas', 0) for lock in recurso.locks),
+        'entradas_lentas': sum(getattr(lock, 'lentas', 0) for lock in recurso.locks),
+        'total': recurso.total()
+    }
+
+
+def medir_escalabilidade(nome_config='particionado', shards=(1, 2, 4, 8, 16),
+                         distribuicoes=DISTRIBUICOES, duracao=2.0, escala_tempo=0.05):
+    """Vazão de escrita para cada número de partições e distribuição"""
+    resultados = {}
+    for distribuicao in distribuicoes:
+        for num_shards in shards:
+            config = get_config(nome_config)
+            config.update(num_shards=num_shards, distribuicao_chaves=distribuicao)
+            resultados[(distribuicao, num_shards)] = simular(config, duracao, escala_tempo, semente=0)
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Escalabilidade do recurso particionado")
+    parser.add_argument('--config', default='particionado', choices=list(CONFIGURACOES.keys()))
+    parser.add_argument('--shards', nargs='+', type=int, default=[1, 2, 4, 8, 16])
+    parser.add_argument('--duracao', type=float, default=2.0, help="segundos por medição")
+    parser.add_argument('--escala-tempo', type=float, default=0.05,
+                        help="fator aplicado aos tempos da configuração")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"ESCALABILIDADE POR PARTIÇÕES - configuração '{args.config}'")
+    print("=" * 60)
+    resultados = medir_escalabilidade(args.config, args.shards, DISTRIBUICOES,
+                                      args.duracao, args.escala_tempo)
+    print(f"{'Distribuição':<14}{'Shards':>8}{'Escritas/s':>12}{'Leituras/s':>12}{'p99 escritor':>15}")
+    for (distribuicao, num_shards), r in resultados.items():
+        print(f"{distribuicao:<14}{num_shards:>8}{r['escritas_por_s']:>12.1f}{r['leituras_por_s']:>12.1f}"
+              f"{r['espera_escritor']['p99'] * 1000:>12.1f} ms")
+        entradas = r['entradas_rapidas'] + r['entradas_lentas']
+        if entradas:
+            print(f"{'':<22}caminho rápido: {r['entradas_rapidas']} de {entradas} entradas "
+                  f"({r['entradas_rapidas'] / entradas:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Leitores e escritores em programas separados sobre um arquivo de dados
+Execute várias instâncias ao mesmo tempo (por exemplo, uma com --papel
+leitor e outra com --papel escritor); a RWLockArquivo coordena o acesso
+ao arquivo entre elas
+"""
+import argparse
+import os
+import random
+import threading
+import time
+from rwlock_arquivo import RWLockArquivo
+
+
+def ler_valor(caminho):
+    """Lê o inteiro guardado no arquivo (0 se vazio)"""
+    with open(caminho) as arquivo:
+        conteudo = arquivo.read().strip()
+    return int(conteudo) if conteudo else 0
+
+
+def escrever_valor(caminho, valor):
+    """Grava o inteiro no arquivo"""
+    with open(caminho, 'w') as arquivo:
+        arquivo.write(str(valor))
+
+
+def leitor(id, lock, caminho, parada):
+    while not parada.wait(random.uniform(1, 3)):
+        with lock.read():
+            # leitura
+            print(f"📘 [{os.getpid()}] Leitor {id} está lendo o valor: {ler_valor(caminho)}")
+            time.sleep(random.uniform(1, 2))
+
+
+def escritor(id, lock, caminho, parada):
+    while not parada.wait(random.uniform(2, 5)):
+        with lock.write():
+            # escrita
+            valor = ler_valor(caminho) + 1
+            escrever_valor(caminho, valor)
+            print(f"✍️ [{os.getpid()}] Escritor {id} escreveu o valor: {valor}")
+            time.sleep(random.uniform(1, 2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Leitores/escritores coordenados por arquivo")
+    parser.add_argument('--papel', choices=['leitor', 'escritor'], required=True)
+    parser.add_argument('--arquivo', default='dados_compartilhados.txt',
+                        help="arquivo de dados (também usado como trava)")
+    parser.add_argument('--atores', type=int, default=2, help="threads deste programa")
+    parser.add_argument('--duracao', type=float, default=20.0, help="segundos de execução")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.arquivo):
+        escrever_valor(args.arquivo, 0)
+    # A trava fica em um arquivo ao lado do de dados: fechar o arquivo de dados
+    # após cada acesso descartaria as travas do fcntl mantidas sobre ele
+    lock = RWLockArquivo(args.arquivo + '.lock')
+    parada = threading.Event()
+    alvo = leitor if args.papel == 'leitor' else escritor
+    threads = [threading.Thread(target=alvo, args=(i, lock, args.arquivo, parada))
+               for i in range(args.atores)]
+    for t in threads:
+        t.start()
+    time.sleep(args.duracao)
+    parada.set()
+    for t in threads:
+        t.join()
+    lock.fechar()
+
+
+if __name__ == "__main__":
+    main()
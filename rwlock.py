@@ -0,0 +1,1333 @@
+"""
+Trava de leitura/escrita (RWLock) compartilhada por todas as interfaces
+Implementa o protocolo clássico primeiro-leitor/último-leitor com semáforos,
+as demais políticas e os recursos sem trava de leitura (seqlock e RCU)
+"""
+import itertools
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+# Latência máxima (s) para perceber um pedido de cancelamento durante a espera
+INTERVALO_CANCELAMENTO = 0.05
+
+# Classes de prioridade dos atores (ver RWLockPrioridade); maior vence
+PRIORIDADES = {'baixa': 0, 'normal': 1, 'alta': 2}
+
+
+def _prazo(timeout):
+    """Converte timeout relativo em instante absoluto (None = sem limite)"""
+    return None if timeout is None else time.monotonic() + timeout
+
+def _restante(prazo):
+    """Tempo restante até o prazo (None = sem limite)"""
+    return None if prazo is None else max(0.0, prazo - time.monotonic())
+
+def _adquirir(trava, prazo):
+    """acquire() com prazo absoluto para Lock e semáforos (None = sem limite)"""
+    restante = _restante(prazo)
+    return trava.acquire() if restante is None else trava.acquire(True, restante)
+
+def _fatia(prazo, cancelar):
+    """Próximo intervalo de espera: com cancelamento, no máximo INTERVALO_CANCELAMENTO"""
+    restante = _restante(prazo)
+    if cancelar is None:
+        return restante
+    if restante is None:
+        return INTERVALO_CANCELAMENTO
+    return min(restante, INTERVALO_CANCELAMENTO)
+
+def _esperar(condicao, predicado, timeout, cancelar):
+    """wait_for com prazo e cancelamento; deve ser chamada com a condição adquirida"""
+    prazo = _prazo(timeout)
+    while not predicado():
+        if cancelar is not None and cancelar():
+            return False
+        fatia = _fatia(prazo, cancelar)
+        if fatia == 0:
+            return False
+        condicao.wait(fatia)
+    return True
+
+
+class RWLockBase:
+    """Interface comum das travas: context managers sobre acquire/release
+
+    As variantes try_acquire_read/try_acquire_write aceitam `timeout` em
+    segundos (None espera indefinidamente, 0 apenas tenta) e retornam um
+    valor falso quando o tempo esgota sem obter a trava. O argumento
+    opcional `cancelar` é uma função consultada a cada
+    INTERVALO_CANCELAMENTO: se retornar True a espera é abandonada.
+
+    Travas baseadas em semáforos implementam apenas _try_acquire_read e
+    _try_acquire_write (uma tentativa com timeout); esta classe fatia a
+    espera para atender ao cancelamento.
+    """
+
+    # Indica se a trava oferece leitura atualizável (upgrade read → write)
+    suporta_atualizacao = False
+    # Indica se a trava oferece leitura otimista por carimbo (ver RWLockOtimista)
+    suporta_leitura_otimista = False
+    # Indica se a trava oferece rebaixamento atômico (downgrade write → read);
+    # as travas por semáforos não oferecem, pois o primeiro leitor espera a
+    # escrita segurando o mutex do contador
+    suporta_rebaixamento = False
+    # Indica se a trava ordena as entradas pela classe de prioridade do ator
+    suporta_prioridade = False
+    # Indica se acquire_read/release_read retornam o número de leitores ativos;
+    # sem isso (RWLockSlots) a contagem exata fica em leitores_ativos
+    conta_leitores = True
+
+    def definir_prioridade(self, classe):
+        """Define a classe de prioridade da thread atual (ignorada sem suporta_prioridade)"""
+        if classe not in PRIORIDADES:
+            raise ValueError(f"Classe de prioridade desconhecida: {classe}")
+
+    def try_acquire_read(self, timeout=None, cancelar=None):
+        """Entrada do leitor com limite de tempo; retorna 0 se esgotar ou cancelar"""
+        prazo = _prazo(timeout)
+        while True:
+            leitores = self._try_acquire_read(_fatia(prazo, cancelar))
+            if leitores or _restante(prazo) == 0 or (cancelar is not None and cancelar()):
+                return leitores
+
+    def try_acquire_write(self, timeout=None, cancelar=None):
+        """Entrada do escritor com limite de tempo; retorna False se esgotar ou cancelar"""
+        prazo = _prazo(timeout)
+        while True:
+            obteve = self._try_acquire_write(_fatia(prazo, cancelar))
+            if obteve or _restante(prazo) == 0 or (cancelar is not None and cancelar()):
+                return obteve
+
+    @contextmanager
+    def read(self):
+        """Context manager para seção de leitura"""
+        self.acquire_read()
+        try:
+            yield self
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        """Context manager para seção de escrita"""
+        self.acquire_write()
+        try:
+            yield self
+        finally:
+            self.release_write()
+
+
+class RWLock(RWLockBase):
+    """Trava leitores-escritores com preferência para leitores
+
+    O `mutex` do contador é um threading.Lock (teste-e-marca em C). A
+    entrada do leitor começa pelo caminho rápido: uma tentativa não
+    bloqueante do `mutex` e, se não há leitores, de `wrt`. Sem disputa o
+    leitor entra ali mesmo, sem passar pelo protocolo bloqueante dos
+    semáforos; caso contrário segue o protocolo clássico (caminho lento).
+    `rapidas` e `lentas` contam as entradas de leitura por cada caminho.
+    """
+
+    def __init__(self):
+        self.mutex = threading.Lock()         # protege o contador de leitores
+        self.wrt = threading.Semaphore(1)     # garante exclusividade de escrita
+        self.leitores_ativos = 0              # contador de leitores ativos
+        self.rapidas = 0                      # leituras pelo caminho rápido
+        self.lentas = 0                       # leituras pelo protocolo completo
+
+    def _entrada_rapida(self):
+        """Entrada do leitor sem esperar; retorna 0 se houver disputa"""
+        if not self.mutex.acquire(False):
+            return 0
+        leitores = 0
+        if self.leitores_ativos or self.wrt.acquire(False):
+            self.leitores_ativos += 1
+            self.rapidas += 1
+            leitores = self.leitores_ativos
+        self.mutex.release()
+        return leitores
+
+    def acquire_read(self):
+        """Entrada do leitor; retorna o número de leitores ativos"""
+        leitores = self._entrada_rapida()
+        if leitores:
+            return leitores
+        self.mutex.acquire()
+        self.leitores_ativos += 1
+        leitores = self.leitores_ativos
+        if leitores == 1:
+            self.wrt.acquire()  # primeiro leitor bloqueia escritores
+        self.lentas += 1
+        self.mutex.release()
+        return leitores
+
+    def _try_acquire_read(self, timeout=None):
+        """Uma tentativa de entrada do leitor; retorna 0 se esgotar"""
+        leitores = self._entrada_rapida()
+        if leitores:
+            return leitores
+        prazo = _prazo(timeout)
+        if not _adquirir(self.mutex, prazo):
+            return 0
+        self.leitores_ativos += 1
+        leitores = self.leitores_ativos
+        if leitores == 1 and not _adquirir(self.wrt, prazo):
+            self.leitores_ativos -= 1  # desiste sem ter bloqueado escritores
+            leitores = 0
+        if leitores:
+            self.lentas += 1
+        self.mutex.release()
+        return leitores
+
+    def taxa_rapida(self):
+        """Fração das entradas de leitura que usaram o caminho rápido"""
+        total = self.rapidas + self.lentas
+        return self.rapidas / total if total else 0.0
+
+    def release_read(self):
+        """Saída do leitor; retorna o número de leitores restantes"""
+        self.mutex.acquire()
+        self.leitores_ativos -= 1
+        leitores = self.leitores_ativos
+        if leitores == 0:
+            self.wrt.release()  # último leitor libera escritores
+        self.mutex.release()
+        return leitores
+
+    def acquire_write(self):
+        """Entrada do escritor (acesso exclusivo)"""
+        self.wrt.acquire()
+
+    def _try_acquire_write(self, timeout=None):
+        """Uma tentativa de entrada do escritor"""
+        return self.wrt.acquire(timeout=timeout)
+
+    def release_write(self):
+        """Saída do escritor"""
+        self.wrt.release()
+
+
+class RWLockPreferenciaEscritores(RWLock):
+    """Trava leitores-escritores com preferência para escritores
+
+    Leitores que chegam enquanto há escritor aguardando ficam retidos em
+    `leitura`, evitando a starvation de escritores sob carga de leitura.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.leitura = threading.Semaphore(1)           # portão de entrada dos leitores
+        self.mutex_escritores = threading.Semaphore(1)  # protege o contador de escritores
+        self.escritores_pendentes = 0                   # escritores aguardando ou escrevendo
+
+    def acquire_read(self):
+        """Entrada do leitor; aguarda enquanto houver escritor pendente"""
+        self.leitura.acquire()
+        try:
+            return super().acquire_read()
+        finally:
+            self.leitura.release()
+
+    def _try_acquire_read(self, timeout=None):
+        """Uma tentativa de entrada do leitor; retorna 0 se esgotar"""
+        prazo = _prazo(timeout)
+        if not self.leitura.acquire(timeout=_restante(prazo)):
+            return 0
+        try:
+            return super()._try_acquire_read(_restante(prazo))
+        finally:
+            self.leitura.release()
+
+    def _registrar_escritor(self, prazo=None):
+        """Conta o escritor pendente; o primeiro fecha o portão dos leitores"""
+        if not self.mutex_escritores.acquire(timeout=_restante(prazo)):
+            return False
+        self.escritores_pendentes += 1
+        if self.escritores_pendentes == 1 and not self.leitura.acquire(timeout=_restante(prazo)):
+            self.escritores_pendentes -= 1
+            self.mutex_escritores.release()
+            return False
+        self.mutex_escritores.release()
+        return True
+
+    def _remover_escritor(self):
+        """Desconta o escritor; o último reabre o portão dos leitores"""
+        self.mutex_escritores.acquire()
+        self.escritores_pendentes -= 1
+        if self.escritores_pendentes == 0:
+            self.leitura.release()
+        self.mutex_escritores.release()
+
+    def acquire_write(self):
+        """Entrada do escritor; o primeiro escritor fecha o portão dos leitores"""
+        self._registrar_escritor()
+        self.wrt.acquire()
+
+    def _try_acquire_write(self, timeout=None):
+        """Uma tentativa de entrada do escritor"""
+        prazo = _prazo(timeout)
+        if not self._registrar_escritor(prazo):
+            return False
+        if not self.wrt.acquire(timeout=_restante(prazo)):
+            self._remover_escritor()
+            return False
+        return True
+
+    def release_write(self):
+        """Saída do escritor; o último escritor reabre o portão dos leitores"""
+        self.wrt.release()
+        self._remover_escritor()
+
+
+class RWLockJusto(RWLockBase):
+    """Trava leitores-escritores justa (FIFO por tickets)
+
+    Cada thread retira um ticket na chegada e é atendida em ordem. Leitores
+    consecutivos entram juntos em um lote; um escritor na fila retém os
+    leitores que chegaram depois dele. Nenhum lado espera mais que uma fase.
+    """
+
+    suporta_rebaixamento = True
+
+    def __init__(self):
+        self.condicao = threading.Condition()
+        self.proximo_ticket = 0     # próximo ticket a ser distribuído
+        self.ticket_atendido = 0    # ticket que pode entrar agora
+        self.abandonados = set()    # tickets de quem desistiu por timeout
+        self.leitores_ativos = 0
+        self.escritor_ativo = False
+
+    def _retirar_ticket(self):
+        ticket = self.proximo_ticket
+        self.proximo_ticket += 1
+        return ticket
+
+    def _avancar_fila(self):
+        """Passa a vez ao próximo ticket, pulando os abandonados"""
+        self.ticket_atendido += 1
+        while self.ticket_atendido in self.abandonados:
+            self.abandonados.discard(self.ticket_atendido)
+            self.ticket_atendido += 1
+        self.condicao.notify_all()
+
+    def _abandonar(self, ticket):
+        """Retira da fila um ticket cujo timeout esgotou"""
+        if ticket == self.ticket_atendido:
+            self._avancar_fila()
+        else:
+            self.abandonados.add(ticket)
+
+    def acquire_read(self):
+        """Entrada do leitor na sua vez da fila"""
+        return self.try_acquire_read()
+
+    def try_acquire_read(self, timeout=None, cancelar=None):
+        """Entrada do leitor com limite de tempo; retorna 0 se esgotar ou cancelar"""
+        with self.condicao:
+            ticket = self._retirar_ticket()
+            if not _esperar(
+                    self.condicao,
+                    lambda: ticket == self.ticket_atendido and not self.escritor_ativo,
+                    timeout, cancelar):
+                self._abandonar(ticket)
+                return 0
+            self.leitores_ativos += 1
+            self._avancar_fila()  # próximo da fila pode ser leitor do mesmo lote
+            return self.leitores_ativos
+
+    def release_read(self):
+        """Saída do leitor; o último do lote libera a fila"""
+        with self.condicao:
+            self.leitores_ativos -= 1
+            if self.leitores_ativos == 0:
+                self.condicao.notify_all()
+            return self.leitores_ativos
+
+    def acquire_write(self):
+        """Entrada do escritor na sua vez da fila, após o lote de leitores"""
+        self.try_acquire_write()
+
+    def try_acquire_write(self, timeout=None, cancelar=None):
+        """Entrada do escritor com limite de tempo; retorna False se esgotar ou cancelar"""
+        with self.condicao:
+            ticket = self._retirar_ticket()
+            if not _esperar(
+                    self.condicao,
+                    lambda: (ticket == self.ticket_atendido and not self.escritor_ativo
+                             and self.leitores_ativos == 0),
+                    timeout, cancelar):
+                self._abandonar(ticket)
+                return False
+            self.escritor_ativo = True
+            self._avancar_fila()
+            return True
+
+    def release_write(self):
+        """Saída do escritor"""
+        with self.condicao:
+            self.escritor_ativo = False
+            self.condicao.notify_all()
+
+    def downgrade(self):
+        """Converte a escrita em leitura sem liberar a trava; retorna o número de leitores
+
+        Os leitores seguintes na fila entram junto no mesmo instante; o
+        próximo escritor espera a leitura rebaixada terminar.
+        """
+        with self.condicao:
+            self.escritor_ativo = False
+            self.leitores_ativos += 1
+            self.condicao.notify_all()
+            return self.leitores_ativos
+
+
+class RWLockCondicao(RWLockBase):
+    """Trava leitores-escritores sobre uma única threading.Condition
+
+    Leitores só incrementam o contador quando não há escritor ativo nem
+    aguardando; ninguém bloqueia segurando um mutex, então não há comboio
+    de leitores atrás de um leitor bloqueado. Ao sair, o escritor acorda
+    todos os leitores retidos de uma só vez.
+
+    Oferece também leitura atualizável: no máximo um atualizador convive
+    com os leitores comuns e pode promover sua leitura a escrita com
+    upgrade(), sem liberar a trava no meio (read-modify-write sem corrida).
+    O caminho inverso, downgrade(), rebaixa a escrita a leitura.
+    """
+
+    suporta_atualizacao = True
+    suporta_rebaixamento = True
+
+    def __init__(self):
+        self.condicao = threading.Condition()
+        self.leitores_ativos = 0
+        self.escritor_ativo = False
+        self.escritores_aguardando = 0
+        self.atualizador_ativo = False
+
+    def acquire_read(self):
+        """Entrada do leitor; espera enquanto houver escritor ativo ou aguardando"""
+        return self.try_acquire_read()
+
+    def try_acquire_read(self, timeout=None, cancelar=None):
+        """Entrada do leitor com limite de tempo; retorna 0 se esgotar ou cancelar"""
+        with self.condicao:
+            if not _esperar(
+                    self.condicao,
+                    lambda: not (self.escritor_ativo or self.escritores_aguardando),
+                    timeout, cancelar):
+                return 0
+            self.leitores_ativos += 1
+            return self.leitores_ativos
+
+    def release_read(self):
+        """Saída do leitor; o último acorda os escritores"""
+        with self.condicao:
+            self.leitores_ativos -= 1
+            if self.leitores_ativos == 0 and self.escritores_aguardando:
+                self.condicao.notify_all()
+            return self.leitores_ativos
+
+    def acquire_write(self):
+        """Entrada do escritor"""
+        self.try_acquire_write()
+
+    def try_acquire_write(self, timeout=None, cancelar=None):
+        """Entrada do escritor com limite de tempo; retorna False se esgotar ou cancelar"""
+        with self.condicao:
+            self.escritores_aguardando += 1
+            obteve = _esperar(
+                self.condicao,
+                lambda: not (self.escritor_ativo or self.leitores_ativos
+                             or self.atualizador_ativo),
+                timeout, cancelar)
+            self.escritores_aguardando -= 1
+            if not obteve:
+                self.condicao.notify_all()  # leitores retidos por este escritor podem entrar
+                return False
+            self.escritor_ativo = True
+            return True
+
+    def release_write(self):
+        """Saída do escritor; acorda leitores e escritores em uma única notificação"""
+        with self.condicao:
+            self.escritor_ativo = False
+            self.condicao.notify_all()
+
+    def downgrade(self):
+        """Converte a escrita em leitura sem liberar a trava; retorna o número de leitores
+
+        Nenhum escritor entra entre a escrita e a leitura. Os leitores retidos
+        são acordados no mesmo instante e entram se não houver outro escritor
+        aguardando; a saída é com release_read().
+        """
+        with self.condicao:
+            self.escritor_ativo = False
+            self.leitores_ativos += 1
+            self.condicao.notify_all()
+            return self.leitores_ativos
+
+    def acquire_upgradable(self):
+        """Entrada do atualizador (leitura que pode virar escrita)"""
+        self.try_acquire_upgradable()
+
+    def try_acquire_upgradable(self, timeout=None, cancelar=None):
+        """Entrada do atualizador com limite de tempo; retorna False se esgotar ou cancelar"""
+        with self.condicao:
+            if not _esperar(
+                    self.condicao,
+                    lambda: not (self.escritor_ativo or self.escritores_aguardando
+                                 or self.atualizador_ativo),
+                    timeout, cancelar):
+                return False
+            self.atualizador_ativo = True
+            return True
+
+    def release_upgradable(self):
+        """Saída do atualizador sem promover a leitura"""
+        with self.condicao:
+            self.atualizador_ativo = False
+            self.condicao.notify_all()
+
+    def upgrade(self):
+        """Promove a leitura atualizável a escrita, sem liberar a trava
+
+        Novos leitores ficam retidos enquanto os atuais terminam; ao final
+        o chamador detém a escrita e deve sair com release_write().
+        """
+        with self.condicao:
+            self.escritores_aguardando += 1
+            self.condicao.wait_for(lambda: self.leitores_ativos == 0)
+            self.escritores_aguardando -= 1
+            self.atualizador_ativo = False
+            self.escritor_ativo = True
+
+    @contextmanager
+    def upgradable(self):
+        """Context manager para leitura atualizável; entrega um LeituraAtualizavel
+
+        A promoção e o rebaixamento dentro do bloco passam pelo objeto
+        entregue, que registra a trava detida pelo chamador; a saída libera
+        essa trava, sem consultar o estado compartilhado.
+        """
+        self.acquire_upgradable()
+        atualizacao = LeituraAtualizavel(self)
+        try:
+            yield atualizacao
+        finally:
+            atualizacao._liberar()
+
+
+class LeituraAtualizavel:
+    """Leitura atualizável em curso, entregue por RWLockCondicao.upgradable()
+
+    `detida` é a trava que o chamador tem no momento: 'atualizavel',
+    'escrita' (após upgrade) ou 'leitura' (após upgrade e downgrade).
+    """
+
+    def __init__(self, lock):
+        self.lock = lock
+        self.detida = 'atualizavel'
+
+    def upgrade(self):
+        """Promove a leitura atualizável a escrita (ver RWLockCondicao.upgrade)"""
+        if self.detida != 'atualizavel':
+            raise RuntimeError(f"upgrade() com a trava de {self.detida}")
+        self.lock.upgrade()
+        self.detida = 'escrita'
+
+    def downgrade(self):
+        """Rebaixa a escrita promovida a leitura; retorna o número de leitores"""
+        if self.detida != 'escrita':
+            raise RuntimeError(f"downgrade() com a trava de {self.detida}")
+        leitores = self.lock.downgrade()
+        self.detida = 'leitura'
+        return leitores
+
+    def _liberar(self):
+        """Sai com a trava detida"""
+        if self.detida == 'escrita':
+            self.lock.release_write()
+        elif self.detida == 'leitura':
+            self.lock.release_read()
+        else:
+            self.lock.release_upgradable()
+
+
+class RWLockOtimista(RWLockCondicao):
+    """Trava com leitura otimista por carimbo (estilo StampedLock)
+
+    Um contador de versão é incrementado quando um escritor entra e de novo
+    quando sai, então é ímpar durante a escrita. O leitor otimista guarda o
+    carimbo (a versão), lê os dados sem tocar em nenhum estado compartilhado
+    e valida o carimbo no final; só se um escritor interveio ele repete a
+    leitura com a trava de leitura comum, herdada de RWLockCondicao.
+    """
+
+    suporta_leitura_otimista = True
+
+    def __init__(self):
+        super().__init__()
+        self.versao = 0  # par: sem escritor; ímpar: escrita em andamento
+
+    def try_optimistic_read(self):
+        """Carimbo para leitura otimista; None se há escritor ativo"""
+        versao = self.versao
+        return None if versao % 2 else versao
+
+    def validate(self, carimbo):
+        """True se nenhum escritor entrou desde que o carimbo foi obtido"""
+        return carimbo is not None and carimbo == self.versao
+
+    def try_acquire_write(self, timeout=None, cancelar=None):
+        """Entrada do escritor; invalida os carimbos em circulação"""
+        obteve = super().try_acquire_write(timeout, cancelar)
+        if obteve:
+            self.versao += 1
+        return obteve
+
+    def release_write(self):
+        """Saída do escritor; versão volta a ser par"""
+        self.versao += 1
+        super().release_write()
+
+    def upgrade(self):
+        """Promoção a escrita; invalida os carimbos em circulação"""
+        super().upgrade()
+        self.versao += 1
+
+    def downgrade(self):
+        """Rebaixamento a leitura; versão volta a ser par"""
+        self.versao += 1
+        return super().downgrade()
+
+
+class RWLockAdaptativa(RWLockCondicao):
+    """RWLockCondicao com caminho rápido para aquisições sem disputa
+
+    A Condition usa um threading.Lock simples (implementado em C) como
+    guarda. Na entrada, uma única tentativa não bloqueante da guarda
+    verifica a ausência de disputa: se ninguém está mexendo no estado e a
+    trava está livre para o pedido, o contador é atualizado ali mesmo, sem
+    o laço de espera da Condition. Caso contrário a thread segue o
+    protocolo completo (caminho lento). `rapidas` e `lentas` contam as
+    entradas por cada caminho.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.guarda = threading.Lock()
+        self.condicao = threading.Condition(self.guarda)
+        self.rapidas = 0   # entradas pelo caminho rápido
+        self.lentas = 0    # entradas pelo protocolo completo
+
+    def _contar_lenta(self):
+        with self.guarda:
+            self.lentas += 1
+
+    def try_acquire_read(self, timeout=None, cancelar=None):
+        """Entrada do leitor: caminho rápido sem escritor ativo ou aguardando"""
+        if self.guarda.acquire(blocking=False):
+            if not (self.escritor_ativo or self.escritores_aguardando):
+                self.leitores_ativos += 1
+                self.rapidas += 1
+                leitores = self.leitores_ativos
+                self.guarda.release()
+                return leitores
+            self.guarda.release()
+        self._contar_lenta()
+        return super().try_acquire_read(timeout, cancelar)
+
+    def try_acquire_write(self, timeout=None, cancelar=None):
+        """Entrada do escritor: caminho rápido com a trava totalmente livre"""
+        if self.guarda.acquire(blocking=False):
+            if not (self.escritor_ativo or self.leitores_ativos or self.atualizador_ativo
+                    or self.escritores_aguardando):
+                self.escritor_ativo = True
+                self.rapidas += 1
+                self.guarda.release()
+                return True
+            self.guarda.release()
+        self._contar_lenta()
+        return super().try_acquire_write(timeout, cancelar)
+
+    def taxa_rapida(self):
+        """Fração das entradas que usaram o caminho rápido"""
+        total = self.rapidas + self.lentas
+        return self.rapidas / total if total else 0.0
+
+
+class SlotLeitor:
+    """Contador de leituras de uma única thread (usado por RWLockSlots)"""
+
+    __slots__ = ('leituras', '__weakref__')
+
+    def __init__(self):
+        self.leituras = 0
+
+
+class RWLockSlots(RWLockBase):
+    """Trava "big reader": cada thread leitora tem seu próprio slot
+
+    O leitor incrementa apenas o contador do seu slot e confere se há
+    escritor; sem escritor, a entrada não toca nenhum estado compartilhado
+    além da leitura de uma flag. O escritor levanta a flag e espera todos os
+    slots zerarem. Leitores que encontram a flag levantada desfazem o
+    incremento e esperam na Condition (caminho lento), então escritores têm
+    preferência.
+
+    O slot pertence à thread (threading.local) e o registro só guarda
+    referências fracas: quando a thread termina, o slot sai da varredura dos
+    escritores. O número total de leitores exige varrer os slots, então
+    acquire_read()/release_read() não o calculam (conta_leitores = False);
+    ele fica em leitores_ativos.
+    """
+
+    conta_leitores = False
+
+    def __init__(self):
+        self.condicao = threading.Condition()
+        self.slots = weakref.WeakSet()  # SlotLeitor de cada thread viva que já leu
+        self.local = threading.local()
+        self.escritor = False           # escritor ativo ou aguardando os slots zerarem
+
+    @property
+    def leitores_ativos(self):
+        """Soma dos slots (varredura, apenas para estatísticas)"""
+        return sum(slot.leituras for slot in list(self.slots))
+
+    def _slot(self):
+        """Slot da thread atual, registrado na primeira leitura"""
+        slot = getattr(self.local, 'slot', None)
+        if slot is None:
+            slot = self.local.slot = SlotLeitor()
+            with self.condicao:
+                self.slots.add(slot)
+        return slot
+
+    def _entrar(self, timeout=None, cancelar=None):
+        """Entrada do leitor sem contagem; retorna False se esgotar ou cancelar"""
+        slot = self._slot()
+        slot.leituras += 1
+        if not self.escritor:
+            return True
+        # Caminho lento: desfaz o incremento e espera o escritor sair
+        slot.leituras -= 1
+        with self.condicao:
+            self.condicao.notify_all()  # escritor pode estar esperando este slot
+            if not _esperar(self.condicao, lambda: not self.escritor, timeout, cancelar):
+                return False
+            slot.leituras += 1  # sob a Condition: nenhum escritor levanta a flag agora
+            return True
+
+    def _sair(self):
+        """Saída do leitor sem contagem"""
+        self.local.slot.leituras -= 1
+        if self.escritor:
+            with self.condicao:
+                self.condicao.notify_all()
+
+    def acquire_read(self):
+        """Entrada do leitor pelo slot; retorna 1 (ver conta_leitores)"""
+        return self.try_acquire_read()
+
+    def try_acquire_read(self, timeout=None, cancelar=None):
+        """Entrada do leitor com limite de tempo; retorna 0 se esgotar ou cancelar"""
+        return 1 if self._entrar(timeout, cancelar) else 0
+
+    def release_read(self):
+        """Saída do leitor pelo slot; retorna as leituras que a thread ainda detém"""
+        self._sair()
+        return self.local.slot.leituras
+
+    def acquire_write(self):
+        """Entrada do escritor"""
+        self.try_acquire_write()
+
+    def try_acquire_write(self, timeout=None, cancelar=None):
+        """Entrada do escritor: levanta a flag e espera todos os slots zerarem"""
+        prazo = _prazo(timeout)
+        with self.condicao:
+            if not _esperar(self.condicao, lambda: not self.escritor,
+                            _restante(prazo), cancelar):
+                return False
+            self.escritor = True
+            if not _esperar(self.condicao, lambda: not any(slot.leituras for slot in list(self.slots)),
+                            _restante(prazo), cancelar):
+                self.escritor = False
+                self.condicao.notify_all()  # leitores retidos pela flag podem entrar
+                return False
+            return True
+
+    def release_write(self):
+        """Saída do escritor"""
+        with self.condicao:
+            self.escritor = False
+            self.condicao.notify_all()
+
+
+class RWLockPrioridade(RWLockBase):
+    """Trava leitores-escritores que concede a entrada por classe de prioridade
+
+    Cada thread declara sua classe com definir_prioridade() ('baixa',
+    'normal' ou 'alta'; padrão 'normal'). Entre os que aguardam, vence a
+    maior prioridade efetiva: a classe mais o tempo de espera dividido por
+    `envelhecimento`, de modo que um ator de baixa prioridade sobe uma
+    classe a cada `envelhecimento` segundos e não sofre starvation. Empates
+    ficam com quem chegou primeiro. Leitores não barram leitores: um leitor
+    entra se não houver escritor ativo nem escritor aguardando à sua frente.
+    """
+
+    suporta_prioridade = True
+
+    def __init__(self, envelhecimento=1.0):
+        self.condicao = threading.Condition()
+        self.leitores_ativos = 0
+        self.escritor_ativo = False
+        self.envelhecimento = envelhecimento  # segundos de espera para subir uma classe
+        self.aguardando = {}                  # ticket -> (é escritor, prioridade, chegada)
+        self.tickets = itertools.count()
+        self.local = threading.local()
+
+    def definir_prioridade(self, classe):
+        """Define a classe de prioridade da thread atual"""
+        super().definir_prioridade(classe)
+        self.local.classe = classe
+
+    def _chave(self, ticket, agora):
+        """Prioridade efetiva do ticket (com envelhecimento); empate pela chegada"""
+        _, prioridade, chegada = self.aguardando[ticket]
+        return (prioridade + (agora - chegada) / self.envelhecimento, -ticket)
+
+    def _pode_entrar(self, ticket):
+        """O ticket está livre e nenhum concorrente aguardando está à sua frente"""
+        escritor = self.aguardando[ticket][0]
+        if self.escritor_ativo or (escritor and self.leitores_ativos):
+            return False
+        agora = time.monotonic()
+        chave = self._chave(ticket, agora)
+        return not any(self._chave(outro, agora) > chave
+                       for outro, (outro_escritor, _, _) in self.aguardando.items()
+                       if outro != ticket and (escritor or outro_escritor))
+
+    def _entrar(self, escritor, timeout, cancelar):
+        """Entra na fila, espera a vez e sai dela
+
+        Retorna True (escritor) ou o número de leitores ativos (leitor) se
+        obteve a trava; False se esgotar ou cancelar.
+        """
+        classe = getattr(self.local, 'classe', 'normal')
+        with self.condicao:
+            ticket = next(self.tickets)
+            self.aguardando[ticket] = (escritor, PRIORIDADES[classe], time.monotonic())
+            # O envelhecimento muda a ordem sem notificação: com a espera fatiada
+            # (como no cancelamento) a vez é reavaliada a cada INTERVALO_CANCELAMENTO
+            obteve = _esperar(self.condicao, lambda: self._pode_entrar(ticket),
+                              timeout, cancelar or (lambda: False))
+            del self.aguardando[ticket]
+            if obteve:
+                if escritor:
+                    self.escritor_ativo = True
+                else:
+                    self.leitores_ativos += 1
+                    obteve = self.leitores_ativos
+            self.condicao.notify_all()  # quem estava atrás deste ticket reavalia a vez
+            return obteve
+
+    def acquire_read(self):
+        """Entrada do leitor; retorna o número de leitores ativos"""
+        return self.try_acquire_read()
+
+    def try_acquire_read(self, timeout=None, cancelar=None):
+        """Entrada do leitor com limite de tempo; retorna 0 se esgotar ou cancelar"""
+        return self._entrar(False, timeout, cancelar) or 0
+
+    def release_read(self):
+        """Saída do leitor; o último acorda os que aguardam"""
+        with self.condicao:
+            self.leitores_ativos -= 1
+            if self.leitores_ativos == 0 and self.aguardando:
+                self.condicao.notify_all()
+            return self.leitores_ativos
+
+    def acquire_write(self):
+        """Entrada do escritor"""
+        self.try_acquire_write()
+
+    def try_acquire_write(self, timeout=None, cancelar=None):
+        """Entrada do escritor com limite de tempo; retorna False se esgotar ou cancelar"""
+        return self._entrar(True, timeout, cancelar)
+
+    def release_write(self):
+        """Saída do escritor; acorda todos para reavaliar a vez"""
+        with self.condicao:
+            self.escritor_ativo = False
+            self.condicao.notify_all()
+
+
+class ContagemSeqLock:
+    """Leituras validadas e repetidas de uma única thread (usado por SeqLock)"""
+
+    __slots__ = ('leituras', 'releituras')
+
+    def __init__(self):
+        self.leituras = 0
+        self.releituras = 0
+
+
+class SeqLock:
+    """Sequence lock para valores pequenos lidos com muita frequência
+
+    Escritores se excluem por um mutex e incrementam `sequencia` ao entrar
+    e ao sair, então ela é ímpar durante a escrita. Leitores não adquirem
+    nada: guardam a sequência, leem e repetem a leitura se ela mudou. Só
+    esperam (no próprio mutex, sem girar) se chegam durante uma escrita.
+    `releituras` conta as leituras repetidas: quando cresce demais em
+    relação a `leituras`, o protocolo com semáforos passa a valer mais.
+    Cada thread leitora conta na sua ContagemSeqLock, como os slots de
+    RWLockSlots, e os totais somam as contagens de todas as threads.
+    """
+
+    def __init__(self):
+        self.mutex = threading.Semaphore(1)  # exclusão entre escritores
+        self.sequencia = 0                   # par: sem escritor; ímpar: escrita em andamento
+        self.local = threading.local()
+        self.contagens = []                  # uma por thread leitora, inclusive as encerradas
+        self.registro = threading.Lock()     # protege a lista de contagens
+
+    def _contagem(self):
+        """Contagem da thread atual (registrada no primeiro uso)"""
+        contagem = getattr(self.local, 'contagem', None)
+        if contagem is None:
+            contagem = self.local.contagem = ContagemSeqLock()
+            with self.registro:
+                self.contagens.append(contagem)
+        return contagem
+
+    @property
+    def leituras(self):
+        """Leituras validadas, somando todas as threads"""
+        with self.registro:
+            return sum(contagem.leituras for contagem in self.contagens)
+
+    @property
+    def releituras(self):
+        """Leituras repetidas por interferência de escritor, somando todas as threads"""
+        with self.registro:
+            return sum(contagem.releituras for contagem in self.contagens)
+
+    def read_begin(self, timeout=None, cancelar=None):
+        """Início da leitura; retorna a sequência, ou None se esgotar ou cancelar"""
+        prazo = _prazo(timeout)
+        while True:
+            sequencia = self.sequencia
+            if not sequencia % 2:
+                return sequencia
+            # Escrita em andamento: espera o escritor liberar o mutex
+            if self.mutex.acquire(timeout=_fatia(prazo, cancelar)):
+                self.mutex.release()
+            elif _restante(prazo) == 0 or (cancelar is not None and cancelar()):
+                return None
+
+    def read_retry(self, sequencia):
+        """True se um escritor interveio e a leitura deve ser repetida"""
+        contagem = self._contagem()
+        if sequencia != self.sequencia:
+            contagem.releituras += 1
+            return True
+        contagem.leituras += 1
+        return False
+
+    def read(self, leitura):
+        """Executa leitura() até obter um resultado consistente e o retorna"""
+        while True:
+            sequencia = self.read_begin()
+            valor = leitura()
+            if not self.read_retry(sequencia):
+                return valor
+
+    def acquire_write(self):
+        """Entrada do escritor"""
+        self.try_acquire_write()
+
+    def try_acquire_write(self, timeout=None, cancelar=None):
+        """Entrada do escritor com limite de tempo; retorna False se esgotar ou cancelar"""
+        prazo = _prazo(timeout)
+        while not self.mutex.acquire(timeout=_fatia(prazo, cancelar)):
+            if _restante(prazo) == 0 or (cancelar is not None and cancelar()):
+                return False
+        self.sequencia += 1
+        return True
+
+    def release_write(self):
+        """Saída do escritor"""
+        self.sequencia += 1
+        self.mutex.release()
+
+    @contextmanager
+    def write(self):
+        """Context manager para seção de escrita"""
+        self.acquire_write()
+        try:
+            yield self
+        finally:
+            self.release_write()
+
+
+class Versao:
+    """Versão imutável do estado publicada pelo RCU"""
+
+    __slots__ = ('numero', 'valor', '__weakref__')
+
+    def __init__(self, numero, valor):
+        object.__setattr__(self, 'numero', numero)
+        object.__setattr__(self, 'valor', valor)
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError("Versao é imutável; publique uma nova com RCU.publicar()")
+
+
+class RCU:
+    """Recurso copy-on-write no estilo RCU (read-copy-update)
+
+    Escritores se excluem por um mutex, constroem uma nova Versao e a
+    publicam trocando uma única referência. Leitores apenas pegam a
+    referência atual, sem trava nem escrita em estado compartilhado, então a
+    latência de leitura não depende dos escritores. Versões antigas vivem
+    enquanto algum leitor ainda as referencia; `versoes_vivas()` mede esse
+    custo de memória.
+    """
+
+    def __init__(self, valor=0):
+        self.mutex = threading.Semaphore(1)  # exclusão entre escritores
+        self.atual = Versao(0, valor)
+        self.publicadas = weakref.WeakSet([self.atual])  # versões ainda referenciadas
+        self.max_versoes_vivas = 1
+
+    def ler(self):
+        """Versão atual (imutável); o leitor a mantém pelo tempo que quiser"""
+        return self.atual
+
+    def versoes_vivas(self):
+        """Número de versões ainda referenciadas (a atual e as retidas por leitores)"""
+        return len(self.publicadas)
+
+    def acquire_write(self):
+        """Entrada do escritor"""
+        self.mutex.acquire()
+
+    def try_acquire_write(self, timeout=None, cancelar=None):
+        """Entrada do escritor com limite de tempo; retorna False se esgotar ou cancelar"""
+        prazo = _prazo(timeout)
+        while not self.mutex.acquire(timeout=_fatia(prazo, cancelar)):
+            if _restante(prazo) == 0 or (cancelar is not None and cancelar()):
+                return False
+        return True
+
+    def release_write(self):
+        """Saída do escritor"""
+        self.mutex.release()
+
+    def publicar(self, valor):
+        """Publica uma nova versão com valor; deve ser chamada com a escrita adquirida"""
+        nova = Versao(self.atual.numero + 1, valor)
+        self.publicadas.add(nova)
+        self.atual = nova  # troca atômica da referência
+        self.max_versoes_vivas = max(self.max_versoes_vivas, len(self.publicadas))
+        return nova
+
+    def atualizar(self, funcao):
+        """Publica funcao(valor atual) como nova versão e a retorna"""
+        self.acquire_write()
+        try:
+            return self.publicar(funcao(self.atual.valor))
+        finally:
+            self.release_write()
+
+
+class ErroReentrada(RuntimeError):
+    """Uso ilegal de uma trava reentrante (promoção implícita ou saída sem posse)"""
+
+
+class RWLockReentrante(RWLockBase):
+    """Trava reentrante: a mesma thread pode aninhar seções de leitura e escrita
+
+    Envolve outra trava (por padrão preferência para escritores) e guarda em
+    armazenamento local da thread quantas leituras e escritas ela detém. Só a
+    primeira entrada e a última saída passam pela trava interna; as aninhadas
+    custam O(1) e não tocam estado compartilhado, então uma leitura aninhada
+    não fica presa atrás de um escritor na fila.
+
+    Dentro de uma escrita a thread pode ler (a escrita já é exclusiva). Pedir
+    escrita segurando apenas leitura levantaria um deadlock entre dois
+    atualizadores e por isso gera ErroReentrada; use leitura atualizável.
+    """
+
+    def __init__(self, trava=None):
+        self.trava = trava if trava is not None else RWLockPreferenciaEscritores()
+        self.local = threading.local()
+
+    @property
+    def leitores_ativos(self):
+        """Número de leitores ativos na trava interna"""
+        return self.trava.leitores_ativos
+
+    @property
+    def suporta_prioridade(self):
+        return self.trava.suporta_prioridade
+
+    @property
+    def conta_leitores(self):
+        return self.trava.conta_leitores
+
+    def definir_prioridade(self, classe):
+        """Repassa a classe de prioridade da thread à trava interna"""
+        self.trava.definir_prioridade(classe)
+
+    def _posse(self):
+        """Contadores (leituras, escritas) da thread atual"""
+        return getattr(self.local, 'leituras', 0), getattr(self.local, 'escritas', 0)
+
+    def acquire_read(self):
+        """Entrada do leitor; reentrada da mesma thread não espera"""
+        return self.try_acquire_read()
+
+    def try_acquire_read(self, timeout=None, cancelar=None):
+        """Entrada do leitor com limite de tempo; retorna 0 se esgotar ou cancelar"""
+        leituras, escritas = self._posse()
+        if leituras or escritas:
+            self.local.leituras = leituras + 1
+            return max(self.trava.leitores_ativos, 1)
+        leitores = self.trava.try_acquire_read(timeout, cancelar)
+        if leitores:
+            self.local.leituras = 1
+        return leitores
+
+    def release_read(self):
+        """Saída do leitor; só a última saída da thread libera a trava interna"""
+        leituras, escritas = self._posse()
+        if not leituras:
+            raise ErroReentrada("release_read() sem leitura desta thread")
+        self.local.leituras = leituras - 1
+        if leituras > 1 or escritas:
+            return max(self.trava.leitores_ativos, 1)
+        return self.trava.release_read()
+
+    def acquire_write(self):
+        """Entrada do escritor; reentrada da mesma thread não espera"""
+        self.try_acquire_write()
+
+    def try_acquire_write(self, timeout=None, cancelar=None):
+        """Entrada do escritor com limite de tempo; retorna False se esgotar ou cancelar"""
+        leituras, escritas = self._posse()
+        if escritas:
+            self.local.escritas = escritas + 1
+            return True
+        if leituras:
+            raise ErroReentrada("escrita pedida por thread que só detém leitura (read→write); "
+                                "use leitura atualizável")
+        obteve = self.trava.try_acquire_write(timeout, cancelar)
+        if obteve:
+            self.local.escritas = 1
+        return obteve
+
+    def release_write(self):
+        """Saída do escritor; leituras ainda abertas exigem downgrade da trava interna"""
+        leituras, escritas = self._posse()
+        if not escritas:
+            raise ErroReentrada("release_write() sem escrita desta thread")
+        if escritas > 1:
+            self.local.escritas = escritas - 1
+        elif leituras:
+            if not self.trava.suporta_rebaixamento:
+                raise ErroReentrada("leituras abertas dentro da escrita; libere-as antes "
+                                    "ou use uma trava com downgrade")
+            self.trava.downgrade()
+            self.local.escritas = 0
+        else:
+            self.local.escritas = 0
+            self.trava.release_write()
+
+
+class RWLockArrendamento(RWLockBase):
+    """Escritas com arrendamento (lease): posse máxima, revogação e fencing tokens
+
+    Envolve outra trava. Cada escrita concedida recebe um fencing token
+    (inteiro crescente) e vale por no máximo `duracao_maxima` segundos; um
+    monitor revoga a posse vencida e libera a trava interna, para que um
+    escritor travado não congele os demais. O escritor revogado descobre a
+    perda ao chamar validar() ou executar_cercado(), que recusa a escrita,
+    e seu release_write() posterior não libera a trava de outro escritor.
+
+    Liberações após `margem_alerta` da duração máxima contam como quase
+    expirações. A trava interna precisa aceitar liberação por outra thread
+    (todas as políticas aceitam; a RWLockReentrante não).
+    """
+
+    def __init__(self, trava=None, duracao_maxima=2.0, margem_alerta=0.8):
+        self.trava = trava if trava is not None else RWLockCondicao()
+        self.duracao_maxima = duracao_maxima
+        self.margem_alerta = margem_alerta
+        self.condicao = threading.Condition()
+        self.local = threading.local()       # token da escrita de cada thread
+        self.tokens = itertools.count(1)
+        self.token_atual = None              # token da posse vigente
+        self.inicio = self.prazo = None
+        self.monitor = None
+        self.encerrado = False
+        self.concedidos = 0
+        self.revogacoes = 0
+        self.quase_expiracoes = 0
+        self.escritas_recusadas = 0
+        self.maior_posse = 0.0
+
+    @property
+    def leitores_ativos(self):
+        """Número de leitores ativos na trava interna"""
+        return self.trava.leitores_ativos
+
+    @property
+    def suporta_prioridade(self):
+        return self.trava.suporta_prioridade
+
+    @property
+    def conta_leitores(self):
+        return self.trava.conta_leitores
+
+    def definir_prioridade(self, classe):
+        """Repassa a classe de prioridade da thread à trava interna"""
+        self.trava.definir_prioridade(classe)
+
+    def acquire_read(self):
+        """Entrada do leitor (leituras não têm arrendamento)"""
+        return self.trava.acquire_read()
+
+    def try_acquire_read(self, timeout=None, cancelar=None):
+        """Entrada do leitor com limite de tempo; retorna 0 se esgotar ou cancelar"""
+        return self.trava.try_acquire_read(timeout, cancelar)
+
+    def release_read(self):
+        """Saída do leitor; retorna o número de leitores restantes"""
+        return self.trava.release_read()
+
+    def acquire_write(self):
+        """Entrada do escritor; retorna o fencing token"""
+        return self.try_acquire_write()
+
+    def try_acquire_write(self, timeout=None, cancelar=None):
+        """Entrada do escritor com limite de tempo; retorna o fencing token ou 0"""
+        if not self.trava.try_acquire_write(timeout, cancelar):
+            return 0
+        with self.condicao:
+            token = next(self.tokens)
+            self.token_atual = token
+            self.inicio = time.monotonic()
+            self.prazo = self.inicio + self.duracao_maxima
+            self.concedidos += 1
+            if self.monitor is None:
+                self.monitor = threading.Thread(target=self._monitorar, daemon=True,
+                                                name="Monitor-arrendamento")
+                self.monitor.start()
+            self.condicao.notify_all()
+        self.local.token = token
+        return token
+
+    def release_write(self):
+        """Saída do escritor; retorna False se o arrendamento já tinha sido revogado"""
+        token = getattr(self.local, 'token', None)
+        self.local.token = None
+        with self.condicao:
+            if token is None or token != self.token_atual:
+                return False  # revogado: a trava já foi liberada pelo monitor
+            posse = time.monotonic() - self.inicio
+            self.maior_posse = max(self.maior_posse, posse)
+            if posse >= self.margem_alerta * self.duracao_maxima:
+                self.quase_expiracoes += 1
+            self.token_atual = None
+            self.trava.release_write()
+            self.condicao.notify_all()
+            return True
+
+    def validar(self, token=None):
+        """True se o token (padrão: o da thread atual) ainda é a posse vigente"""
+        token = getattr(self.local, 'token', None) if token is None else token
+        with self.condicao:
+            return token is not None and token == self.token_atual
+
+    def executar_cercado(self, funcao, token=None):
+        """Executa funcao() só se o arrendamento ainda vale; retorna False se recusada
+
+        O monitor não revoga durante a execução, então a verificação e a
+        escrita são atômicas em relação à expiração.
+        """
+        token = getattr(self.local, 'token', None) if token is None else token
+        with self.condicao:
+            if token is None or token != self.token_atual:
+                self.escritas_recusadas += 1
+                return False
+            funcao()
+            return True
+
+    def _monitorar(self):
+        """Thread monitora: revoga o arrendamento vigente ao fim do prazo"""
+        with self.condicao:
+            while not self.encerrado:
+                if self.token_atual is None:
+                    self.condicao.wait()
+                    continue
+                restante = self.prazo - time.monotonic()
+                if restante > 0:
+                    self.condicao.wait(restante)
+                    continue
+                self.revogacoes += 1
+                self.maior_posse = max(self.maior_posse, time.monotonic() - self.inicio)
+                self.token_atual = None
+                self.trava.release_write()
+                self.condicao.notify_all()
+
+    def metricas(self):
+        """Contadores de arrendamento"""
+        with self.condicao:
+            return {
+                'concedidos': self.concedidos,
+                'revogacoes': self.revogacoes,
+                'quase_expiracoes': self.quase_expiracoes,
+                'escritas_recusadas': self.escritas_recusadas,
+                'maior_posse': self.maior_posse
+            }
+
+    def fechar(self):
+        """Encerra o monitor"""
+        with self.condicao:
+            self.encerrado = True
+            self.condicao.notify_all()
+
+
+# Políticas de prioridade disponíveis
+POLITICAS = {
+    'leitores': RWLock,
+    'escritores': RWLockPreferenciaEscritores,
+    'justa': RWLockJusto,
+    'condicao': RWLockCondicao,
+    'otimista': RWLockOtimista,
+    'slots': RWLockSlots,
+    'prioridade': RWLockPrioridade,
+    'adaptativa': RWLockAdaptativa
+}
+
+def criar_rwlock(politica='leitores', reentrante=False, arrendamento=None):
+    """Cria uma RWLock para a política informada
+
+    Opcionalmente reentrante, ou com escritas arrendadas por no máximo
+    `arrendamento` segundos (RWLockArrendamento); as duas opções não se combinam.
+    """
+    if politica not in POLITICAS:
+        raise ValueError(f"Política desconhecida: {politica}")
+    if reentrante and arrendamento:
+        raise ValueError("Trava reentrante não aceita arrendamento")
+    trava = POLITICAS[politica]()
+    if arrendamento:
+        return RWLockArrendamento(trava, arrendamento)
+    return RWLockReentrante(trava) if reentrante else trava
@@ -0,0 +1,118 @@
+"""
+Trava de leitura/escrita sobre um arquivo (fcntl)
+Programas independentes que acessam o mesmo arquivo de dados se coordenam
+por travas de faixa do fcntl: compartilhada para leitores, exclusiva para
+escritores. Dentro de cada processo vale o protocolo da RWLock, pois as
+travas do fcntl pertencem ao processo e não distinguem suas threads
+"""
+import fcntl
+import os
+import time
+from rwlock import RWLock, _adquirir, _prazo, _restante
+
+# Intervalo (s) entre tentativas não bloqueantes quando há timeout
+INTERVALO_SONDAGEM = 0.001
+
+
+class RWLockArquivo(RWLock):
+    """RWLock (preferência para leitores) coordenada entre programas pelo fcntl
+
+    O primeiro leitor do processo obtém a trava compartilhada do arquivo e o
+    último a libera; escritores obtêm a trava exclusiva. `inicio` e `tamanho`
+    delimitam a faixa travada (tamanho 0 = até o fim do arquivo).
+
+    Use uma única instância por arquivo em cada processo: o fcntl descarta
+    todas as travas do processo sobre o arquivo quando qualquer descritor
+    dele é fechado.
+    """
+
+    def __init__(self, caminho, inicio=0, tamanho=0):
+        super().__init__()
+        self.caminho = caminho
+        self.inicio = inicio
+        self.tamanho = tamanho
+        self.descritor = os.open(caminho, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def _travar_arquivo(self, modo, timeout=None):
+        """Obtém a trava do arquivo (LOCK_SH ou LOCK_EX); retorna False se esgotar"""
+        if timeout is None:
+            fcntl.lockf(self.descritor, modo, self.tamanho, self.inicio)
+            return True
+        prazo = _prazo(timeout)
+        while True:
+            try:
+                fcntl.lockf(self.descritor, modo | fcntl.LOCK_NB, self.tamanho, self.inicio)
+                return True
+            except OSError:
+                restante = _restante(prazo)
+                if restante == 0:
+                    return False
+                time.sleep(min(restante, INTERVALO_SONDAGEM))
+
+    def _destravar_arquivo(self):
+        """Libera a trava do arquivo"""
+        fcntl.lockf(self.descritor, fcntl.LOCK_UN, self.tamanho, self.inicio)
+
+    def acquire_read(self):
+        """Entrada do leitor; retorna o número de leitores ativos no processo"""
+        self.mutex.acquire()
+        self.leitores_ativos += 1
+        leitores = self.leitores_ativos
+        if leitores == 1:
+            self.wrt.acquire()
+            self._travar_arquivo(fcntl.LOCK_SH)  # primeiro leitor bloqueia escritores de fora
+        self.mutex.release()
+        return leitores
+
+    def _try_acquire_read(self, timeout=None):
+        """Uma tentativa de entrada do leitor; retorna 0 se esgotar"""
+        prazo = _prazo(timeout)
+        if not _adquirir(self.mutex, prazo):
+            return 0
+        self.leitores_ativos += 1
+        leitores = self.leitores_ativos
+        if leitores == 1:
+            if not self.wrt.acquire(timeout=_restante(prazo)):
+                self.leitores_ativos -= 1
+                leitores = 0
+            elif not self._travar_arquivo(fcntl.LOCK_SH, _restante(prazo)):
+                self.wrt.release()
+                self.leitores_ativos -= 1
+                leitores = 0
+        self.mutex.release()
+        return leitores
+
+    def release_read(self):
+        """Saída do leitor; retorna o número de leitores restantes no processo"""
+        self.mutex.acquire()
+        self.leitores_ativos -= 1
+        leitores = self.leitores_ativos
+        if leitores == 0:
+            self._destravar_arquivo()
+            self.wrt.release()  # último leitor libera escritores
+        self.mutex.release()
+        return leitores
+
+    def acquire_write(self):
+        """Entrada do escritor (acesso exclusivo entre processos)"""
+        self.wrt.acquire()
+        self._travar_arquivo(fcntl.LOCK_EX)
+
+    def _try_acquire_write(self, timeout=None):
+        """Uma tentativa de entrada do escritor"""
+        prazo = _prazo(timeout)
+        if not self.wrt.acquire(timeout=_restante(prazo)):
+            return False
+        if not self._travar_arquivo(fcntl.LOCK_EX, _restante(prazo)):
+            self.wrt.release()
+            return False
+        return True
+
+    def release_write(self):
+        """Saída do escritor"""
+        self._destravar_arquivo()
+        self.wrt.release()
+
+    def fechar(self):
+        """Fecha o descritor (libera qualquer trava restante do processo)"""
+        os.close(self.descritor)
@@ -0,0 +1,155 @@
+"""
+Trava de leitura/escrita para asyncio
+Protocolos da RWLockCondicao (preferência para escritores), da RWLock
+(preferência para leitores) e da RWLockJusto (fila), com corrotinas: leitores
+e escritores esperam em uma asyncio.Condition sem ocupar uma thread cada
+"""
+import asyncio
+from contextlib import asynccontextmanager
+
+
+# Regra de admissão da RWLockAsync para cada política de rwlock.POLITICAS que
+# ela reproduz; 'condicao' e 'adaptativa' seguem o protocolo da RWLockCondicao
+POLITICAS_ASYNC = {
+    'leitores': 'leitores',
+    'escritores': 'escritores',
+    'condicao': 'escritores',
+    'adaptativa': 'escritores',
+    'justa': 'justa'
+}
+
+
+class RWLockAsync:
+    """Trava leitores-escritores para corrotinas
+
+    Com a política 'escritores' (padrão), leitores entram quando não há
+    escritor ativo nem aguardando; com 'leitores', só um escritor ativo os
+    retém; com 'justa', todos são atendidos por ordem de chegada (tickets),
+    e leitores consecutivos entram juntos. Escritores esperam os leitores
+    ativos saírem. Uma espera cancelada (por exemplo por asyncio.wait_for ou
+    Task.cancel) desfaz o registro do ator e acorda quem ele retinha.
+    """
+
+    def __init__(self, politica='escritores'):
+        if politica not in POLITICAS_ASYNC:
+            raise ValueError(f"Política sem versão assíncrona: {politica} "
+                             f"(disponíveis: {', '.join(POLITICAS_ASYNC)})")
+        self.politica = POLITICAS_ASYNC[politica]
+        self.condicao = asyncio.Condition()
+        self.leitores_ativos = 0
+        self.escritor_ativo = False
+        self.escritores_aguardando = 0
+        # Fila por tickets da política 'justa'
+        self.proximo_ticket = 0
+        self.atendendo = 0
+        self.desistentes = set()
+
+    def _tirar_ticket(self):
+        ticket = self.proximo_ticket
+        self.proximo_ticket += 1
+        return ticket
+
+    def _avancar_fila(self):
+        """Passa a vez ao próximo ticket, pulando os que desistiram"""
+        self.atendendo += 1
+        while self.atendendo in self.desistentes:
+            self.desistentes.remove(self.atendendo)
+            self.atendendo += 1
+
+    def _pode_ler(self, ticket):
+        if self.escritor_ativo:
+            return False
+        if self.politica == 'escritores':
+            return not self.escritores_aguardando
+        if self.politica == 'justa':
+            return ticket == self.atendendo
+        return True
+
+    def _pode_escrever(self, ticket):
+        if self.escritor_ativo or self.leitores_ativos:
+            return False
+        return self.politica != 'justa' or ticket == self.atendendo
+
+    async def _aguardar(self, predicado, ticket, escritor):
+        """Espera o predicado; se cancelado, desfaz o registro e acorda os retidos"""
+        try:
+            await self.condicao.wait_for(predicado)
+        except asyncio.CancelledError:
+            if escritor:
+                self.escritores_aguardando -= 1
+            if self.politica == 'justa':
+                if ticket == self.atendendo:
+                    self._avancar_fila()
+                else:
+                    self.desistentes.add(ticket)
+            self.condicao.notify_all()
+            raise
+
+    async def acquire_read(self):
+        """Entrada do leitor; retorna o número de leitores ativos"""
+        async with self.condicao:
+            ticket = self._tirar_ticket()
+            await self._aguardar(lambda: self._pode_ler(ticket), ticket, escritor=False)
+            self.leitores_ativos += 1
+            if self.politica == 'justa':
+                self._avancar_fila()
+                self.condicao.notify_all()  # o próximo da fila pode ser outro leitor
+            return self.leitores_ativos
+
+    async def release_read(self):
+        """Saída do leitor; retorna o número de leitores restantes"""
+        async with self.condicao:
+            self.leitores_ativos -= 1
+            if self.leitores_ativos == 0 and self.escritores_aguardando:
+                self.condicao.notify_all()
+            return self.leitores_ativos
+
+    async def acquire_write(self):
+        """Entrada do escritor (acesso exclusivo)"""
+        async with self.condicao:
+            ticket = self._tirar_ticket()
+            self.escritores_aguardando += 1
+            await self._aguardar(lambda: self._pode_escrever(ticket), ticket, escritor=True)
+            self.escritores_aguardando -= 1
+            self.escritor_ativo = True
+            if self.politica == 'justa':
+                self._avancar_fila()
+
+    async def release_write(self):
+        """Saída do escritor; acorda leitores e escritores"""
+        async with self.condicao:
+            self.escritor_ativo = False
+            self.condicao.notify_all()
+
+    async def try_acquire_read(self, timeout=None):
+        """Entrada do leitor com limite de tempo; retorna 0 se esgotar"""
+        try:
+            return await asyncio.wait_for(self.acquire_read(), timeout)
+        except asyncio.TimeoutError:
+            return 0
+
+    async def try_acquire_write(self, timeout=None):
+        """Entrada do escritor com limite de tempo; retorna False se esgotar"""
+        try:
+            await asyncio.wait_for(self.acquire_write(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    @asynccontextmanager
+    async def read(self):
+        """Context manager assíncrono para seção de leitura"""
+        await self.acquire_read()
+        try:
+            yield self
+        finally:
+            await self.release_read()
+
+    @asynccontextmanager
+    async def write(self):
+        """Context manager assíncrono para seção de escrita"""
+        await self.acquire_write()
+        try:
+            yield self
+        finally:
+            await self.release_write()
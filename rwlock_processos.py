@@ -0,0 +1,79 @@
+"""
+Trava de leitura/escrita entre processos
+Mesmo protocolo clássico da RWLock, com semáforos de multiprocessing e o
+contador de leitores em multiprocessing.shared_memory, para que leitores em
+processos diferentes leiam em paralelo de verdade (sem o GIL)
+"""
+import multiprocessing
+from multiprocessing import shared_memory, resource_tracker
+from rwlock import RWLock
+
+
+class InteirosCompartilhados:
+    """Vetor de inteiros de 64 bits em memória compartilhada entre processos
+
+    O processo que cria o vetor é o dono e deve chamar fechar() no fim para
+    liberar o segmento. Outros processos o recebem como argumento de
+    Process (herdado no fork ou reanexado pelo nome no spawn).
+    """
+
+    def __init__(self, tamanho=1):
+        self.tamanho = tamanho
+        self.memoria = shared_memory.SharedMemory(create=True, size=8 * tamanho)
+        self.valores = self.memoria.buf.cast('q')
+        for i in range(tamanho):
+            self.valores[i] = 0
+        self.dono = True
+
+    def __getitem__(self, indice):
+        return self.valores[indice]
+
+    def __setitem__(self, indice, valor):
+        self.valores[indice] = valor
+
+    def __getstate__(self):
+        return {'tamanho': self.tamanho, 'nome': self.memoria.name}
+
+    def __setstate__(self, estado):
+        self.tamanho = estado['tamanho']
+        self.memoria = shared_memory.SharedMemory(name=estado['nome'])
+        # O segmento pertence ao processo criador; sem isto o resource_tracker
+        # do processo filho o removeria ao terminar
+        resource_tracker.unregister(self.memoria._name, 'shared_memory')
+        self.valores = self.memoria.buf.cast('q')
+        self.dono = False
+
+    def fechar(self):
+        """Desanexa o segmento; o dono também o remove"""
+        self.valores.release()
+        self.memoria.close()
+        if self.dono:
+            self.memoria.unlink()
+
+
+class RWLockProcessos(RWLock):
+    """RWLock (preferência para leitores) utilizável entre processos
+
+    Reaproveita os algoritmos da RWLock: só troca os semáforos por semáforos
+    de multiprocessing e guarda `leitores_ativos` em memória compartilhada.
+    """
+
+    def __init__(self, contexto=None):
+        contexto = contexto or multiprocessing.get_context()
+        self.mutex = contexto.Semaphore(1)   # protege o contador de leitores
+        self.wrt = contexto.Semaphore(1)     # garante exclusividade de escrita
+        self.contador = InteirosCompartilhados(1)
+        self.rapidas = self.lentas = 0       # contagens locais de cada processo
+
+    @property
+    def leitores_ativos(self):
+        """Contador de leitores ativos (em memória compartilhada)"""
+        return self.contador[0]
+
+    @leitores_ativos.setter
+    def leitores_ativos(self, valor):
+        self.contador[0] = valor
+
+    def fechar(self):
+        """Libera a memória compartilhada do contador"""
+        self.contador.fechar()
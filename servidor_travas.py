@@ -0,0 +1,411 @@
+"""
+Servidor de travas leitores-escritores (TCP ou socket Unix)
+Leitores e escritores em processos diferentes, ou em "nós" no localhost,
+compartilham uma trava lógica pedindo acquire/release a este servidor.
+O cliente envia pedidos em pipeline (sem esperar a resposta anterior) e
+pode agrupar liberações em lotes
+
+Protocolo em linhas de texto, uma mensagem por linha:
+    <id> R <nome> <timeout>   entrada do leitor   -> <id> <leitores ativos ou 0>
+    <id> W <nome> <timeout>   entrada do escritor -> <id> <1 ou 0>
+    <id> ? <nome> -           leitores ativos     -> <id> <leitores ativos>
+    <id> r <nome> -           saída do leitor     (sem resposta)
+    <id> w <nome> -           saída do escritor   (sem resposta)
+    <id> c <nome> -           cancela a espera do pedido <id> (sem resposta)
+O timeout é em segundos ou '-' (sem limite). A espera toda acontece no
+servidor, então o pedido mantém seu lugar na fila das políticas justa e
+prioridade; o cancelamento faz o pedido responder 0 (ou o que já obteve).
+Cada conexão é atendida em ordem e só libera o que obteve: liberações sem
+entrada correspondente na mesma conexão são ignoradas. Ao fechar a conexão,
+as esperas em curso são canceladas e as travas que ela ainda mantinha são
+liberadas.
+"""
+import argparse
+import collections
+import itertools
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from concurrent import futures
+from rwlock import RWLockBase, POLITICAS, INTERVALO_CANCELAMENTO, criar_rwlock
+
+ENDERECO_PADRAO = ('127.0.0.1', 0)  # porta 0 = escolhida pelo sistema
+
+
+def _sem_atraso(conexao):
+    """Desliga o algoritmo de Nagle em conexões TCP (mensagens pequenas)"""
+    if conexao.family in (socket.AF_INET, socket.AF_INET6):
+        conexao.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class _Atendente(socketserver.StreamRequestHandler):
+    """Atende uma conexão: executa os pedidos em ordem
+
+    Uma thread lê as linhas da conexão enquanto a do atendimento pode estar
+    esperando uma trava: cancelamentos (c) são registrados na hora e os
+    demais pedidos entram na fila de atendimento.
+    """
+
+    def _ler(self, pedidos, cancelados, encerrada):
+        for linha in self.rfile:
+            campos = linha.decode().split()
+            if campos[1] == 'c':
+                cancelados.add(campos[0])
+            else:
+                pedidos.put(campos)
+        encerrada.set()
+        pedidos.put(None)
+
+    def handle(self):
+        _sem_atraso(self.connection)
+        posse = collections.Counter()  # (operação, nome) -> travas mantidas pela conexão
+        pedidos, cancelados, encerrada = queue.Queue(), set(), threading.Event()
+        threading.Thread(target=self._ler, args=(pedidos, cancelados, encerrada), daemon=True).start()
+        try:
+            for id, operacao, nome, timeout in iter(pedidos.get, None):
+                trava = self.server.trava(nome)
+                timeout = None if timeout == '-' else float(timeout)
+                cancelar = lambda: encerrada.is_set() or id in cancelados
+                if operacao == 'R':
+                    resposta = trava.try_acquire_read(timeout, cancelar)
+                    if resposta:
+                        posse['R', nome] += 1
+                elif operacao == 'W':
+                    resposta = int(trava.try_acquire_write(timeout, cancelar))
+                    if resposta:
+                        posse['W', nome] += 1
+                elif operacao == '?':
+                    resposta = trava.leitores_ativos
+                else:
+                    # Liberação só do que esta conexão mantém; as demais são ignoradas
+                    mantida = (operacao.upper(), nome)
+                    if posse[mantida] > 0:
+                        posse[mantida] -= 1
+                        liberar = trava.release_read if operacao == 'r' else trava.release_write
+                        liberar()
+                    continue
+                cancelados.discard(id)
+                self.wfile.write(f"{id} {resposta}\n".encode())
+        finally:
+            for (operacao, nome), quantidade in posse.items():
+                trava = self.server.trava(nome)
+                liberar = trava.release_read if operacao == 'R' else trava.release_write
+                for _ in range(quantidade):
+                    liberar()
+
+
+class _ServidorTCP(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _ServidorUnix(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class ServidorTravas:
+    """Servidor de travas nomeadas (uma trava da `politica` por nome)
+
+    `endereco` é uma tupla (host, porta) para TCP ou um caminho para socket
+    Unix. A política padrão é 'condicao' (RWLockCondicao). iniciar() atende
+    em uma thread de fundo; parar() encerra.
+    """
+
+    def __init__(self, endereco=ENDERECO_PADRAO, politica='condicao'):
+        if politica not in POLITICAS:
+            raise ValueError(f"Política desconhecida: {politica}")
+        self.politica = politica
+        tipo = _ServidorUnix if isinstance(endereco, str) else _ServidorTCP
+        self.servidor = tipo(endereco, _Atendente)
+        self.servidor.travas = {}
+        self.servidor.mutex = threading.Lock()
+        self.servidor.trava = self.trava
+        self.thread = None
+
+    @property
+    def endereco(self):
+        """Endereço efetivo (com a porta escolhida pelo sistema)"""
+        return self.servidor.server_address
+
+    def trava(self, nome):
+        """Trava associada ao nome (criada no primeiro uso)"""
+        with self.servidor.mutex:
+            if nome not in self.servidor.travas:
+                self.servidor.travas[nome] = criar_rwlock(self.politica)
+            return self.servidor.travas[nome]
+
+    def iniciar(self):
+        """Atende conexões em uma thread de fundo"""
+        self.thread = threading.Thread(target=self.servidor.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def parar(self):
+        """Encerra o atendimento e libera o endereço"""
+        self.servidor.shutdown()
+        self.servidor.server_close()
+        if isinstance(self.endereco, str) and os.path.exists(self.endereco):
+            os.unlink(self.endereco)
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *excecao):
+        self.parar()
+
+
+class ClienteTravas:
+    """Conexão com o servidor de travas, com pipeline e lotes de liberação
+
+    pedir() envia o pedido e retorna um Future sem esperar a resposta, de
+    modo que vários pedidos seguem no mesmo envio. As liberações não têm
+    resposta e ficam acumuladas até somarem `lote` mensagens ou até o
+    próximo pedido (que as leva junto). Com lote > 1 a trava só é liberada
+    no servidor quando o lote é enviado: use descarregar() antes de pausas.
+
+    Os pedidos de uma conexão são atendidos em ordem; atores que podem
+    bloquear devem ter cada um sua conexão.
+    """
+
+    def __init__(self, endereco, lote=1):
+        familia = socket.AF_UNIX if isinstance(endereco, str) else socket.AF_INET
+        self.socket = socket.socket(familia, socket.SOCK_STREAM)
+        self.socket.connect(endereco)
+        _sem_atraso(self.socket)
+        self.lote = lote
+        self.ids = itertools.count()
+        self.pendentes = collections.deque()  # (id, Future) na ordem de envio
+        self.liberacoes = []                  # liberações ainda não enviadas
+        self.envio = threading.Lock()
+        self.envios = 0                       # chamadas a sendall (idas ao servidor)
+        self.mensagens = 0
+        self.receptor = threading.Thread(target=self._receber, daemon=True)
+        self.receptor.start()
+
+    def _enviar(self, mensagens):
+        """Envia as mensagens de uma só vez; deve ser chamada com `envio` adquirido"""
+        self.socket.sendall(''.join(mensagens).encode())
+        self.envios += 1
+        self.mensagens += len(mensagens)
+
+    def _receber(self):
+        """Thread receptora: entrega cada resposta ao Future correspondente"""
+        with self.socket.makefile('rb') as entrada:
+            for linha in entrada:
+                id, valor = linha.decode().split()
+                id_pedido, futuro = self.pendentes.popleft()
+                if int(id) != id_pedido:
+                    futuro.set_exception(ConnectionError(f"Resposta fora de ordem: {id}"))
+                    break
+                futuro.set_result(int(valor))
+        while self.pendentes:
+            self.pendentes.popleft()[1].set_exception(ConnectionError("Conexão encerrada"))
+
+    def pedir(self, operacao, nome, timeout=None):
+        """Envia um pedido (R, W ou ?) junto com as liberações acumuladas; retorna um Future"""
+        futuro = futures.Future()
+        timeout = '-' if timeout is None else f"{timeout:.6f}"
+        with self.envio:
+            id = next(self.ids)
+            self.pendentes.append((id, futuro))
+            self._enviar(self.liberacoes + [f"{id} {operacao} {nome} {timeout}\n"])
+            self.liberacoes = []
+        return futuro
+
+    def liberar(self, operacao, nome):
+        """Acumula uma liberação (r ou w); envia o lote quando completo"""
+        with self.envio:
+            self.liberacoes.append(f"{next(self.ids)} {operacao} {nome} -\n")
+            if len(self.liberacoes) >= self.lote:
+                self._enviar(self.liberacoes)
+                self.liberacoes = []
+
+    def cancelar(self, nome, futuro):
+        """Cancela a espera do pedido do `futuro`; ele ainda recebe a resposta (0 se não obteve)"""
+        with self.envio:
+            for id, pendente in list(self.pendentes):
+                if pendente is futuro:
+                    self._enviar(self.liberacoes + [f"{id} c {nome} -\n"])
+                    self.liberacoes = []
+                    break
+
+    def descarregar(self):
+        """Envia as liberações acumuladas"""
+        with self.envio:
+            if self.liberacoes:
+                self._enviar(self.liberacoes)
+                self.liberacoes = []
+
+    def fechar(self):
+        """Envia as liberações pendentes e encerra a conexão"""
+        self.descarregar()
+        self.socket.shutdown(socket.SHUT_RDWR)
+        self.socket.close()
+        self.receptor.join()
+
+
+class TravaRemota(RWLockBase):
+    """Trava lógica `nome` do servidor, com a interface das demais travas
+
+    A conexão é aberta no primeiro uso em cada processo; a trava pode ser
+    passada como argumento de multiprocessing.Process (fork ou spawn).
+    release_read() não retorna o número de leitores, pois a liberação não
+    tem resposta; use leitores_ativos para consultar o servidor.
+
+    As entradas com timeout e cancelamento viram um único pedido: a espera
+    acontece no servidor, sem perder o lugar na fila, e `cancelar` é
+    consultado aqui a cada INTERVALO_CANCELAMENTO.
+    """
+
+    def __init__(self, endereco, nome='dados', lote=1):
+        self.endereco = endereco
+        self.nome = nome
+        self.lote = lote
+        self._conexao = None
+        self._pid = None
+
+    @property
+    def cliente(self):
+        """Conexão deste processo com o servidor"""
+        if self._conexao is None or self._pid != os.getpid():
+            self._conexao = ClienteTravas(self.endereco, self.lote)
+            self._pid = os.getpid()
+        return self._conexao
+
+    @property
+    def leitores_ativos(self):
+        """Leitores ativos no servidor"""
+        return self.cliente.pedir('?', self.nome).result()
+
+    def acquire_read(self):
+        """Entrada do leitor; retorna o número de leitores ativos"""
+        return self.cliente.pedir('R', self.nome).result()
+
+    def _esperar_pedido(self, operacao, timeout, cancelar):
+        """Envia um pedido de entrada e aguarda a resposta, cancelando-o se `cancelar` mandar"""
+        cliente = self.cliente
+        futuro = cliente.pedir(operacao, self.nome, timeout)
+        while cancelar is not None:
+            try:
+                return futuro.result(INTERVALO_CANCELAMENTO)
+            except futures.TimeoutError:
+                if cancelar():
+                    cliente.cancelar(self.nome, futuro)
+                    break
+        return futuro.result()
+
+    def _try_acquire_read(self, timeout=None):
+        """Uma tentativa de entrada do leitor; retorna 0 se esgotar"""
+        return self.cliente.pedir('R', self.nome, timeout).result()
+
+    def try_acquire_read(self, timeout=None, cancelar=None):
+        """Entrada do leitor com limite de tempo; retorna 0 se esgotar ou cancelar"""
+        return self._esperar_pedido('R', timeout, cancelar)
+
+    def release_read(self):
+        """Saída do leitor"""
+        self.cliente.liberar('r', self.nome)
+
+    def acquire_write(self):
+        """Entrada do escritor (acesso exclusivo)"""
+        self.cliente.pedir('W', self.nome).result()
+
+    def _try_acquire_write(self, timeout=None):
+        """Uma tentativa de entrada do escritor"""
+        return bool(self.cliente.pedir('W', self.nome, timeout).result())
+
+    def try_acquire_write(self, timeout=None, cancelar=None):
+        """Entrada do escritor com limite de tempo; retorna False se esgotar ou cancelar"""
+        return bool(self._esperar_pedido('W', timeout, cancelar))
+
+    def release_write(self):
+        """Saída do escritor"""
+        self.cliente.liberar('w', self.nome)
+
+    def fechar(self):
+        """Encerra a conexão deste processo"""
+        if self._conexao is not None and self._pid == os.getpid():
+            self._conexao.fechar()
+        self._conexao = None
+
+    def __getstate__(self):
+        return {'endereco': self.endereco, 'nome': self.nome, 'lote': self.lote}
+
+    def __setstate__(self, estado):
+        self.__init__(**estado)
+
+
+def medir_ida_e_volta(endereco, operacoes, profundidade=1, lote=1):
+    """Mede leituras (acquire+release) com `profundidade` pedidos em pipeline
+
+    Retorna µs por operação e envios ao servidor por operação.
+    """
+    cliente = ClienteTravas(endereco, lote)
+    try:
+        inicio = time.perf_counter()
+        feitas = 0
+        while feitas < operacoes:
+            rodada = min(profundidade, operacoes - feitas)
+            futuros = [cliente.pedir('R', 'benchmark') for _ in range(rodada)]
+            for futuro in futuros:
+                futuro.result()
+            for _ in range(rodada):
+                cliente.liberar('r', 'benchmark')
+            feitas += rodada
+        cliente.descarregar()
+        cliente.pedir('?', 'benchmark').result()  # garante que as liberações chegaram
+        duracao = time.perf_counter() - inicio
+        return {
+            'us_por_operacao': duracao / operacoes * 1e6,
+            'envios_por_operacao': cliente.envios / operacoes
+        }
+    finally:
+        cliente.fechar()
+
+
+def executar_benchmark(endereco=None, operacoes=5000, modos=((1, 1), (1, 16), (16, 16), (64, 64))):
+    """Mede cada combinação (profundidade, lote); retorna {(profundidade, lote): medidas}"""
+    with ServidorTravas(endereco or ENDERECO_PADRAO) as servidor:
+        return {modo: medir_ida_e_volta(servidor.endereco, operacoes, *modo) for modo in modos}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor de travas leitores-escritores")
+    parser.add_argument('modo', choices=['servir', 'benchmark'])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=5050)
+    parser.add_argument('--unix', help="caminho de socket Unix (em vez de TCP)")
+    parser.add_argument('--operacoes', type=int, default=5000)
+    parser.add_argument('--politica', default='condicao', choices=list(POLITICAS),
+                        help="política das travas do servidor")
+    args = parser.parse_args()
+    endereco = args.unix or (args.host, args.porta)
+
+    if args.modo == 'servir':
+        servidor = ServidorTravas(endereco, args.politica)
+        print(f"Servidor de travas em {servidor.endereco} (Ctrl+C para encerrar)")
+        try:
+            servidor.servidor.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            servidor.servidor.server_close()
+        return
+
+    print("=" * 60)
+    print("BENCHMARK DO SERVIDOR DE TRAVAS - IDAS E VOLTAS POR OPERAÇÃO")
+    print("=" * 60)
+    if not args.unix:
+        endereco = (args.host, 0)
+    resultados = executar_benchmark(endereco, args.operacoes)
+    print(f"{'Pipeline':>10}{'Lote':>8}{'µs/operação':>16}{'envios/operação':>18}")
+    for (profundidade, lote), medidas in resultados.items():
+        print(f"{profundidade:>10}{lote:>8}{medidas['us_por_operacao']:>16.1f}"
+              f"{medidas['envios_por_operacao']:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Execução sem interface gráfica
+Roda um cenário (configuração pré-definida ou JSON) em um dos motores e
+escreve as métricas em JSON, uma linha por cenário, sem saída por evento,
+junto com a previsão do modelo analítico para o mesmo cenário.
+Funciona em máquinas sem display, onde as interfaces tkinter não abrem
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import particoes
+import motor_async
+import motor_processos
+import motor_eventos
+from modelo_analitico import prever
+from rwlock import POLITICAS
+from rwlock_async import POLITICAS_ASYNC
+from configuracoes import CONFIGURACOES, CONFIG_PADRAO
+
+# Motores disponíveis; todos aceitam (config, duracao, escala_tempo, semente).
+# 'eventos' usa tempo virtual e é o único que não espera em tempo real
+MOTORES = {
+    'eventos': motor_eventos.simular,
+    'threads': particoes.simular,
+    'async': motor_async.simular,
+    'processos': motor_processos.simular
+}
+
+# Políticas que cada motor sabe executar; os demais aceitam todas de rwlock.POLITICAS
+POLITICAS_POR_MOTOR = {
+    'async': list(POLITICAS_ASYNC),
+    'processos': ['leitores']
+}
+
+
+# Campos validados em carregar_config: contagens inteiras (>= 0) e pares de
+# tempos (min e max positivos, min <= max)
+CONTAGENS = ['num_leitores', 'num_escritores', 'escritores_prioritarios', 'leitores_em_lote']
+TEMPOS = ['delay_leitor', 'delay_escritor', 'tempo_leitura', 'tempo_escrita']
+
+
+def validar_config(config):
+    """Gera ValueError se a configuração tiver valores sem sentido para os motores"""
+    if config['politica'] not in POLITICAS:
+        raise ValueError(f"Política desconhecida: {config['politica']}")
+    for campo in CONTAGENS + ['num_shards']:
+        minimo = 1 if campo == 'num_shards' else 0
+        valor = config[campo]
+        if isinstance(valor, bool) or not isinstance(valor, int) or valor < minimo:
+            raise ValueError(f"{campo} deve ser um inteiro >= {minimo} (recebido: {valor!r})")
+    for campo in TEMPOS:
+        minimo, maximo = config[f'{campo}_min'], config[f'{campo}_max']
+        for valor in (minimo, maximo):
+            if isinstance(valor, bool) or not isinstance(valor, (int, float)) or not valor > 0:
+                raise ValueError(f"{campo}_min e {campo}_max devem ser positivos (recebido: {valor!r})")
+        if minimo > maximo:
+            raise ValueError(f"{campo}_min ({minimo}) maior que {campo}_max ({maximo})")
+    duracao = config['duracao_teste']
+    if isinstance(duracao, bool) or not isinstance(duracao, (int, float)) or not duracao > 0:
+        raise ValueError(f"duracao_teste deve ser positiva (recebido: {duracao!r})")
+
+
+def carregar_config(origem):
+    """Retorna a configuração de `origem`: nome pré-definido, arquivo JSON ou JSON em texto
+
+    O JSON pode trazer só os campos que mudam; os demais vêm da configuração
+    indicada em "base" (padrão se omitida). O resultado passa por
+    validar_config().
+    """
+    if origem in CONFIGURACOES:
+        return CONFIGURACOES[origem].copy()
+    if os.path.isfile(origem):
+        with open(origem, encoding='utf-8') as arquivo:
+            campos = json.load(arquivo)
+    elif origem.lstrip().startswith('{'):
+        campos = json.loads(origem)
+    else:
+        raise ValueError(f"Configuração desconhecida: {origem}")
+    if not isinstance(campos, dict):
+        raise ValueError("A configuração JSON deve ser um objeto")
+
+    base = campos.pop('base', 'padrao')
+    if base not in CONFIGURACOES:
+        raise ValueError(f"Configuração base desconhecida: {base}")
+    desconhecidos = set(campos) - set(CONFIG_PADRAO)
+    if desconhecidos:
+        raise ValueError(f"Campos desconhecidos: {', '.join(sorted(desconhecidos))}")
+    config = CONFIGURACOES[base].copy()
+    config.update(campos)
+    validar_config(config)
+    return config
+
+
+def _sem_infinitos(valor):
+    """Cópia de `valor` com infinitos e NaN trocados por None (null no JSON)"""
+    if isinstance(valor, dict):
+        return {chave: _sem_infinitos(v) for chave, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_sem_infinitos(v) for v in valor]
+    if isinstance(valor, float) and not math.isfinite(valor):
+        return None
+    return valor
+
+
+def validar_execucao(config, motor):
+    """Gera ValueError se `motor` não existe ou não executa a política de `config`
+
+    Chamada antes de simular (aqui e na varredura), para o resultado não
+    relatar uma política que não foi usada.
+    """
+    if motor not in MOTORES:
+        raise ValueError(f"Motor desconhecido: {motor}")
+    politica = config.get('politica', 'leitores')
+    if politica not in POLITICAS_POR_MOTOR.get(motor, POLITICAS):
+        raise ValueError(f"O motor '{motor}' não executa a política '{politica}'")
+    if config.get('num_shards', 1) < 1:
+        raise ValueError("num_shards deve ser pelo menos 1")
+
+
+def executar(config, motor='eventos', duracao=None, escala_tempo=1.0, semente=None):
+    """Executa um cenário e retorna as métricas do motor, com o motor, a configuração e a previsão
+
+    `previsao` traz os valores do modelo analítico (modelo_analitico.prever)
+    para comparar com os medidos. Uma política que o motor não executa gera
+    ValueError antes de simular (validar_execucao).
+    """
+    validar_execucao(config, motor)
+    resultado = MOTORES[motor](config, duracao, escala_tempo, semente)
+    resultado.update(motor=motor, config=config, previsao=prever(config, escala_tempo))
+    return resultado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Executa cenários sem interface e escreve as métricas em JSON")
+    parser.add_argument('configs', nargs='*', default=['padrao'],
+                        help="nome pré-definido, arquivo .json ou objeto JSON (vários: um por linha)")
+    parser.add_argument('--motor', default='eventos', choices=list(MOTORES.keys()))
+    parser.add_argument('--duracao', type=float,
+                        help="segundos por cenário (virtuais no motor 'eventos'; padrão: duracao_teste)")
+    parser.add_argument('--escala-tempo', type=float, default=1.0,
+                        help="fator aplicado aos tempos da configuração")
+    parser.add_argument('--semente', type=int)
+    parser.add_argument('--politica', choices=list(POLITICAS), help="sobrescreve a política de todos os cenários")
+    parser.add_argument('--indentar', action='store_true', help="JSON indentado")
+    args = parser.parse_args(argv)
+    if args.duracao is not None and not args.duracao > 0:
+        parser.error("--duracao deve ser positiva")
+    if not args.escala_tempo > 0:
+        parser.error("--escala-tempo deve ser positiva")
+
+    try:
+        configs = [carregar_config(origem) for origem in args.configs]
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    for config in configs:
+        if args.politica:
+            config['politica'] = args.politica
+        try:
+            resultado = executar(config, args.motor, args.duracao, args.escala_tempo, args.semente)
+        except ValueError as e:
+            parser.error(str(e))
+        # Esperas infinitas (inanição prevista) saem como null: JSON não tem Infinity
+        json.dump(_sem_infinitos(resultado), sys.stdout, ensure_ascii=False, allow_nan=False,
+                  indent=2 if args.indentar else None)
+        sys.stdout.write('\n')
+
+
+if __name__ == "__main__":
+    main()
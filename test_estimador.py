@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do estimador Monte Carlo vetorizado (requer NumPy)
+"""
+import unittest
+import tracemalloc
+import sys
+import os
+
+# Adicionar o diretório atual ao path para importar o módulo
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from estimador import np, estimar, leitores_ate_inanicao
+from motor_eventos import simular
+from configuracoes import get_config
+
+
+@unittest.skipIf(np is None, "NumPy não instalado")
+class TestEstimador(unittest.TestCase):
+    """Ocupação, espera do escritor e inanição"""
+
+    def test_um_leitor_ocupacao(self):
+        """Um leitor ocupa a trava pela fração leitura / (espera + leitura)"""
+        config = get_config('padrao')
+        config['num_leitores'] = 1
+        e = estimar(config, replicacoes=200, semente=0)
+        esperado = 0.65 / (1.25 + 0.65)
+        self.assertAlmostEqual(e['ocupacao'], esperado, delta=0.02)
+        self.assertLess(e['espera_escritor']['maximo'], config['tempo_leitura_max'] + 0.05)  # passo da grade
+
+    def test_deterministico(self):
+        a = estimar(get_config('muitos_leitores'), replicacoes=50, semente=3)
+        b = estimar(get_config('muitos_leitores'), replicacoes=50, semente=3)
+        self.assertEqual(a['espera_escritor'], b['espera_escritor'])
+
+    def test_justa_limita_espera(self):
+        """Na política justa o escritor espera no máximo uma leitura"""
+        config = get_config('muitos_leitores')
+        leitores = estimar(config, replicacoes=200, semente=0)
+        config['politica'] = 'justa'
+        justa = estimar(config, replicacoes=200, semente=0)
+        self.assertLessEqual(justa['espera_escritor']['maximo'], config['tempo_leitura_max'] + 0.01)
+        self.assertEqual(justa['prob_inanicao'], 0.0)
+        self.assertGreater(leitores['prob_inanicao'], 0.0)
+        self.assertGreater(leitores['espera_escritor']['media'], 10 * justa['espera_escritor']['media'])
+
+    def test_inanicao_cresce_com_leitores(self):
+        """A busca para no primeiro número de leitores acima da probabilidade"""
+        leitores, estimativas = leitores_ate_inanicao(get_config('muitos_leitores'), 0.05,
+                                                      max_leitores=12, replicacoes=200, semente=0)
+        self.assertIsNotNone(leitores)
+        self.assertEqual(len(estimativas), leitores)
+        self.assertGreater(estimativas[-1]['prob_inanicao'], 0.05)
+        self.assertTrue(all(e['prob_inanicao'] <= 0.05 for e in estimativas[:-1]))
+
+    def test_escritas_sorteadas(self):
+        """Escritores entram por chegadas sorteadas; sem escritores o leitor não espera"""
+        config = get_config('muitos_leitores_justa')
+        e = estimar(config, replicacoes=100, semente=0)
+        # Uma escrita a cada (intervalo + espera + escrita) na janela de chegadas
+        ciclo = 0.75 + e['espera_escritor']['media'] + 0.75
+        janela = (0.5 - 0.1) * e['horizonte']
+        self.assertAlmostEqual(e['espera_escritor']['quantidade'] / 100, janela / ciclo, delta=1.0)
+        self.assertGreater(e['espera_leitor']['media'], 0.0)
+
+        config['num_escritores'] = 0
+        sem_escritores = estimar(config, replicacoes=20, semente=0)
+        self.assertEqual(sem_escritores['espera_escritor']['quantidade'], 0)
+        self.assertEqual(sem_escritores['espera_leitor']['maximo'], 0.0)
+
+    def test_leitor_espera_escritor_na_fila(self):
+        """Fora da preferência para leitores, o leitor também espera o escritor que aguarda"""
+        config = get_config('muitos_leitores')
+        leitores = estimar(config, replicacoes=100, semente=0)
+        config['politica'] = 'escritores'
+        escritores = estimar(config, replicacoes=100, semente=0)
+        self.assertGreater(escritores['espera_leitor']['media'], leitores['espera_leitor']['media'])
+
+    def test_proximo_do_motor_de_eventos(self):
+        """Com leituras predominantes as esperas ficam perto das do motor de eventos"""
+        config = get_config('muitos_leitores_justa')
+        e = estimar(config, replicacoes=200, semente=0)
+        resultado = simular(config, duracao=3600, semente=0)
+        for ator in ('espera_escritor', 'espera_leitor'):
+            medido = resultado[ator]['media']
+            self.assertAlmostEqual(e[ator]['media'], medido, delta=0.2 * medido, msg=ator)
+
+    def test_custo_limitado_no_stress(self):
+        """Padrões no preset stress: grade limitada e replicações em lotes cabem em memória e tempo"""
+        tracemalloc.start()
+        try:
+            e = estimar(get_config('stress'), semente=0)
+            pico = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(pico, 256 * 2 ** 20)
+        self.assertLess(e['tempo_real'], 5.0)
+        self.assertGreater(e['espera_leitor']['quantidade'], 0)
+
+    def test_politica_desconhecida(self):
+        config = get_config('padrao')
+        config['politica'] = 'inexistente'
+        with self.assertRaises(ValueError):
+            estimar(config, replicacoes=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,24 +13,27 @@ import os
 # Adicionar o diretório atual ao path para importar o módulo
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from rwlock import RWLock
+
 class LeitoresEscritoresTest:
     """Classe para testes do problema Leitores-Escritores"""
     
     def __init__(self):
         self.dados = 0
-        self.mutex = threading.Semaphore(1)
-        self.wrt = threading.Semaphore(1)
-        self.leitores_ativos = 0
+        self.lock = RWLock()
         self.log = []
         self.log_lock = threading.Lock()
+    
+    @property
+    def leitores_ativos(self):
+        """Número de leitores ativos na trava"""
+        return self.lock.leitores_ativos
         
     def reset(self):
         """Resetar estado para novo teste"""
         self.dados = 0
-        self.leitores_ativos = 0
         self.log = []
-        self.mutex = threading.Semaphore(1)
-        self.wrt = threading.Semaphore(1)
+        self.lock = RWLock()
         
     def log_evento(self, evento):
         """Log thread-safe de eventos"""
@@ -46,11 +49,7 @@ class LeitoresEscritoresTest:
     def leitor(self, id, num_operacoes=1):
         """Leitor para testes"""
         for _ in range(num_operacoes):
-            self.mutex.acquire()
-            self.leitores_ativos += 1
-            if self.leitores_ativos == 1:
-                self.wrt.acquire()
-            self.mutex.release()
+            self.lock.acquire_read()
             
             # Leitura
             valor = self.dados
@@ -58,18 +57,14 @@ class LeitoresEscritoresTest:
             time.sleep(0.1)  # Simular tempo de leitura
             self.log_evento(f"LEITURA_FIM_L{id}_VALOR_{valor}")
             
-            self.mutex.acquire()
-            self.leitores_ativos -= 1
-            if self.leitores_ativos == 0:
-                self.wrt.release()
-            self.mutex.release()
+            self.lock.release_read()
             
             time.sleep(0.05)  # Pequena pausa entre operações
     
     def escritor(self, id, num_operacoes=1):
         """Escritor para testes"""
         for _ in range(num_operacoes):
-            self.wrt.acquire()
+            self.lock.acquire_write()
             
             # Escrita
             self.log_evento(f"ESCRITA_INICIO_E{id}")
@@ -78,7 +73,7 @@ class LeitoresEscritoresTest:
             self.dados += 1
             self.log_evento(f"ESCRITA_FIM_E{id}_DE_{old_value}_PARA_{self.dados}")
             
-            self.wrt.release()
+            self.lock.release_write()
             
             time.sleep(0.05)  # Pequena pausa entre operações
 
@@ -185,21 +180,13 @@ class TestLeitoresEscritores(unittest.TestCase):
         
         # Modificar para ter tempos mais longos para garantir sobreposição
         def leitor_longo(id):
-            self.sistema.mutex.acquire()
-            self.sistema.leitores_ativos += 1
-            if self.sistema.leitores_ativos == 1:
-                self.sistema.wrt.acquire()
-            self.sistema.mutex.release()
+            self.sistema.lock.acquire_read()
             
             self.sistema.log_evento(f"LEITURA_INICIO_L{id}")
             time.sleep(0.3)  # Leitura longa
             self.sistema.log_evento(f"LEITURA_FIM_L{id}")
             
-            self.sistema.mutex.acquire()
-            self.sistema.leitores_ativos -= 1
-            if self.sistema.leitores_ativos == 0:
-                self.sistema.wrt.release()
-            self.sistema.mutex.release()
+            self.sistema.lock.release_read()
         
         # Iniciar leitor
         leitor_thread = threading.Thread(target=leitor_longo, args=(1,))
@@ -232,12 +219,12 @@ class TestLeitoresEscritores(unittest.TestCase):
         
         # Modificar escritor para ser mais longo
         def escritor_longo(id):
-            self.sistema.wrt.acquire()
+            self.sistema.lock.acquire_write()
             self.sistema.log_evento(f"ESCRITA_INICIO_E{id}")
             time.sleep(0.3)  # Escrita longa
             self.sistema.dados += 1
             self.sistema.log_evento(f"ESCRITA_FIM_E{id}")
-            self.sistema.wrt.release()
+            self.sistema.lock.release_write()
         
         # Iniciar escritor
         escritor_thread = threading.Thread(target=escritor_longo, args=(1,))
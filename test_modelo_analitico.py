@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do modelo analítico de filas
+"""
+import unittest
+import math
+import sys
+import os
+
+# Adicionar o diretório atual ao path para importar o módulo
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modelo_analitico import prever, comparar, fracoes_de_acesso
+from motor_eventos import simular
+from configuracoes import get_config, CONFIGURACOES
+
+# Erro relativo aceito em cada configuração pré-definida; esperas muito curtas
+# também passam com até ERRO_ABSOLUTO_ESPERA segundos de diferença
+ERRO_VAZAO = 0.25
+ERRO_ESPERA = 0.35
+ERRO_ABSOLUTO_ESPERA = 0.05
+
+
+class TestModeloAnalitico(unittest.TestCase):
+    """Previsões comparadas com o motor de eventos"""
+
+    def assertProximo(self, previsto, medido, relativo):
+        self.assertLessEqual(abs(previsto - medido), relativo * max(abs(medido), 1e-3),
+                             f"previsto {previsto:.3f}, medido {medido:.3f}")
+
+    def test_sem_disputa(self):
+        """Um leitor sozinho: vazão 1 / (espera + leitura), sem espera pela trava"""
+        config = get_config('padrao')
+        config.update(num_leitores=1, num_escritores=0)
+        previsao = prever(config)
+        self.assertAlmostEqual(previsao['leituras_por_s'], 1 / (1.25 + 0.65))
+        self.assertEqual(previsao['espera_leitor'], 0.0)
+        self.assertEqual(previsao['gargalo'], 'carga')
+        self.assertTrue(previsao['convergiu'])
+
+    def test_erro_por_configuracao(self):
+        """Erro da previsão limitado contra o motor de eventos em todas as configurações"""
+        vazao_do_ator = {'espera_leitor': 'leituras_por_s', 'espera_escritor': 'escritas_por_s'}
+        for nome in CONFIGURACOES:
+            config = get_config(nome)
+            previsao = prever(config)
+            self.assertTrue(previsao['convergiu'], nome)
+            resultado = simular(config, duracao=3600, semente=0)
+            for metrica, (previsto, medido) in comparar(previsao, resultado).items():
+                with self.subTest(config=nome, metrica=metrica):
+                    if math.isinf(previsto):
+                        # Inanição prevista: o ator quase não entra na simulação
+                        self.assertLess(resultado[vazao_do_ator[metrica]], 0.01)
+                    elif metrica in vazao_do_ator:
+                        if abs(previsto - medido) > ERRO_ABSOLUTO_ESPERA:
+                            self.assertProximo(previsto, medido, ERRO_ESPERA)
+                    else:
+                        self.assertProximo(previsto, medido, ERRO_VAZAO)
+
+    def test_inanicao_limitada(self):
+        """Espera de milhares de ciclos do ator vira inanição (infinita)"""
+        previsao = prever(get_config('stress_adaptativa'))
+        self.assertEqual(previsao['espera_leitor'], math.inf)
+        self.assertEqual(previsao['leituras_por_s'], 0.0)
+        self.assertEqual(previsao['fracao_espera_leitor'], 1.0)
+
+    def test_inanicao_de_escritores(self):
+        """Preferência para leitores: espera do escritor muito maior que na justa"""
+        config = get_config('muitos_leitores')
+        leitores = prever(config)
+        config['politica'] = 'justa'
+        justa = prever(config)
+        self.assertGreater(leitores['espera_escritor'], 10 * justa['espera_escritor'])
+
+    def test_inanicao_de_leitores(self):
+        """Preferência para escritores com escritores constantes: leitores quase param"""
+        config = get_config('stress')
+        config['politica'] = 'escritores'
+        previsao = prever(config)
+        self.assertLess(previsao['leituras_por_s'], 0.01)
+        self.assertEqual(previsao['gargalo'], 'trava')
+
+    def test_particoes(self):
+        """Frações de acesso somam 1 e a concentração zipf aumenta a espera"""
+        config = get_config('particionado')
+        fracoes = fracoes_de_acesso(config)
+        self.assertAlmostEqual(sum(fracoes), 1.0)
+        self.assertEqual(fracoes, sorted(fracoes, reverse=True))
+        zipf = prever(config)
+        config['distribuicao_chaves'] = 'uniforme'
+        uniforme = prever(config)
+        self.assertGreater(zipf['espera_escritor'], uniforme['espera_escritor'])
+
+    def test_escala_tempo(self):
+        """Tempos escalados: vazão multiplicada e esperas divididas pelo fator"""
+        config = get_config('padrao')
+        normal, rapido = prever(config), prever(config, escala_tempo=0.1)
+        self.assertAlmostEqual(rapido['leituras_por_s'], 10 * normal['leituras_por_s'], places=6)
+        self.assertAlmostEqual(rapido['espera_escritor'], normal['espera_escritor'] / 10, places=6)
+
+    def test_politica_desconhecida(self):
+        config = get_config('padrao')
+        config['politica'] = 'inexistente'
+        with self.assertRaises(ValueError):
+            prever(config)
+
+
+if __name__ == "__main__":
+    unittest.main()
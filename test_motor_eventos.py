@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do motor de simulação por eventos discretos
+"""
+import unittest
+import time
+import sys
+import os
+
+# Adicionar o diretório atual ao path para importar o módulo
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from motor_eventos import MotorEventos, TravaVirtual, LEITURA, ESCRITA, simular
+from configuracoes import get_config
+
+
+def ator(trava, tipo, duracao, registro, nome):
+    """Pede a trava, registra a entrada e a mantém por `duracao`"""
+    yield (trava, tipo, 1)
+    registro.append((nome, trava.motor.agora))
+    yield duracao
+    trava.liberar(tipo)
+
+
+class TestTravaVirtual(unittest.TestCase):
+    """Regras de admissão em tempo virtual"""
+
+    def entradas(self, politica, pedidos):
+        """Executa os pedidos (nome, tipo, chegada) e retorna os instantes de entrada"""
+        motor = MotorEventos()
+        trava = TravaVirtual(motor, politica)
+        registro = []
+
+        def atrasado(chegada, tipo, nome):
+            yield chegada
+            yield from ator(trava, tipo, 1.0, registro, nome)
+
+        for nome, tipo, chegada in pedidos:
+            motor.iniciar(atrasado(chegada, tipo, nome))
+        motor.executar(100)
+        return dict(registro)
+
+    def test_leitores_compartilham(self):
+        """Leitores entram juntos; escritor espera todos saírem"""
+        entradas = self.entradas('leitores', [('r1', LEITURA, 0), ('r2', LEITURA, 0.5),
+                                             ('w', ESCRITA, 0.6)])
+        self.assertEqual(entradas['r2'], 0.5)
+        self.assertEqual(entradas['w'], 1.5)
+
+    def test_preferencia_leitores(self):
+        """Leitor que chega depois do escritor passa à frente dele"""
+        entradas = self.entradas('leitores', [('r1', LEITURA, 0), ('w', ESCRITA, 0.1),
+                                             ('r2', LEITURA, 0.5)])
+        self.assertEqual(entradas['r2'], 0.5)
+        self.assertEqual(entradas['w'], 1.5)
+
+    def test_preferencia_escritores(self):
+        """Escritor aguardando retém os leitores que chegam depois"""
+        for politica in ('escritores', 'justa', 'condicao'):
+            entradas = self.entradas(politica, [('r1', LEITURA, 0), ('w', ESCRITA, 0.1),
+                                                ('r2', LEITURA, 0.5)])
+            self.assertEqual(entradas['w'], 1.0, politica)
+            self.assertEqual(entradas['r2'], 2.0, politica)
+
+    def test_politica_desconhecida(self):
+        with self.assertRaises(ValueError):
+            TravaVirtual(MotorEventos(), 'inexistente')
+
+
+class TestSimular(unittest.TestCase):
+    """Simulação do modelo de configuracoes.py em tempo virtual"""
+
+    def test_horas_em_pouco_tempo(self):
+        """Uma hora simulada termina bem antes de um segundo real por hora"""
+        inicio = time.perf_counter()
+        resultado = simular(get_config('padrao'), duracao=3600, semente=0)
+        self.assertLess(time.perf_counter() - inicio, 30)
+        self.assertEqual(resultado['duracao'], 3600)
+        self.assertGreater(resultado['leituras'], 1000)
+        self.assertEqual(resultado['total'], resultado['escritas'])
+
+    def test_deterministico(self):
+        """Mesma semente, mesmo resultado"""
+        a = simular(get_config('balanceado'), duracao=600, semente=7)
+        b = simular(get_config('balanceado'), duracao=600, semente=7)
+        for chave in ('leituras', 'escritas', 'eventos', 'espera_escritor'):
+            self.assertEqual(a[chave], b[chave])
+
+    def test_inanicao_de_escritores(self):
+        """Com muitos leitores, a política justa limita a espera do escritor"""
+        config = get_config('muitos_leitores')
+        leitores = simular(config, duracao=3600, semente=0)
+        config['politica'] = 'justa'
+        justa = simular(config, duracao=3600, semente=0)
+        self.assertGreater(leitores['espera_escritor']['maximo'],
+                           2 * justa['espera_escritor']['maximo'])
+        self.assertGreater(justa['escritas'], leitores['escritas'])
+
+    def test_classes_de_prioridade(self):
+        """Escritores de alta prioridade esperam menos que os normais"""
+        resultado = simular(get_config('prioridade'), duracao=3600, semente=1)
+        classes = resultado['espera_por_classe']
+        self.assertEqual(set(classes), {'baixa', 'normal', 'alta'})
+        self.assertLess(classes['alta']['media'], classes['normal']['media'])
+
+    def test_particionado(self):
+        """Cada partição tem sua trava e o total soma todas"""
+        resultado = simular(get_config('particionado'), duracao=600, semente=0)
+        self.assertEqual(resultado['num_shards'], 8)
+        self.assertEqual(resultado['total'], resultado['escritas'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do recurso particionado (sharding)
+"""
+import unittest
+import random
+import sys
+import os
+
+# Adicionar o diretório atual ao path para importar o módulo
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from particoes import criar_sorteador, RecursoParticionado, simular
+from configuracoes import get_config
+
+
+class TestParticoes(unittest.TestCase):
+    """Testes unitários do recurso particionado"""
+
+    def test_sorteador_uniforme(self):
+        """Sorteio uniforme cobre todas as partições"""
+        sortear = criar_sorteador('uniforme', 4, random.Random(1))
+        self.assertEqual({sortear() for _ in range(400)}, {0, 1, 2, 3})
+
+    def test_sorteador_zipf(self):
+        """Zipf concentra acessos nas primeiras partições"""
+        sortear = criar_sorteador('zipf', 8, random.Random(1))
+        contagem = [0] * 8
+        for _ in range(4000):
+            contagem[sortear()] += 1
+        self.assertEqual(contagem.index(max(contagem)), 0)
+        self.assertGreater(contagem[0], 3 * contagem[7])
+
+    def test_distribuicao_invalida(self):
+        """Distribuição desconhecida gera ValueError"""
+        with self.assertRaises(ValueError):
+            criar_sorteador('normal', 4)
+
+    def test_escritores_em_particoes_diferentes(self):
+        """Escrita em uma partição não bloqueia outra"""
+        recurso = RecursoParticionado(2)
+        recurso.locks[0].acquire_write()
+        self.assertTrue(recurso.locks[1].try_acquire_write(timeout=0))
+        self.assertFalse(recurso.locks[0].try_acquire_write(timeout=0.05))
+        recurso.locks[1].release_write()
+        recurso.locks[0].release_write()
+
+        self.assertEqual(recurso.incrementar(1), 1)
+        self.assertEqual(recurso.ler(1), 1)
+        self.assertEqual(recurso.total(), 1)
+
+    def test_simular(self):
+        """Simulação curta contabiliza todas as escritas nas partições"""
+        config = get_config('particionado')
+        resultado = simular(config, duracao=0.5, escala_tempo=0.02, semente=0)
+        self.assertEqual(resultado['num_shards'], 8)
+        self.assertGreater(resultado['escritas'], 0)
+        self.assertEqual(sum(resultado['escritas_por_shard']), resultado['escritas'])
+        self.assertEqual(resultado['total'], resultado['escritas'])
+
+    def test_caminho_rapido_no_stress(self):
+        """Preset stress_adaptativa conta entradas rápidas e lentas"""
+        config = get_config('stress_adaptativa')
+        resultado = simular(config, duracao=0.5, semente=0)
+        entradas = resultado['entradas_rapidas'] + resultado['entradas_lentas']
+        self.assertGreaterEqual(entradas, resultado['leituras'] + resultado['escritas'])
+        self.assertGreater(resultado['entradas_lentas'], 0)  # há disputa no stress
+
+    def test_classes_de_prioridade(self):
+        """Preset prioridade em partições: cada ator entra com sua classe"""
+        config = get_config('prioridade')
+        config['num_shards'] = 2
+        resultado = simular(config, duracao=0.5, escala_tempo=0.05, semente=0)
+        self.assertEqual(set(resultado['espera_por_classe']), {'alta', 'normal', 'baixa'})
+        self.assertEqual(resultado['total'], resultado['escritas'])
+        self.assertEqual(sum(resultado['escritas_por_shard']), resultado['escritas'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,907 @@
+# -*- coding: utf-8 -*-
+"""
+Testes da trava de leitura/escrita (RWLock)
+Validam o protocolo compartilhado por todas as interfaces
+"""
+import unittest
+import threading
+import time
+import sys
+import os
+
+# Adicionar o diretório atual ao path para importar o módulo
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from rwlock import (RWLock, RWLockPreferenciaEscritores, RWLockJusto, RWLockCondicao,
+                    RWLockOtimista, RWLockSlots, RWLockPrioridade, RWLockReentrante,
+                    RWLockArrendamento, RWLockAdaptativa, SeqLock, RCU, ErroReentrada, criar_rwlock)
+from metricas import percentil
+from benchmark_rwlock import executar_benchmark
+
+
+class TestRWLock(unittest.TestCase):
+    """Testes unitários da RWLock"""
+
+    def setUp(self):
+        self.lock = RWLock()
+
+    def test_contagem_leitores(self):
+        """acquire/release de leitura retornam o número de leitores"""
+        self.assertEqual(self.lock.acquire_read(), 1)
+        self.assertEqual(self.lock.acquire_read(), 2)
+        self.assertEqual(self.lock.leitores_ativos, 2)
+        self.assertEqual(self.lock.release_read(), 1)
+        self.assertEqual(self.lock.release_read(), 0)
+
+    def test_leitores_simultaneos(self):
+        """Vários leitores mantêm a trava ao mesmo tempo"""
+        maximo = []
+        barreira = threading.Barrier(3)
+
+        def leitor():
+            with self.lock.read():
+                barreira.wait(timeout=2)
+                maximo.append(self.lock.leitores_ativos)
+
+        threads = [threading.Thread(target=leitor) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(max(maximo), 3)
+
+    def test_escritor_espera_leitor(self):
+        """Escritor só entra depois que o leitor sai"""
+        eventos = []
+
+        def escritor():
+            with self.lock.write():
+                eventos.append('escrita')
+
+        self.lock.acquire_read()
+        t = threading.Thread(target=escritor)
+        t.start()
+        time.sleep(0.1)
+        eventos.append('fim_leitura')
+        self.lock.release_read()
+        t.join()
+
+        self.assertEqual(eventos, ['fim_leitura', 'escrita'])
+
+    def test_exclusao_escritores(self):
+        """Escritores nunca se sobrepõem"""
+        contador = {'ativos': 0, 'maximo': 0, 'total': 0}
+
+        def escritor():
+            for _ in range(20):
+                with self.lock.write():
+                    contador['ativos'] += 1
+                    contador['maximo'] = max(contador['maximo'], contador['ativos'])
+                    contador['total'] += 1
+                    contador['ativos'] -= 1
+
+        threads = [threading.Thread(target=escritor) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(contador['maximo'], 1)
+        self.assertEqual(contador['total'], 80)
+
+    def test_try_acquire_write_timeout(self):
+        """Escritor desiste dentro do timeout se há leitor ativo"""
+        self.lock.acquire_read()
+        inicio = time.monotonic()
+        self.assertFalse(self.lock.try_acquire_write(timeout=0.1))
+        self.assertLess(time.monotonic() - inicio, 1.0)
+        self.lock.release_read()
+        # Trava continua utilizável após a desistência
+        self.assertTrue(self.lock.try_acquire_write(timeout=1))
+        self.lock.release_write()
+        self.assertTrue(self.lock.try_acquire_read(timeout=1))
+        self.lock.release_read()
+
+    def test_try_acquire_read_timeout(self):
+        """Leitor desiste dentro do timeout se há escritor ativo"""
+        self.lock.acquire_write()
+        self.assertFalse(self.lock.try_acquire_read(timeout=0.1))
+        self.assertEqual(self.lock.leitores_ativos, 0)
+        self.lock.release_write()
+        self.assertEqual(self.lock.try_acquire_read(timeout=1), 1)
+        self.lock.release_read()
+        self.assertTrue(self.lock.try_acquire_write(timeout=0))
+        self.lock.release_write()
+
+    def test_cancelamento(self):
+        """Espera sem timeout é abandonada logo após o pedido de cancelamento"""
+        parada = threading.Event()
+        resultados = []
+
+        self.lock.acquire_read()
+        t = threading.Thread(
+            target=lambda: resultados.append(self.lock.try_acquire_write(cancelar=parada.is_set)))
+        t.start()
+        time.sleep(0.1)
+        inicio = time.monotonic()
+        parada.set()
+        t.join(timeout=2)
+        self.assertFalse(t.is_alive())
+        self.assertLess(time.monotonic() - inicio, 0.5)
+        self.lock.release_read()
+
+        self.assertEqual(resultados, [False])
+        self.assertTrue(self.lock.try_acquire_write(timeout=1))
+        self.lock.release_write()
+
+    def test_desistencia_nao_bloqueia_fila(self):
+        """Threads que chegam depois de uma desistência ainda são atendidas"""
+        resultados = []
+
+        self.lock.acquire_read()
+        t = threading.Thread(
+            target=lambda: resultados.append(self.lock.try_acquire_write(timeout=0.1)))
+        t.start()
+        t.join()
+        self.lock.release_read()
+
+        def leitor():
+            resultados.append(bool(self.lock.try_acquire_read(timeout=1)))
+            self.lock.release_read()
+
+        t = threading.Thread(target=leitor)
+        t.start()
+        t.join()
+
+        self.assertEqual(resultados, [False, True])
+
+    def test_downgrade_retem_escritores(self):
+        """Escrita rebaixada vira leitura sem deixar outro escritor entrar"""
+        if not self.lock.suporta_rebaixamento:
+            self.skipTest("política sem downgrade")
+        self.lock.acquire_write()
+        self.assertEqual(self.lock.downgrade(), 1)
+        self.assertFalse(self.lock.try_acquire_write(timeout=0.1))
+        self.assertEqual(self.lock.try_acquire_read(timeout=1), 2)
+        self.lock.release_read()
+        self.assertEqual(self.lock.release_read(), 0)
+        self.assertTrue(self.lock.try_acquire_write(timeout=1))
+        self.lock.release_write()
+
+    def test_downgrade_acorda_leitores(self):
+        """Leitores retidos pela escrita entram junto com a leitura rebaixada"""
+        if not self.lock.suporta_rebaixamento:
+            self.skipTest("política sem downgrade")
+        barreira = threading.Barrier(3)
+        maximo = []
+
+        def leitor():
+            with self.lock.read():
+                barreira.wait(timeout=2)
+                maximo.append(self.lock.leitores_ativos)
+
+        self.lock.acquire_write()
+        threads = [threading.Thread(target=leitor) for _ in range(2)]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        self.lock.downgrade()
+        barreira.wait(timeout=2)  # falha se os leitores não entrarem
+        self.lock.release_read()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(max(maximo), 3)
+
+
+class TestRWLockPreferenciaEscritores(TestRWLock):
+    """Mesmos testes para a política de preferência para escritores"""
+
+    def setUp(self):
+        self.lock = RWLockPreferenciaEscritores()
+
+    def test_leitor_novo_espera_escritor_pendente(self):
+        """Leitor que chega com escritor aguardando só entra depois da escrita"""
+        eventos = []
+
+        def escritor():
+            with self.lock.write():
+                eventos.append('escrita')
+
+        def leitor():
+            with self.lock.read():
+                eventos.append('leitura_nova')
+
+        self.lock.acquire_read()
+        t_escritor = threading.Thread(target=escritor)
+        t_escritor.start()
+        time.sleep(0.1)  # Escritor fica pendente
+        t_leitor = threading.Thread(target=leitor)
+        t_leitor.start()
+        time.sleep(0.1)
+        self.lock.release_read()
+        t_escritor.join()
+        t_leitor.join()
+
+        self.assertEqual(eventos, ['escrita', 'leitura_nova'])
+
+    def test_criar_rwlock(self):
+        """Fábrica retorna a classe da política"""
+        self.assertIsInstance(criar_rwlock('escritores'), RWLockPreferenciaEscritores)
+        with self.assertRaises(ValueError):
+            criar_rwlock('inexistente')
+
+
+class TestRWLockJusto(TestRWLock):
+    """Mesmos testes para a trava justa (FIFO)"""
+
+    def setUp(self):
+        self.lock = RWLockJusto()
+
+    def test_ordem_fifo(self):
+        """Escritor e leitores são atendidos na ordem de chegada"""
+        eventos = []
+
+        def escritor():
+            with self.lock.write():
+                eventos.append('escrita')
+
+        def leitor(id):
+            with self.lock.read():
+                eventos.append(f'leitura_{id}')
+
+        self.lock.acquire_read()
+        threads = [threading.Thread(target=escritor)]
+        threads += [threading.Thread(target=leitor, args=(i,)) for i in range(2)]
+        for t in threads:
+            t.start()
+            time.sleep(0.05)  # Garantir ordem de chegada
+        self.lock.release_read()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(eventos[0], 'escrita')
+        self.assertEqual(sorted(eventos[1:]), ['leitura_0', 'leitura_1'])
+
+
+class TestRWLockCondicao(TestRWLock):
+    """Mesmos testes para a trava baseada em Condition"""
+
+    def setUp(self):
+        self.lock = RWLockCondicao()
+
+    def test_leitores_entram_juntos_apos_escrita(self):
+        """Leitores retidos pelo escritor entram juntos quando ele sai"""
+        maximo = []
+        barreira = threading.Barrier(3)
+
+        def leitor():
+            with self.lock.read():
+                barreira.wait(timeout=2)
+                maximo.append(self.lock.leitores_ativos)
+
+        self.lock.acquire_write()
+        threads = [threading.Thread(target=leitor) for _ in range(3)]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        self.assertEqual(self.lock.leitores_ativos, 0)
+        self.lock.release_write()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(max(maximo), 3)
+
+
+    def test_atualizador_convive_com_leitores(self):
+        """Leitura atualizável não bloqueia leitores comuns"""
+        self.lock.acquire_upgradable()
+        self.assertEqual(self.lock.try_acquire_read(timeout=0.5), 1)
+        self.lock.release_read()
+        self.lock.release_upgradable()
+
+    def test_apenas_um_atualizador(self):
+        """Um segundo atualizador e escritores esperam o primeiro"""
+        self.lock.acquire_upgradable()
+        self.assertFalse(self.lock.try_acquire_upgradable(timeout=0.1))
+        self.assertFalse(self.lock.try_acquire_write(timeout=0.1))
+        self.lock.release_upgradable()
+        self.assertTrue(self.lock.try_acquire_write(timeout=1))
+        self.lock.release_write()
+
+    def test_upgrade_espera_leitores(self):
+        """upgrade() espera os leitores atuais e retém os novos"""
+        eventos = []
+
+        def leitor_existente():
+            eventos.append('leitura_inicio')
+            time.sleep(0.2)
+            eventos.append('leitura_fim')
+            self.lock.release_read()
+
+        self.lock.acquire_read()
+        self.lock.acquire_upgradable()
+        t = threading.Thread(target=leitor_existente)
+        t.start()
+        self.lock.upgrade()
+        eventos.append('escrita')
+        self.assertEqual(self.lock.try_acquire_read(timeout=0.1), 0)
+        self.lock.release_write()
+        t.join()
+
+        self.assertEqual(eventos, ['leitura_inicio', 'leitura_fim', 'escrita'])
+
+    def test_read_modify_write_sem_perdas(self):
+        """Atualizadores com upgrade não perdem incrementos"""
+        estado = {'valor': 0}
+
+        def atualizador():
+            for _ in range(50):
+                with self.lock.upgradable() as atualizacao:
+                    valor = estado['valor']
+                    atualizacao.upgrade()
+                    estado['valor'] = valor + 1
+
+        threads = [threading.Thread(target=atualizador) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(estado['valor'], 200)
+        self.assertTrue(self.lock.try_acquire_write(timeout=0))
+        self.lock.release_write()
+
+    def test_upgradable_promove_e_rebaixa(self):
+        """Promoção seguida de rebaixamento: o bloco sai como leitor"""
+        with self.lock.upgradable() as atualizacao:
+            atualizacao.upgrade()
+            self.assertEqual(atualizacao.downgrade(), 1)
+            self.assertFalse(self.lock.try_acquire_write(timeout=0))
+            self.assertTrue(self.lock.try_acquire_read(timeout=0))  # leitores convivem
+            self.lock.release_read()
+        self.assertTrue(self.lock.try_acquire_write(timeout=0))
+        self.lock.release_write()
+
+    def test_upgradable_rebaixar_sem_promover(self):
+        """downgrade() sem upgrade() é recusado e o bloco solta a leitura atualizável"""
+        with self.assertRaises(RuntimeError):
+            with self.lock.upgradable() as atualizacao:
+                atualizacao.downgrade()
+        self.assertTrue(self.lock.try_acquire_write(timeout=0))
+        self.lock.release_write()
+
+
+class TestRWLockOtimista(TestRWLockCondicao):
+    """Mesmos testes para a trava com leitura otimista"""
+
+    def setUp(self):
+        self.lock = RWLockOtimista()
+
+    def test_carimbo(self):
+        """Carimbo vale sem escritor e é invalidado por uma escrita"""
+        carimbo = self.lock.try_optimistic_read()
+        self.assertIsNotNone(carimbo)
+        self.assertTrue(self.lock.validate(carimbo))
+        with self.lock.write():
+            self.assertIsNone(self.lock.try_optimistic_read())
+        self.assertFalse(self.lock.validate(carimbo))
+        self.assertTrue(self.lock.validate(self.lock.try_optimistic_read()))
+
+    def test_leitura_otimista_consistente(self):
+        """Leituras validadas nunca veem uma escrita pela metade"""
+        estado = {'a': 0, 'b': 0}
+        parar = threading.Event()
+        inconsistentes = []
+        validadas = []
+
+        def escritor():
+            while not parar.is_set():
+                with self.lock.write():
+                    estado['a'] += 1
+                    time.sleep(0)
+                    estado['b'] += 1
+                time.sleep(0.001)  # Sem isso o escritor monopoliza a trava
+
+        def leitor():
+            for _ in range(2000):
+                carimbo = self.lock.try_optimistic_read()
+                a, b = estado['a'], estado['b']
+                if self.lock.validate(carimbo):
+                    validadas.append(1)
+                    if a != b:
+                        inconsistentes.append((a, b))
+                else:
+                    with self.lock.read():
+                        self.assertEqual(estado['a'], estado['b'])
+
+        t = threading.Thread(target=escritor)
+        t.start()
+        leitores = [threading.Thread(target=leitor) for _ in range(3)]
+        for l in leitores:
+            l.start()
+        for l in leitores:
+            l.join()
+        parar.set()
+        t.join()
+
+        self.assertEqual(inconsistentes, [])
+        self.assertGreater(len(validadas), 0)
+
+
+class TestRWLockAdaptativa(TestRWLockCondicao):
+    """Mesmos testes da RWLockCondicao, e contagem do caminho rápido"""
+
+    def setUp(self):
+        self.lock = RWLockAdaptativa()
+
+    def test_sem_disputa_usa_caminho_rapido(self):
+        """Leituras e escritas sem disputa não passam pelo protocolo completo"""
+        for _ in range(10):
+            with self.lock.read():
+                pass
+            with self.lock.write():
+                pass
+        self.assertEqual((self.lock.rapidas, self.lock.lentas), (20, 0))
+        self.assertEqual(self.lock.taxa_rapida(), 1.0)
+
+    def test_disputa_usa_caminho_lento(self):
+        """Com a escrita ocupada, leitor e escritor seguem o protocolo completo"""
+        self.lock.acquire_write()
+        self.assertEqual(self.lock.try_acquire_read(timeout=0.05), 0)
+        self.assertFalse(self.lock.try_acquire_write(timeout=0.05))
+        self.lock.release_write()
+        self.assertEqual((self.lock.rapidas, self.lock.lentas), (1, 2))
+
+
+class TestCaminhoRapidoSemaforos(unittest.TestCase):
+    """Caminho rápido da política padrão (RWLock por semáforos)"""
+
+    def setUp(self):
+        self.lock = RWLock()
+
+    def test_leituras_sem_disputa(self):
+        """Leitores sem escritor entram sem o protocolo bloqueante"""
+        self.assertEqual(self.lock.acquire_read(), 1)
+        self.assertEqual(self.lock.acquire_read(), 2)
+        self.lock.release_read()
+        self.lock.release_read()
+        self.assertEqual((self.lock.rapidas, self.lock.lentas), (2, 0))
+        self.assertTrue(self.lock.try_acquire_write(timeout=0))  # wrt liberado pelo último
+        self.lock.release_write()
+
+    def test_leitor_com_escritor_segue_protocolo(self):
+        """Com a escrita ocupada, o leitor espera em wrt pelo caminho lento"""
+        self.lock.acquire_write()
+        resultado = []
+        t = threading.Thread(target=lambda: resultado.append(self.lock.acquire_read()))
+        t.start()
+        time.sleep(0.1)
+        self.assertEqual(resultado, [])
+        self.lock.release_write()
+        t.join()
+        self.lock.release_read()
+        self.assertEqual(resultado, [1])
+        self.assertEqual((self.lock.rapidas, self.lock.lentas), (0, 1))
+
+
+class TestRWLockSlots(TestRWLock):
+    """Mesmos testes para a trava com slots por thread"""
+
+    def setUp(self):
+        self.lock = RWLockSlots()
+
+    def test_contagem_leitores(self):
+        """acquire/release de leitura só tocam o slot; a contagem fica em leitores_ativos"""
+        self.assertFalse(self.lock.conta_leitores)
+        self.assertEqual(self.lock.acquire_read(), 1)
+        self.assertEqual(self.lock.acquire_read(), 1)
+        self.assertEqual(self.lock.leitores_ativos, 2)
+        self.assertEqual(self.lock.release_read(), 1)
+        self.assertEqual(self.lock.release_read(), 0)
+        self.assertEqual(self.lock.leitores_ativos, 0)
+
+    def test_slot_por_thread(self):
+        """Cada thread leitora registra um único slot, descartado quando ela termina"""
+        barreira = threading.Barrier(5)
+
+        def leitor():
+            for _ in range(3):
+                with self.lock.read():
+                    pass
+            barreira.wait(timeout=2)  # Threads vivas: slots registrados
+            barreira.wait(timeout=2)
+
+        threads = [threading.Thread(target=leitor) for _ in range(4)]
+        for t in threads:
+            t.start()
+        barreira.wait(timeout=2)
+        self.assertEqual(len(self.lock.slots), 4)
+        barreira.wait(timeout=2)
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(self.lock.slots), 0)
+        self.assertEqual(self.lock.leitores_ativos, 0)
+        with self.lock.write():
+            pass
+
+    def test_leitor_novo_espera_escritor_pendente(self):
+        """Com a flag do escritor levantada, novos leitores esperam a escrita"""
+        eventos = []
+
+        def escritor():
+            with self.lock.write():
+                eventos.append('escrita')
+
+        def leitor():
+            with self.lock.read():
+                eventos.append('leitura_nova')
+
+        self.lock.acquire_read()
+        t_escritor = threading.Thread(target=escritor)
+        t_escritor.start()
+        time.sleep(0.1)  # Escritor levanta a flag e espera o slot zerar
+        t_leitor = threading.Thread(target=leitor)
+        t_leitor.start()
+        time.sleep(0.1)
+        self.lock.release_read()
+        t_escritor.join()
+        t_leitor.join()
+
+        self.assertEqual(eventos, ['escrita', 'leitura_nova'])
+
+
+class TestRWLockPrioridade(TestRWLock):
+    """Mesmos testes para a trava com classes de prioridade"""
+
+    def setUp(self):
+        self.lock = RWLockPrioridade(envelhecimento=100.0)
+
+    def _escritor(self, classe, eventos):
+        """Thread escritora da classe informada; registra a entrada em eventos"""
+        def escritor():
+            self.lock.definir_prioridade(classe)
+            with self.lock.write():
+                eventos.append(classe)
+        t = threading.Thread(target=escritor)
+        t.start()
+        time.sleep(0.1)  # Garante a ordem de chegada
+        return t
+
+    def test_classe_alta_passa_a_frente(self):
+        """Escritor 'alta' entra antes de um 'normal' que chegou primeiro"""
+        eventos = []
+        self.lock.acquire_write()
+        threads = [self._escritor('normal', eventos), self._escritor('alta', eventos)]
+        self.lock.release_write()
+        for t in threads:
+            t.join()
+        self.assertEqual(eventos, ['alta', 'normal'])
+
+    def test_escritor_alta_barra_leitores_novos(self):
+        """Com escritor 'alta' aguardando, leitores 'normal' novos esperam"""
+        eventos = []
+        self.lock.acquire_read()
+        t = self._escritor('alta', eventos)
+        self.assertEqual(self._em_outra_thread(lambda: self.lock.try_acquire_read(timeout=0.1)), 0)
+        self.lock.release_read()
+        t.join()
+        self.assertEqual(eventos, ['alta'])
+
+    def test_envelhecimento_evita_starvation(self):
+        """Escritor 'baixa' que espera há tempo suficiente vence um 'alta' recém-chegado"""
+        self.lock.envelhecimento = 0.05
+        eventos = []
+        self.lock.acquire_write()
+        t_baixa = self._escritor('baixa', eventos)
+        time.sleep(0.1)  # 'baixa' já subiu mais de duas classes
+        t_alta = self._escritor('alta', eventos)
+        self.lock.release_write()
+        t_baixa.join()
+        t_alta.join()
+        self.assertEqual(eventos, ['baixa', 'alta'])
+
+    def test_classe_invalida(self):
+        """Classe desconhecida gera ValueError"""
+        with self.assertRaises(ValueError):
+            self.lock.definir_prioridade('urgente')
+
+    def _em_outra_thread(self, funcao):
+        """Executa funcao em outra thread e retorna seu resultado"""
+        resultado = []
+        t = threading.Thread(target=lambda: resultado.append(funcao()))
+        t.start()
+        t.join()
+        return resultado[0]
+
+
+class TestRWLockReentrante(TestRWLock):
+    """Mesmos testes para a trava reentrante (threads distintas não reentram)"""
+
+    def setUp(self):
+        self.lock = RWLockReentrante()
+
+    def _em_outra_thread(self, funcao):
+        """Executa funcao em outra thread e retorna seu resultado"""
+        resultado = []
+        t = threading.Thread(target=lambda: resultado.append(funcao()))
+        t.start()
+        t.join()
+        return resultado[0]
+
+    def test_contagem_leitores(self):
+        """Leitores de threads distintas contam; reentrada não muda o total"""
+        self.assertEqual(self.lock.acquire_read(), 1)
+        self.assertEqual(self.lock.acquire_read(), 1)
+        self.assertEqual(self._em_outra_thread(
+            lambda: (self.lock.acquire_read(), self.lock.release_read())), (2, 1))
+        self.assertEqual(self.lock.release_read(), 1)
+        self.assertEqual(self.lock.release_read(), 0)
+
+    def test_try_acquire_write_timeout(self):
+        """Escritor de outra thread desiste se há leitor ativo"""
+        self.lock.acquire_read()
+        self.assertFalse(self._em_outra_thread(lambda: self.lock.try_acquire_write(timeout=0.1)))
+        self.lock.release_read()
+        self.assertTrue(self.lock.try_acquire_write(timeout=1))
+        self.lock.release_write()
+
+    def test_try_acquire_read_timeout(self):
+        """Leitor de outra thread desiste se há escritor ativo"""
+        self.lock.acquire_write()
+        self.assertFalse(self._em_outra_thread(lambda: self.lock.try_acquire_read(timeout=0.1)))
+        self.assertEqual(self.lock.leitores_ativos, 0)
+        self.lock.release_write()
+        self.assertEqual(self.lock.try_acquire_read(timeout=1), 1)
+        self.lock.release_read()
+
+    def test_leitura_aninhada_com_escritor_na_fila(self):
+        """Leitura aninhada não fica presa atrás de um escritor aguardando"""
+        eventos = []
+
+        def escrever():
+            with self.lock.write():
+                eventos.append('escrita')
+
+        self.lock.acquire_read()
+        escritor = threading.Thread(target=escrever)
+        escritor.start()
+        time.sleep(0.1)  # Escritor fecha o portão dos leitores
+        self.assertTrue(self.lock.try_acquire_read(timeout=0.5))
+        eventos.append('leitura_aninhada')
+        self.lock.release_read()
+        self.lock.release_read()
+        escritor.join()
+
+        self.assertEqual(eventos, ['leitura_aninhada', 'escrita'])
+
+    def test_promocao_implicita_gera_erro(self):
+        """Pedir escrita segurando só leitura é erro, não deadlock"""
+        with self.lock.read():
+            with self.assertRaises(ErroReentrada):
+                self.lock.acquire_write()
+        self.assertTrue(self.lock.try_acquire_write(timeout=1))
+        self.lock.release_write()
+
+    def test_escrita_aninhada_e_leitura_dentro_da_escrita(self):
+        """A thread escritora pode reentrar na escrita e ler dentro dela"""
+        with self.lock.write():
+            with self.lock.write():
+                with self.lock.read():
+                    pass
+            self.assertFalse(self._em_outra_thread(lambda: self.lock.try_acquire_read(timeout=0.1)))
+        self.assertEqual(self._em_outra_thread(lambda: self.lock.try_acquire_read(timeout=1)), 1)
+
+    def test_saida_sem_posse_gera_erro(self):
+        """release sem acquire correspondente na thread"""
+        with self.assertRaises(ErroReentrada):
+            self.lock.release_read()
+        with self.assertRaises(ErroReentrada):
+            self.lock.release_write()
+
+    def test_rebaixamento_ao_sair_da_escrita(self):
+        """Com trava interna que suporta downgrade, a leitura aberta sobrevive à escrita"""
+        self.lock = criar_rwlock('condicao', reentrante=True)
+        self.lock.acquire_write()
+        self.lock.acquire_read()
+        self.lock.release_write()
+        self.assertEqual(self._em_outra_thread(lambda: self.lock.try_acquire_read(timeout=1)), 2)
+        self.assertFalse(self._em_outra_thread(lambda: self.lock.try_acquire_write(timeout=0.1)))
+        self.lock.release_read()
+
+
+class TestRWLockArrendamento(TestRWLock):
+    """Mesmos testes para a trava com arrendamento, e revogação de escritas"""
+
+    def setUp(self):
+        self.lock = RWLockArrendamento(RWLock(), duracao_maxima=5.0)
+
+    def tearDown(self):
+        self.lock.fechar()
+
+    def _escritor_travado(self, segurar):
+        """Thread que obtém a escrita e a segura por `segurar` segundos"""
+        resultado = {}
+
+        def escritor():
+            resultado['token'] = self.lock.acquire_write()
+            time.sleep(segurar)
+            resultado['valida'] = self.lock.validar()
+            resultado['escreveu'] = self.lock.executar_cercado(lambda: None)
+            resultado['liberou'] = self.lock.release_write()
+
+        t = threading.Thread(target=escritor)
+        t.start()
+        return t, resultado
+
+    def test_revogacao_libera_outros_escritores(self):
+        """Escritor travado perde a posse no prazo e não libera a do sucessor"""
+        self.lock.duracao_maxima = 0.1
+        t, resultado = self._escritor_travado(0.5)
+        time.sleep(0.05)
+        self.lock.duracao_maxima = 5.0  # só o arrendamento do escritor travado é curto
+        token = self.lock.try_acquire_write(timeout=2)
+        self.assertGreater(token, resultado['token'])  # fencing token crescente
+        t.join()
+        self.assertFalse(resultado['valida'])
+        self.assertFalse(resultado['escreveu'])
+        self.assertFalse(resultado['liberou'])
+        self.assertTrue(self.lock.validar(token))
+        self.assertEqual(self.lock.try_acquire_read(timeout=0.05), 0)  # sucessor ainda escreve
+        self.assertTrue(self.lock.release_write())
+        metricas = self.lock.metricas()
+        self.assertEqual(metricas['revogacoes'], 1)
+        self.assertEqual(metricas['escritas_recusadas'], 1)
+
+    def test_quase_expiracao(self):
+        """Liberação perto do prazo conta como quase expiração"""
+        self.lock.duracao_maxima = 0.3
+        self.lock.margem_alerta = 0.5
+        t, resultado = self._escritor_travado(0.2)
+        t.join()
+        self.assertTrue(resultado['escreveu'])
+        self.assertTrue(resultado['liberou'])
+        metricas = self.lock.metricas()
+        self.assertEqual(metricas['quase_expiracoes'], 1)
+        self.assertEqual(metricas['revogacoes'], 0)
+
+    def test_criar_rwlock(self):
+        """criar_rwlock envolve a política; reentrante não aceita arrendamento"""
+        lock = criar_rwlock('condicao', arrendamento=1.0)
+        self.assertIsInstance(lock, RWLockArrendamento)
+        self.assertIsInstance(lock.trava, RWLockCondicao)
+        with self.assertRaises(ValueError):
+            criar_rwlock('leitores', reentrante=True, arrendamento=1.0)
+
+
+class TestSeqLock(unittest.TestCase):
+    """Testes do sequence lock"""
+
+    def setUp(self):
+        self.seqlock = SeqLock()
+
+    def test_leitura_sem_escritor(self):
+        """Sem escritor, a leitura vale na primeira tentativa"""
+        sequencia = self.seqlock.read_begin()
+        self.assertFalse(self.seqlock.read_retry(sequencia))
+        self.assertEqual((self.seqlock.leituras, self.seqlock.releituras), (1, 0))
+
+    def test_escrita_forca_releitura(self):
+        """Escrita entre início e validação obriga a repetir a leitura"""
+        sequencia = self.seqlock.read_begin()
+        with self.seqlock.write():
+            self.assertIsNone(self.seqlock.read_begin(timeout=0.1))
+            self.assertFalse(self.seqlock.try_acquire_write(timeout=0.1))
+        self.assertTrue(self.seqlock.read_retry(sequencia))
+        self.assertEqual(self.seqlock.releituras, 1)
+
+    def test_contagem_entre_threads(self):
+        """Leituras de muitas threads não se perdem: cada uma conta na sua contagem"""
+        def ler():
+            for _ in range(2000):
+                self.seqlock.read_retry(self.seqlock.read_begin())
+
+        threads = [threading.Thread(target=ler) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self.seqlock.leituras, 8 * 2000)
+        self.assertEqual(len(self.seqlock.contagens), 8)
+
+    def test_leitura_consistente(self):
+        """read() nunca retorna uma escrita pela metade"""
+        estado = {'a': 0, 'b': 0}
+        parar = threading.Event()
+        inconsistentes = []
+
+        def escritor():
+            while not parar.is_set():
+                with self.seqlock.write():
+                    estado['a'] += 1
+                    time.sleep(0)
+                    estado['b'] += 1
+                time.sleep(0.001)
+
+        def leitor():
+            for _ in range(2000):
+                a, b = self.seqlock.read(lambda: (estado['a'], estado['b']))
+                if a != b:
+                    inconsistentes.append((a, b))
+
+        t = threading.Thread(target=escritor)
+        t.start()
+        leitores = [threading.Thread(target=leitor) for _ in range(3)]
+        for l in leitores:
+            l.start()
+        for l in leitores:
+            l.join()
+        parar.set()
+        t.join()
+
+        self.assertEqual(inconsistentes, [])
+        self.assertEqual(self.seqlock.sequencia % 2, 0)
+
+
+class TestRCU(unittest.TestCase):
+    """Testes do recurso copy-on-write (RCU)"""
+
+    def setUp(self):
+        self.rcu = RCU(10)
+
+    def test_publicacao(self):
+        """Leitor mantém sua versão enquanto o escritor publica outra"""
+        versao = self.rcu.ler()
+        nova = self.rcu.atualizar(lambda valor: valor + 1)
+        self.assertEqual((versao.numero, versao.valor), (0, 10))
+        self.assertEqual((nova.numero, nova.valor), (1, 11))
+        self.assertIs(self.rcu.ler(), nova)
+        with self.assertRaises(AttributeError):
+            versao.valor = 99
+
+    def test_versoes_vivas(self):
+        """Versões antigas contam até o último leitor soltá-las"""
+        retida = self.rcu.ler()
+        self.rcu.atualizar(lambda valor: valor + 1)
+        self.rcu.atualizar(lambda valor: valor + 1)
+        self.assertEqual(self.rcu.versoes_vivas(), 2)  # atual + retida
+        del retida
+        self.assertEqual(self.rcu.versoes_vivas(), 1)
+        self.assertEqual(self.rcu.max_versoes_vivas, 2)
+
+    def test_leitor_nao_espera_escritor(self):
+        """Leitura é imediata mesmo com a escrita adquirida"""
+        self.assertTrue(self.rcu.try_acquire_write(timeout=0))
+        self.assertFalse(self.rcu.try_acquire_write(timeout=0.1))
+        inicio = time.monotonic()
+        self.assertEqual(self.rcu.ler().valor, 10)
+        self.assertLess(time.monotonic() - inicio, 0.05)
+        self.rcu.release_write()
+
+
+class TestMetricas(unittest.TestCase):
+    """Testes das métricas de espera"""
+
+    def test_percentil(self):
+        """Percentil nearest-rank"""
+        valores = list(range(1, 101))
+        self.assertEqual(percentil(valores, 99), 99)
+        self.assertEqual(percentil(valores, 100), 100)
+        self.assertEqual(percentil([], 99), 0.0)
+
+
+class TestBenchmark(unittest.TestCase):
+    """Testes do benchmark de políticas"""
+
+    def test_benchmark(self):
+        """Benchmark mede todas as combinações de política e threads"""
+        resultados = executar_benchmark(['leitores', 'slots'], [1, 4], operacoes=200)
+        self.assertEqual(set(resultados), {'leitores', 'slots'})
+        self.assertTrue(all(vazao > 0 for por_threads in resultados.values()
+                            for vazao in por_threads.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Testes da trava de arquivo (fcntl) e do benchmark de latência
+"""
+import unittest
+import multiprocessing
+import tempfile
+import sys
+import os
+
+# Adicionar o diretório atual ao path para importar o módulo
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import test_rwlock
+from rwlock_arquivo import RWLockArquivo
+from benchmark_rwlock import executar_latencias
+
+
+def segurar_trava(caminho, modo, obtida, liberar):
+    """Outro programa: obtém a trava do arquivo e a mantém até `liberar`"""
+    lock = RWLockArquivo(caminho)
+    entrar, sair = (lock.acquire_read, lock.release_read) if modo == 'leitura' else \
+        (lock.acquire_write, lock.release_write)
+    entrar()
+    obtida.set()
+    liberar.wait(10)
+    sair()
+    lock.fechar()
+
+
+class TestRWLockArquivo(test_rwlock.TestRWLock):
+    """Mesmos testes da RWLock (threads de um processo) e coordenação entre processos"""
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, 'trava')
+        self.lock = RWLockArquivo(self.caminho)
+
+    def tearDown(self):
+        self.lock.fechar()
+        self.diretorio.cleanup()
+
+    def _outro_processo(self, modo):
+        """Inicia um processo que segura a trava; retorna (processo, evento de liberação)"""
+        contexto = multiprocessing.get_context('spawn')
+        obtida, liberar = contexto.Event(), contexto.Event()
+        processo = contexto.Process(target=segurar_trava, args=(self.caminho, modo, obtida, liberar))
+        processo.start()
+        self.assertTrue(obtida.wait(30))
+        return processo, liberar
+
+    def test_escritor_externo_bloqueia(self):
+        """Escrita em outro processo impede leitura e escrita aqui"""
+        processo, liberar = self._outro_processo('escrita')
+        self.assertEqual(self.lock.try_acquire_read(timeout=0.1), 0)
+        self.assertFalse(self.lock.try_acquire_write(timeout=0.1))
+        self.assertEqual(self.lock.leitores_ativos, 0)
+        liberar.set()
+        processo.join()
+        self.assertEqual(self.lock.try_acquire_read(timeout=5), 1)
+        self.lock.release_read()
+
+    def test_leitores_entre_processos(self):
+        """Leitura em outro processo admite leitores e barra escritores"""
+        processo, liberar = self._outro_processo('leitura')
+        self.assertEqual(self.lock.try_acquire_read(timeout=0.1), 1)
+        self.lock.release_read()
+        self.assertFalse(self.lock.try_acquire_write(timeout=0.1))
+        liberar.set()
+        processo.join()
+        self.assertTrue(self.lock.try_acquire_write(timeout=5))
+        self.lock.release_write()
+
+    def test_latencia(self):
+        """O benchmark mede as duas travas"""
+        resultados = executar_latencias(operacoes=100)
+        self.assertEqual(set(resultados), {'semaforos', 'arquivo'})
+        for latencias in resultados.values():
+            self.assertGreater(latencias['leitura'], 0)
+            self.assertGreater(latencias['escrita'], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Testes da trava assíncrona e do motor de corrotinas
+"""
+import unittest
+import asyncio
+import sys
+import os
+
+# Adicionar o diretório atual ao path para importar o módulo
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from rwlock_async import RWLockAsync, POLITICAS_ASYNC
+from motor_async import simular
+from configuracoes import get_config
+
+
+class TestRWLockAsync(unittest.IsolatedAsyncioTestCase):
+    """Testes unitários da RWLockAsync"""
+
+    async def asyncSetUp(self):
+        self.lock = RWLockAsync()
+
+    async def test_leitores_simultaneos(self):
+        """Várias corrotinas leem ao mesmo tempo"""
+        maximo = []
+
+        async def leitor():
+            async with self.lock.read():
+                await asyncio.sleep(0.05)
+                maximo.append(self.lock.leitores_ativos)
+
+        await asyncio.gather(*(leitor() for _ in range(5)))
+        self.assertEqual(max(maximo), 5)
+
+    async def test_escritor_espera_leitor(self):
+        """Escritor só entra depois que o leitor sai"""
+        eventos = []
+
+        async def escritor():
+            async with self.lock.write():
+                eventos.append('escrita')
+
+        await self.lock.acquire_read()
+        tarefa = asyncio.create_task(escritor())
+        await asyncio.sleep(0.05)
+        eventos.append('fim_leitura')
+        await self.lock.release_read()
+        await tarefa
+
+        self.assertEqual(eventos, ['fim_leitura', 'escrita'])
+
+    async def test_exclusao_escritores(self):
+        """Escritores nunca se sobrepõem"""
+        contador = {'ativos': 0, 'maximo': 0}
+
+        async def escritor():
+            for _ in range(10):
+                async with self.lock.write():
+                    contador['ativos'] += 1
+                    contador['maximo'] = max(contador['maximo'], contador['ativos'])
+                    await asyncio.sleep(0)
+                    contador['ativos'] -= 1
+
+        await asyncio.gather(*(escritor() for _ in range(4)))
+        self.assertEqual(contador['maximo'], 1)
+
+    async def test_timeout_escritor_libera_leitores(self):
+        """Escritor que desiste não deixa leitores retidos"""
+        await self.lock.acquire_read()
+        self.assertFalse(await self.lock.try_acquire_write(timeout=0.05))
+        self.assertEqual(self.lock.escritores_aguardando, 0)
+        self.assertEqual(await self.lock.try_acquire_read(timeout=0.5), 2)
+        await self.lock.release_read()
+        await self.lock.release_read()
+        self.assertTrue(await self.lock.try_acquire_write(timeout=0.5))
+        await self.lock.release_write()
+
+
+class TestPoliticasAsync(unittest.IsolatedAsyncioTestCase):
+    """Regras de admissão de cada política"""
+
+    async def ordem_de_entrada(self, politica):
+        """Leitor ativo, escritor aguardando e um segundo leitor: ordem em que entram"""
+        lock = RWLockAsync(politica)
+        eventos = []
+
+        async def escritor():
+            async with lock.write():
+                eventos.append('escritor')
+
+        async def leitor():
+            async with lock.read():
+                eventos.append('leitor')
+
+        await lock.acquire_read()
+        tarefas = [asyncio.create_task(escritor())]
+        await asyncio.sleep(0.02)
+        tarefas.append(asyncio.create_task(leitor()))
+        await asyncio.sleep(0.02)
+        eventos.append('fim_primeiro')
+        await lock.release_read()
+        await asyncio.gather(*tarefas)
+        return eventos
+
+    async def test_preferencia_leitores(self):
+        self.assertEqual(await self.ordem_de_entrada('leitores'), ['leitor', 'fim_primeiro', 'escritor'])
+
+    async def test_preferencia_escritores(self):
+        for politica in ('escritores', 'condicao'):
+            self.assertEqual(await self.ordem_de_entrada(politica),
+                             ['fim_primeiro', 'escritor', 'leitor'])
+
+    async def test_justa(self):
+        """Fila por chegada: o leitor atrás do escritor espera"""
+        self.assertEqual(await self.ordem_de_entrada('justa'), ['fim_primeiro', 'escritor', 'leitor'])
+
+    async def test_justa_desistente_nao_trava_fila(self):
+        """Ticket de quem desistiu é pulado"""
+        lock = RWLockAsync('justa')
+        await lock.acquire_read()
+        self.assertFalse(await lock.try_acquire_write(timeout=0.05))
+        self.assertEqual(await lock.try_acquire_read(timeout=0.5), 2)
+        await lock.release_read()
+        await lock.release_read()
+        self.assertTrue(await lock.try_acquire_write(timeout=0.5))
+        await lock.release_write()
+
+    def test_politica_sem_versao_assincrona(self):
+        for politica in ('otimista', 'slots', 'prioridade', 'inexistente'):
+            with self.assertRaises(ValueError):
+                RWLockAsync(politica)
+
+
+class TestMotorAsync(unittest.TestCase):
+    """Testes do motor de simulação com corrotinas"""
+
+    def test_milhares_de_atores(self):
+        """Milhares de atores em um único event loop, travas livres ao final"""
+        config = get_config('muitos_leitores')
+        config.update(num_leitores=3000, num_escritores=50)
+        resultado = simular(config, duracao=1.0, escala_tempo=0.1, semente=0)
+        self.assertEqual(resultado['atores'], 3050)
+        self.assertGreater(resultado['leituras'], 0)
+        self.assertEqual(resultado['total'], resultado['escritas'])
+        self.assertTrue(resultado['travas_livres'])
+
+    def test_politica_da_configuracao(self):
+        """A política vem da configuração; as sem versão assíncrona são recusadas"""
+        config = get_config('muitos_leitores_justa')
+        resultado = simular(config, duracao=0.5, escala_tempo=0.05, semente=0)
+        self.assertEqual(resultado['total'], resultado['escritas'])
+        config['politica'] = 'otimista'
+        with self.assertRaises(ValueError):
+            simular(config, duracao=0.5, escala_tempo=0.05, semente=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
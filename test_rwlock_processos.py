@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Testes da trava entre processos e do motor com processos
+"""
+import unittest
+import multiprocessing
+import sys
+import os
+
+# Adicionar o diretório atual ao path para importar o módulo
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from rwlock_processos import RWLockProcessos, InteirosCompartilhados
+from motor_processos import simular
+from configuracoes import get_config
+
+
+def incrementar(lock, dados, vezes):
+    """Escritor em outro processo"""
+    for _ in range(vezes):
+        with lock.write():
+            dados[0] += 1
+
+
+def contar_leitores(lock, fila):
+    """Lê o contador compartilhado em outro processo"""
+    fila.put(lock.leitores_ativos)
+
+
+class TestRWLockProcessos(unittest.TestCase):
+    """Testes unitários da RWLockProcessos"""
+
+    def setUp(self):
+        self.contexto = multiprocessing.get_context()
+        self.lock = RWLockProcessos(self.contexto)
+        self.dados = InteirosCompartilhados(1)
+
+    def tearDown(self):
+        self.lock.fechar()
+        self.dados.fechar()
+
+    def test_exclusao_entre_processos(self):
+        """Escritores em processos diferentes não perdem incrementos"""
+        processos = [self.contexto.Process(target=incrementar, args=(self.lock, self.dados, 50))
+                     for _ in range(4)]
+        for p in processos:
+            p.start()
+        for p in processos:
+            p.join()
+        self.assertEqual(self.dados[0], 200)
+
+    def test_contador_compartilhado(self):
+        """Leitor registrado no pai é visto pelo filho (fork e spawn)"""
+        for metodo in ('fork', 'spawn'):
+            contexto = multiprocessing.get_context(metodo)
+            lock = RWLockProcessos(contexto)
+            self.assertEqual(lock.acquire_read(), 1)
+            fila = contexto.Queue()
+            p = contexto.Process(target=contar_leitores, args=(lock, fila))
+            p.start()
+            self.assertEqual(fila.get(timeout=30), 1)
+            p.join()
+            self.assertEqual(lock.release_read(), 0)
+            lock.fechar()
+
+
+class TestMotorProcessos(unittest.TestCase):
+    """Testes do motor com processos"""
+
+    def test_simular(self):
+        """Processos e threads produzem métricas consistentes"""
+        config = get_config('padrao')
+        for motor in ('processos', 'threads'):
+            resultado = simular(config, duracao=0.5, escala_tempo=0.05, semente=0,
+                                motor=motor, trabalho=1000)
+            self.assertGreater(resultado['leituras'], 0)
+            self.assertEqual(resultado['total'], resultado['escritas'])
+            self.assertEqual(resultado['leitores_ativos_final'], 0)
+            self.assertEqual(resultado['leituras_inconsistentes'], 0)
+
+    def test_particoes_e_politica(self):
+        """Uma trava por partição; a política da configuração vale nas threads"""
+        config = get_config('particionado')
+        config['politica'] = 'justa'
+        resultado = simular(config, duracao=0.5, escala_tempo=0.05, semente=0, motor='threads')
+        self.assertEqual(resultado['num_shards'], 8)
+        self.assertEqual(resultado['total'], resultado['escritas'])
+        self.assertEqual(resultado['leituras_inconsistentes'], 0)
+
+    def test_processos_so_preferencia_leitores(self):
+        """RWLockProcessos não reproduz outras políticas: recusa em vez de ignorar"""
+        config = get_config('muitos_leitores_justa')
+        with self.assertRaises(ValueError):
+            simular(config, duracao=0.5, escala_tempo=0.05, semente=0, motor='processos')
+
+
+if __name__ == "__main__":
+    unittest.main()
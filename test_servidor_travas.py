@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do servidor de travas, do cliente com pipeline e da trava remota
+"""
+import unittest
+import multiprocessing
+import tempfile
+import threading
+import time
+import sys
+import os
+
+# Adicionar o diretório atual ao path para importar o módulo
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from servidor_travas import ServidorTravas, ClienteTravas, TravaRemota, executar_benchmark
+from rwlock import RWLockJusto
+from rwlock_processos import InteirosCompartilhados
+from motor_processos import simular
+from configuracoes import get_config
+
+
+def incrementar(lock, dados, vezes):
+    """Escritor em outro processo (um nó)"""
+    for _ in range(vezes):
+        with lock.write():
+            valor = dados[0]
+            time.sleep(0.001)
+            dados[0] = valor + 1
+    lock.fechar()
+
+
+class TestServidorTravas(unittest.TestCase):
+    """Protocolo do servidor via TCP"""
+
+    def setUp(self):
+        self.servidor = ServidorTravas().iniciar()
+        self.clientes = []
+
+    def tearDown(self):
+        for cliente in self.clientes:
+            cliente.fechar()
+        self.servidor.parar()
+
+    def conectar(self, lote=1):
+        cliente = ClienteTravas(self.servidor.endereco, lote)
+        self.clientes.append(cliente)
+        return cliente
+
+    def test_leitores_compartilham(self):
+        """Leitores de conexões diferentes entram juntos"""
+        a, b = self.conectar(), self.conectar()
+        self.assertEqual(a.pedir('R', 'x').result(5), 1)
+        self.assertEqual(b.pedir('R', 'x').result(5), 2)
+
+    def test_escritor_exclusivo(self):
+        """Escritor barra leitores e escritores de outras conexões até liberar"""
+        a, b = self.conectar(), self.conectar()
+        self.assertEqual(a.pedir('W', 'x').result(5), 1)
+        self.assertEqual(b.pedir('R', 'x', timeout=0.1).result(5), 0)
+        self.assertEqual(b.pedir('W', 'x', timeout=0.1).result(5), 0)
+        a.liberar('w', 'x')
+        self.assertEqual(b.pedir('R', 'x', timeout=5).result(5), 1)
+
+    def test_travas_nomeadas_independentes(self):
+        """Nomes diferentes são travas diferentes"""
+        a, b = self.conectar(), self.conectar()
+        self.assertEqual(a.pedir('W', 'x').result(5), 1)
+        self.assertEqual(b.pedir('W', 'y', timeout=0.1).result(5), 1)
+
+    def test_pipeline(self):
+        """Vários pedidos seguem sem esperar respostas e chegam em ordem"""
+        cliente = self.conectar()
+        futuros = [cliente.pedir('R', 'x') for _ in range(10)]
+        self.assertEqual([f.result(5) for f in futuros], list(range(1, 11)))
+
+    def test_lote_de_liberacoes(self):
+        """Liberações acumuladas seguem em um único envio"""
+        cliente = self.conectar(lote=8)
+        futuros = [cliente.pedir('R', 'x') for _ in range(8)]
+        for futuro in futuros:
+            futuro.result(5)
+        envios = cliente.envios
+        for _ in range(7):
+            cliente.liberar('r', 'x')
+        self.assertEqual(cliente.envios, envios)  # ainda acumuladas
+        # O próximo pedido leva as liberações junto, no mesmo envio
+        self.assertEqual(cliente.pedir('?', 'x').result(5), 1)
+        self.assertEqual(cliente.envios, envios + 1)
+        for _ in range(7):
+            cliente.pedir('R', 'x').result(5)
+        envios = cliente.envios
+        for _ in range(8):
+            cliente.liberar('r', 'x')  # lote completo: enviado sozinho
+        self.assertEqual(cliente.envios, envios + 1)
+        self.assertEqual(cliente.pedir('?', 'x').result(5), 0)
+
+    def test_desconexao_libera(self):
+        """Conexão encerrada devolve as travas que mantinha"""
+        a, b = self.conectar(), self.conectar()
+        self.assertEqual(a.pedir('W', 'x').result(5), 1)
+        self.clientes.remove(a)
+        a.fechar()
+        self.assertEqual(b.pedir('W', 'x', timeout=5).result(5), 1)
+
+    def test_liberacao_sem_posse_ignorada(self):
+        """Liberação de trava que a conexão não mantém não corrompe a contagem"""
+        with ServidorTravas(politica='condicao') as servidor:
+            a = ClienteTravas(servidor.endereco)
+            b = ClienteTravas(servidor.endereco)
+            try:
+                self.assertEqual(a.pedir('R', 'x').result(5), 1)
+                b.liberar('r', 'x')  # b não é leitor
+                b.liberar('w', 'x')
+                self.assertEqual(b.pedir('?', 'x').result(5), 1)
+                a.liberar('r', 'x')
+                a.liberar('r', 'x')  # segunda saída do mesmo leitor
+                self.assertEqual(a.pedir('?', 'x').result(5), 0)
+                self.assertEqual(servidor.trava('x').leitores_ativos, 0)
+                self.assertEqual(b.pedir('W', 'x', timeout=1).result(5), 1)
+            finally:
+                a.fechar()
+                b.fechar()
+
+    def test_benchmark(self):
+        """Pipeline e lotes reduzem os envios por operação"""
+        resultados = executar_benchmark(operacoes=200, modos=((1, 1), (16, 16)))
+        self.assertAlmostEqual(resultados[1, 1]['envios_por_operacao'], 2.0, delta=0.01)
+        self.assertLess(resultados[16, 16]['envios_por_operacao'], 1.2)
+
+
+class TestTravaRemota(unittest.TestCase):
+    """Trava remota compartilhada por processos, via socket Unix"""
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.servidor = ServidorTravas(os.path.join(self.diretorio.name, 'travas.sock')).iniciar()
+        self.lock = TravaRemota(self.servidor.endereco)
+
+    def tearDown(self):
+        self.lock.fechar()
+        self.servidor.parar()
+        self.diretorio.cleanup()
+
+    def test_interface(self):
+        """Mesma interface das demais travas, com timeout"""
+        self.assertEqual(self.lock.acquire_read(), 1)
+        self.assertFalse(self.lock.try_acquire_write(timeout=0.1))
+        self.lock.release_read()
+        with self.lock.write():
+            self.assertEqual(self.lock.try_acquire_read(timeout=0), 0)
+        self.assertEqual(self.lock.leitores_ativos, 0)
+
+    def test_exclusao_entre_processos(self):
+        """Escritores em processos diferentes não perdem incrementos"""
+        contexto = multiprocessing.get_context('spawn')
+        dados = InteirosCompartilhados(1)
+        try:
+            processos = [contexto.Process(target=incrementar, args=(self.lock, dados, 20))
+                         for _ in range(3)]
+            for p in processos:
+                p.start()
+            for p in processos:
+                p.join()
+            self.assertEqual(dados[0], 60)
+        finally:
+            dados.fechar()
+
+    def test_motor_remoto(self):
+        """Motor de processos com a trava do servidor"""
+        config = get_config('muitos_leitores_justa')
+        config.update(num_leitores=3, num_escritores=2, num_shards=2)
+        resultado = simular(config, duracao=1.0, escala_tempo=0.05, semente=0, motor='remoto')
+        self.assertGreater(resultado['leituras'], 0)
+        self.assertEqual(resultado['total'], resultado['escritas'])
+        self.assertEqual(resultado['leituras_inconsistentes'], 0)
+
+    def test_espera_no_servidor_mantem_a_vez(self):
+        """Espera cancelável é um só pedido: na política justa o escritor mantém seu ticket"""
+        with ServidorTravas(politica='justa') as servidor:
+            dono, escritor, leitor = (TravaRemota(servidor.endereco, 'x') for _ in range(3))
+            try:
+                dono.acquire_write()
+                obtidas = []
+                esperando = threading.Thread(
+                    target=lambda: obtidas.append(escritor.try_acquire_write(cancelar=lambda: False)))
+                esperando.start()
+                time.sleep(0.3)  # vários INTERVALO_CANCELAMENTO
+                trava = servidor.trava('x')
+                self.assertEqual(trava.proximo_ticket, 2)
+                self.assertEqual(leitor.try_acquire_read(timeout=0.1, cancelar=lambda: False), 0)
+                dono.release_write()
+                esperando.join(5)
+                self.assertEqual(obtidas, [True])
+                escritor.release_write()
+                self.assertEqual(leitor.try_acquire_read(timeout=5, cancelar=lambda: False), 1)
+                leitor.release_read()
+            finally:
+                for lock in (dono, escritor, leitor):
+                    lock.fechar()
+
+    def test_cancelamento_no_servidor(self):
+        """Cancelar abandona a espera no servidor, que não segura a fila"""
+        with ServidorTravas(politica='justa') as servidor:
+            dono, escritor = TravaRemota(servidor.endereco, 'x'), TravaRemota(servidor.endereco, 'x')
+            try:
+                dono.acquire_write()
+                parada = threading.Event()
+                threading.Timer(0.2, parada.set).start()
+                inicio = time.monotonic()
+                self.assertFalse(escritor.try_acquire_write(cancelar=parada.is_set))
+                self.assertLess(time.monotonic() - inicio, 1.0)
+                dono.release_write()
+                self.assertTrue(dono.try_acquire_write(timeout=1))
+                dono.release_write()
+            finally:
+                dono.fechar()
+                escritor.fechar()
+
+    def test_politica_do_servidor(self):
+        """O servidor cria as travas com a política pedida"""
+        with ServidorTravas(politica='justa') as servidor:
+            self.assertIsInstance(servidor.trava('x'), RWLockJusto)
+        with self.assertRaises(ValueError):
+            ServidorTravas(politica='inexistente')
+
+
+if __name__ == "__main__":
+    unittest.main()
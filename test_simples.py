@@ -12,24 +12,27 @@ import os
 # Adicionar o diretório atual ao path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from rwlock import RWLock
+
 class LeitoresEscritoresTestSimples:
     """Classe simplificada para testes"""
     
     def __init__(self):
         self.dados = 0
-        self.mutex = threading.Semaphore(1)
-        self.wrt = threading.Semaphore(1)
-        self.leitores_ativos = 0
+        self.lock = RWLock()
         self.log = []
         self.log_lock = threading.Lock()
+    
+    @property
+    def leitores_ativos(self):
+        """Número de leitores ativos na trava"""
+        return self.lock.leitores_ativos
         
     def reset(self):
         """Reset para novo teste"""
         self.dados = 0
-        self.leitores_ativos = 0
         self.log = []
-        self.mutex = threading.Semaphore(1)
-        self.wrt = threading.Semaphore(1)
+        self.lock = RWLock()
         
     def log_evento(self, evento):
         """Log thread-safe"""
@@ -42,11 +45,7 @@ class LeitoresEscritoresTestSimples:
     
     def leitor(self, id):
         """Leitor simplificado"""
-        self.mutex.acquire()
-        self.leitores_ativos += 1
-        if self.leitores_ativos == 1:
-            self.wrt.acquire()
-        self.mutex.release()
+        self.lock.acquire_read()
         
         # Leitura
         self.log_evento(f"LEITOR_{id}_INICIO")
@@ -54,15 +53,11 @@ class LeitoresEscritoresTestSimples:
         valor = self.dados
         self.log_evento(f"LEITOR_{id}_FIM_VALOR_{valor}")
         
-        self.mutex.acquire()
-        self.leitores_ativos -= 1
-        if self.leitores_ativos == 0:
-            self.wrt.release()
-        self.mutex.release()
+        self.lock.release_read()
     
     def escritor(self, id):
         """Escritor simplificado"""
-        self.wrt.acquire()
+        self.lock.acquire_write()
         
         self.log_evento(f"ESCRITOR_{id}_INICIO")
         time.sleep(0.01)
@@ -70,7 +65,7 @@ class LeitoresEscritoresTestSimples:
         self.dados += 1
         self.log_evento(f"ESCRITOR_{id}_FIM_{old_value}_PARA_{self.dados}")
         
-        self.wrt.release()
+        self.lock.release_write()
 
 class TestLeitoresEscritoresSimples(unittest.TestCase):
     """Testes unitários simplificados"""
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Testes da execução sem interface gráfica
+"""
+import unittest
+import contextlib
+import io
+import json
+import math
+import tempfile
+import sys
+import os
+
+# Adicionar o diretório atual ao path para importar o módulo
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from simular import carregar_config, executar, main, _sem_infinitos
+from configuracoes import get_config
+
+
+class TestCarregarConfig(unittest.TestCase):
+    """Configurações pré-definidas, arquivos e texto JSON"""
+
+    def test_nome_predefinido(self):
+        self.assertEqual(carregar_config('stress'), get_config('stress'))
+
+    def test_json_sobre_base(self):
+        """Campos ausentes vêm da base indicada"""
+        config = carregar_config('{"base": "stress", "num_shards": 4}')
+        esperado = get_config('stress')
+        esperado['num_shards'] = 4
+        self.assertEqual(config, esperado)
+
+    def test_arquivo_json(self):
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, 'cenario.json')
+            with open(caminho, 'w', encoding='utf-8') as arquivo:
+                json.dump({'num_leitores': 12}, arquivo)
+            config = carregar_config(caminho)
+        self.assertEqual(config['num_leitores'], 12)
+        self.assertEqual(config['num_escritores'], get_config('padrao')['num_escritores'])
+
+    def test_erros(self):
+        for origem in ('inexistente', '{"campo_errado": 1}', '{"base": "nada"}', '[1, 2]',
+                       '{"politica": "nenhuma"}'):
+            with self.assertRaises(ValueError, msg=origem):
+                carregar_config(origem)
+
+    def test_valores_invalidos(self):
+        """Contagens negativas, tempos não positivos e min > max são recusados"""
+        for origem in ('{"num_leitores": -1}', '{"num_escritores": 1.5}', '{"num_shards": 0}',
+                       '{"leitores_em_lote": -2}', '{"duracao_teste": 0}',
+                       '{"tempo_leitura_min": 0}', '{"delay_escritor_max": -1}',
+                       '{"tempo_escrita_min": 2, "tempo_escrita_max": 1}',
+                       '{"delay_leitor_min": "rapido"}'):
+            with self.subTest(origem=origem), self.assertRaises(ValueError):
+                carregar_config(origem)
+        # Limites aceitos: nenhum ator e min igual a max
+        config = carregar_config('{"num_leitores": 0, "tempo_leitura_min": 0.5, "tempo_leitura_max": 0.5}')
+        self.assertEqual(config['num_leitores'], 0)
+
+    def test_duracao_invalida_na_linha_de_comando(self):
+        for argumentos in (['--duracao', '0'], ['--escala-tempo', '-1']):
+            with self.subTest(argumentos=argumentos), self.assertRaises(SystemExit), \
+                    contextlib.redirect_stderr(io.StringIO()):
+                main(argumentos)
+
+
+class TestExecutar(unittest.TestCase):
+    """Execução e saída em JSON"""
+
+    def test_motor_eventos(self):
+        resultado = executar(get_config('padrao'), duracao=600, semente=0)
+        self.assertEqual(resultado['motor'], 'eventos')
+        self.assertEqual(resultado['total'], resultado['escritas'])
+        json.dumps(resultado)
+
+    def test_previsao_junto_do_medido(self):
+        """A previsão analítica acompanha as métricas medidas"""
+        resultado = executar(get_config('muitos_leitores_justa'), duracao=3600, semente=0)
+        previsao = resultado['previsao']
+        self.assertAlmostEqual(previsao['escritas_por_s'], resultado['escritas_por_s'], delta=0.1)
+        self.assertAlmostEqual(previsao['espera_escritor'], resultado['espera_escritor']['media'],
+                               delta=0.05)
+
+    def test_motor_threads(self):
+        resultado = executar(get_config('padrao'), 'threads', duracao=0.3, escala_tempo=0.02, semente=0)
+        self.assertGreater(resultado['leituras'], 0)
+        self.assertEqual(resultado['total'], resultado['escritas'])
+
+    def test_motor_desconhecido(self):
+        with self.assertRaises(ValueError):
+            executar(get_config('padrao'), 'inexistente')
+
+    def test_politica_sem_suporte_no_motor(self):
+        """O motor recusa a política antes de simular, em vez de relatar outra"""
+        config = get_config('prioridade')
+        for motor in ('async', 'processos'):
+            with self.subTest(motor=motor), self.assertRaises(ValueError):
+                executar(config, motor, duracao=0.1)
+
+    def test_inanicao_vira_null(self):
+        """Esperas infinitas (inanição) saem como null em JSON válido"""
+        resultado = _sem_infinitos({'previsao': {'espera_leitor': math.inf}, 'lista': [1.0, math.nan]})
+        self.assertEqual(resultado, {'previsao': {'espera_leitor': None}, 'lista': [1.0, None]})
+        self.assertEqual(json.loads(json.dumps(resultado, allow_nan=False)), resultado)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Testes da varredura de parâmetros
+"""
+import unittest
+from unittest import mock
+import csv
+import tempfile
+import sys
+import os
+
+# Adicionar o diretório atual ao path para importar o módulo
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from varredura import grade, aplicar, varrer, linhas_tabela, salvar_csv, METRICAS
+from simular import executar
+from configuracoes import get_config
+
+
+class TestGrade(unittest.TestCase):
+    """Montagem dos pontos da varredura"""
+
+    def test_produto_cartesiano(self):
+        pontos = grade({'num_leitores': [1, 2, 3], 'politica': ['leitores', 'justa']})
+        self.assertEqual(len(pontos), 6)
+        self.assertEqual(pontos[0], {'num_leitores': 1, 'politica': 'leitores'})
+        self.assertEqual(pontos[-1], {'num_leitores': 3, 'politica': 'justa'})
+
+    def test_aplicar_intervalo(self):
+        """Intervalos viram os campos _min e _max"""
+        base = get_config('padrao')
+        config = aplicar(base, {'delay_leitor': (0.1, 0.2), 'num_escritores': 7})
+        self.assertEqual((config['delay_leitor_min'], config['delay_leitor_max']), (0.1, 0.2))
+        self.assertEqual(config['num_escritores'], 7)
+        self.assertEqual(base, get_config('padrao'))  # base intacta
+
+    def test_parametro_desconhecido(self):
+        with self.assertRaises(ValueError):
+            aplicar(get_config('padrao'), {'inexistente': 1})
+
+
+class TestVarrer(unittest.TestCase):
+    """Execução no pool de processos"""
+
+    def test_resultados_na_ordem_da_grade(self):
+        parametros = {'num_leitores': [1, 8], 'politica': ['leitores', 'justa']}
+        resultados = varrer(get_config('padrao'), parametros, duracao=300, semente=3, processos=2)
+        self.assertEqual([ponto for ponto, _ in resultados], grade(parametros))
+        # Mesmo resultado que a execução direta do ponto
+        ponto, resultado = resultados[3]
+        direto = executar(aplicar(get_config('padrao'), ponto), duracao=300, semente=3)
+        self.assertEqual(resultado['escritas'], direto['escritas'])
+        self.assertEqual(resultado['config']['num_leitores'], 8)
+
+    def test_tabela_e_csv(self):
+        resultados = varrer(get_config('padrao'), {'num_escritores': [1, 2]}, duracao=60, processos=1)
+        cabecalho, linhas = linhas_tabela(resultados)
+        self.assertEqual(len(cabecalho), 1 + len(METRICAS))
+        self.assertEqual([linha[0] for linha in linhas], ['1', '2'])
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, 'varredura.csv')
+            salvar_csv(resultados, caminho)
+            with open(caminho, newline='', encoding='utf-8') as arquivo:
+                self.assertEqual(list(csv.reader(arquivo)), [cabecalho] + linhas)
+
+    def test_motor_desconhecido(self):
+        with self.assertRaises(ValueError):
+            varrer(get_config('padrao'), {'num_leitores': [1]}, motor='inexistente')
+
+    def test_politica_sem_suporte_antes_do_pool(self):
+        """Política que o motor não executa é recusada antes de iniciar o pool"""
+        parametros = {'politica': ['leitores', 'otimista']}
+        with mock.patch('varredura.ProcessPoolExecutor') as pool, self.assertRaises(ValueError):
+            varrer(get_config('padrao'), parametros, motor='async')
+        pool.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
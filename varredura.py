@@ -0,0 +1,163 @@
+"""
+Varredura de parâmetros em paralelo
+Monta a grade (produto cartesiano) de valores de parâmetros sobre uma
+configuração base, distribui as execuções por um ProcessPoolExecutor (um
+processo por núcleo) e agrega as métricas em uma tabela
+"""
+import argparse
+import csv
+import itertools
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from rwlock import POLITICAS
+from simular import MOTORES, carregar_config, executar, validar_execucao
+
+# Parâmetros de intervalo: um valor (mínimo, máximo) vira os campos _min e _max
+INTERVALOS = ['delay_leitor', 'delay_escritor', 'tempo_leitura', 'tempo_escrita']
+
+# Colunas de métricas da tabela: (título, função sobre o resultado)
+METRICAS = [
+    ('leituras/s', lambda r: r['leituras_por_s']),
+    ('escritas/s', lambda r: r['escritas_por_s']),
+    ('espera média L', lambda r: r['espera_leitor']['media']),
+    ('p99 leitor', lambda r: r['espera_leitor']['p99']),
+    ('p99 escritor', lambda r: r['espera_escritor']['p99']),
+    ('máx escritor', lambda r: r['espera_escritor']['maximo'])
+]
+
+
+def grade(parametros):
+    """Lista de pontos (dicionários) com todas as combinações dos valores
+
+    `parametros` associa cada parâmetro à lista de valores, por exemplo
+    {'num_leitores': [1, 4, 16], 'politica': ['leitores', 'justa']}.
+    """
+    nomes = list(parametros)
+    return [dict(zip(nomes, valores)) for valores in itertools.product(*parametros.values())]
+
+
+def aplicar(config, ponto):
+    """Cópia da configuração com os valores do ponto"""
+    config = config.copy()
+    for nome, valor in ponto.items():
+        if nome in INTERVALOS:
+            config[f'{nome}_min'], config[f'{nome}_max'] = valor
+        elif nome in config:
+            config[nome] = valor
+        else:
+            raise ValueError(f"Parâmetro desconhecido: {nome}")
+    return config
+
+
+def _executar_ponto(tarefa):
+    """Executa um ponto em um processo do pool"""
+    config, ponto, motor, duracao, escala_tempo, semente = tarefa
+    resultado = executar(aplicar(config, ponto), motor, duracao, escala_tempo, semente)
+    return ponto, resultado
+
+
+def varrer(config, parametros, motor='eventos', duracao=None, escala_tempo=1.0, semente=0,
+           processos=None):
+    """Executa todos os pontos da grade em paralelo; retorna [(ponto, resultado)] na ordem da grade
+
+    Todos os pontos usam a mesma semente, então as diferenças vêm dos
+    parâmetros e não do sorteio. `processos` limita o pool (padrão: um
+    por núcleo). Parâmetros desconhecidos e políticas que o motor não
+    executa geram ValueError antes de iniciar o pool.
+    """
+    pontos = grade(parametros)
+    for ponto in pontos:
+        validar_execucao(aplicar(config, ponto), motor)
+    tarefas = [(config, ponto, motor, duracao, escala_tempo, semente) for ponto in pontos]
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        return list(executor.map(_executar_ponto, tarefas))
+
+
+def _formatar(valor):
+    if isinstance(valor, float):
+        return f"{valor:.3f}"
+    if isinstance(valor, tuple):
+        return '-'.join(_formatar(v) for v in valor)
+    return str(valor)
+
+
+def linhas_tabela(resultados):
+    """Cabeçalho e linhas (listas de texto): parâmetros do ponto seguidos das métricas"""
+    if not resultados:
+        return [], []
+    nomes = list(resultados[0][0])
+    cabecalho = nomes + [titulo for titulo, _ in METRICAS]
+    linhas = [[_formatar(ponto[nome]) for nome in nomes] +
+              [_formatar(metrica(resultado)) for _, metrica in METRICAS]
+              for ponto, resultado in resultados]
+    return cabecalho, linhas
+
+
+def imprimir_tabela(resultados):
+    """Tabela de texto com uma linha por ponto"""
+    cabecalho, linhas = linhas_tabela(resultados)
+    larguras = [max(len(texto) for texto in coluna) for coluna in zip(cabecalho, *linhas)]
+    for linha in [cabecalho] + linhas:
+        print('  '.join(texto.rjust(largura) for texto, largura in zip(linha, larguras)))
+
+
+def salvar_csv(resultados, caminho):
+    """Grava a tabela em CSV"""
+    cabecalho, linhas = linhas_tabela(resultados)
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(cabecalho)
+        escritor.writerows(linhas)
+
+
+def _intervalo(texto):
+    """Converte 'min:max' em (min, max)"""
+    minimo, _, maximo = texto.partition(':')
+    return (float(minimo), float(maximo or minimo))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Varredura de parâmetros em paralelo")
+    parser.add_argument('--base', default='padrao',
+                        help="configuração base: nome pré-definido, arquivo .json ou objeto JSON")
+    parser.add_argument('--leitores', nargs='+', type=int, help="valores de num_leitores")
+    parser.add_argument('--escritores', nargs='+', type=int, help="valores de num_escritores")
+    parser.add_argument('--politicas', nargs='+', choices=list(POLITICAS))
+    parser.add_argument('--shards', nargs='+', type=int, help="valores de num_shards")
+    for nome in INTERVALOS:
+        parser.add_argument(f"--{nome.replace('_', '-')}", dest=nome, nargs='+', type=_intervalo,
+                            metavar='MIN:MAX')
+    parser.add_argument('--motor', default='eventos', choices=list(MOTORES.keys()))
+    parser.add_argument('--duracao', type=float, default=3600.0,
+                        help="segundos por ponto (virtuais no motor 'eventos')")
+    parser.add_argument('--escala-tempo', type=float, default=1.0)
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--processos', type=int, help="tamanho do pool (padrão: núcleos)")
+    parser.add_argument('--csv', help="grava a tabela também neste arquivo")
+    args = parser.parse_args()
+
+    opcoes = {'num_leitores': args.leitores, 'num_escritores': args.escritores,
+              'politica': args.politicas, 'num_shards': args.shards}
+    opcoes.update((nome, getattr(args, nome)) for nome in INTERVALOS)
+    parametros = {nome: valores for nome, valores in opcoes.items() if valores}
+    if not parametros:
+        parametros = {'num_leitores': [1, 2, 4, 8, 16], 'politica': ['leitores', 'escritores', 'justa']}
+    try:
+        config = carregar_config(args.base)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+
+    pontos = len(grade(parametros))
+    print(f"Varredura de {pontos} pontos sobre '{args.base}' (motor '{args.motor}')", file=sys.stderr)
+    try:
+        resultados = varrer(config, parametros, args.motor, args.duracao, args.escala_tempo,
+                            args.semente, args.processos)
+    except ValueError as e:
+        parser.error(str(e))
+    imprimir_tabela(resultados)
+    if args.csv:
+        salvar_csv(resultados, args.csv)
+
+
+if __name__ == "__main__":
+    main()